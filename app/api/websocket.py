@@ -1,17 +1,19 @@
 import asyncio
-import json
-from typing import Dict, Optional, Set
+from collections import OrderedDict, defaultdict
+from typing import DefaultDict, Dict, Optional, Set
 from uuid import UUID
 
+import orjson
 import structlog
 from fastapi import WebSocket, WebSocketDisconnect, Depends, Query
 from starlette.websockets import WebSocketState
 
-from app.api.schemas import SlideUpdateRequest, SlideAddRequest
+from app.api.schemas import Event, SlideUpdateRequest, SlideAddRequest
 from app.application.services import DeckService, SlideService
 from app.core.dependencies import get_deck_service, get_slide_service
 from app.core.observability import metrics
 from app.core.security import security_service
+from app.domain.entities import DeckEvent
 from app.domain.exceptions import UnauthorizedAccessException, DeckNotFoundException
 from app.infrastructure.messaging.redis_client import RedisPubSubManager
 
@@ -20,47 +22,159 @@ logger = structlog.get_logger(__name__)
 # Global connection manager
 connection_manager: Optional["WebSocketManager"] = None
 
+# Maximum number of sends gathered before yielding back to the event loop
+BROADCAST_BATCH_SIZE = 50
+
+# Events arriving within EVENT_BATCH_WINDOW seconds of each other share one
+# frame, up to EVENT_BATCH_MAX events per frame
+EVENT_BATCH_WINDOW = 0.002
+EVENT_BATCH_MAX = 100
+
+# Maximum number of stored events sent per replay frame
+REPLAY_BATCH_SIZE = 50
+
+# Encoded replay payloads kept by event ID; stored events never change, so
+# clients reconnecting to the same deck reuse earlier encodings
+REPLAY_CACHE_SIZE = 4096
+_replay_cache: "OrderedDict[int, bytes]" = OrderedDict()
+
+# Events buffered per deck while its clients are being sent to; beyond this
+# the oldest are dropped so a stalled socket cannot grow memory without bound
+DECK_QUEUE_MAXSIZE = 1024
+
+# Backoff between attempts to re-establish the shared deck subscription
+DISPATCHER_RETRY_DELAY = 0.5
+DISPATCHER_RETRY_MAX_DELAY = 30.0
+
+
+def _event_data(event: Event) -> Dict:
+    """Build the client-facing payload for a deck event.
+
+    UUID and datetime values are left for orjson, which writes the same
+    strings as str() and isoformat().
+    """
+    return {
+        "event_type": event.event_type,
+        "deck_id": event.deck_id,
+        "version": event.version,
+        "timestamp": event.timestamp,
+        "payload": event.payload,
+    }
+
+
+def _replay_data(event: DeckEvent) -> Dict:
+    """Build the client-facing payload for a stored deck event."""
+    return {
+        "event_type": event.event_type,
+        "deck_id": event.deck_id,
+        "version": event.version,
+        "timestamp": event.created_at,
+        "payload": event.payload,
+    }
+
+
+def _encoded_replay_data(event: DeckEvent) -> bytes:
+    """Encode a stored event's replay payload, reusing earlier encodings."""
+    if event.id is None:
+        return orjson.dumps(_replay_data(event))
+
+    encoded = _replay_cache.get(event.id)
+    if encoded is not None:
+        _replay_cache.move_to_end(event.id)
+        return encoded
+
+    encoded = orjson.dumps(_replay_data(event))
+    _replay_cache[event.id] = encoded
+    if len(_replay_cache) > REPLAY_CACHE_SIZE:
+        _replay_cache.popitem(last=False)
+    return encoded
+
+
+async def _stop_task(task: Optional[asyncio.Task]) -> None:
+    """Cancel a background task and wait for it to unwind.
+
+    The current task is only cancelled, never awaited; callers stopping the
+    current task must do so last. A cancellation aimed at the caller while it
+    waits is re-raised rather than mistaken for the task's own.
+    """
+    if task is None:
+        return
+    task.cancel()
+    current = asyncio.current_task()
+    if task is current:
+        return
+    try:
+        await task
+    except asyncio.CancelledError:
+        if current is not None and current.cancelling():
+            raise
+    except Exception:
+        pass
+
 
 class WebSocketManager:
     """Manages WebSocket connections and message broadcasting."""
 
     def __init__(self, redis_pubsub: RedisPubSubManager) -> None:
-        self.active_connections: Dict[UUID, Set[WebSocket]] = {}
+        self.active_connections: DefaultDict[UUID, Set[WebSocket]] = defaultdict(set)
         self.redis_pubsub = redis_pubsub
         self._consumers: Dict[UUID, asyncio.Task] = {}
+        # Strong references keep cancelled consumers alive until they finish
+        self._consumer_tasks: Set[asyncio.Task] = set()
+        # One pub/sub subscription for all decks, demultiplexed into deck queues
+        self._deck_queues: Dict[UUID, asyncio.Queue] = {}
+        self._dispatcher: Optional[asyncio.Task] = None
 
     async def connect(self, websocket: WebSocket, deck_id: UUID, user_id: str) -> None:
         """Accept WebSocket connection and start listening for events."""
         await websocket.accept()
 
-        if deck_id not in self.active_connections:
-            self.active_connections[deck_id] = set()
+        connections = self.active_connections[deck_id]
+        if not connections:
+            self._deck_queues[deck_id] = asyncio.Queue(maxsize=DECK_QUEUE_MAXSIZE)
             # Start Redis consumer for this deck
-            self._consumers[deck_id] = asyncio.create_task(
-                self._consume_deck_events(deck_id)
-            )
+            consumer = asyncio.create_task(self._consume_deck_events(deck_id))
+            self._consumers[deck_id] = consumer
+            self._consumer_tasks.add(consumer)
+            consumer.add_done_callback(self._consumer_tasks.discard)
+
+        # (Re)start the shared dispatcher if it isn't running
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch_deck_events())
 
-        self.active_connections[deck_id].add(websocket)
+        connections.add(websocket)
         metrics.record_websocket_connection(1)
 
         logger.info(
             "WebSocket connected",
             deck_id=str(deck_id),
             user_id=user_id,
-            connections=len(self.active_connections[deck_id]),
+            connections=len(connections),
         )
 
     async def disconnect(self, websocket: WebSocket, deck_id: UUID) -> None:
         """Handle WebSocket disconnection."""
-        if deck_id in self.active_connections:
-            self.active_connections[deck_id].discard(websocket)
-
-            # If no more connections for this deck, stop consumer
-            if not self.active_connections[deck_id]:
-                if deck_id in self._consumers:
-                    self._consumers[deck_id].cancel()
-                    del self._consumers[deck_id]
+        connections = self.active_connections.get(deck_id)
+        if connections is not None:
+            connections.discard(websocket)
+
+            # If no more connections for this deck, stop consumer. State is
+            # cleared before awaiting so a concurrent connect starts afresh.
+            if not connections:
                 del self.active_connections[deck_id]
+                self._deck_queues.pop(deck_id, None)
+                consumer = self._consumers.pop(deck_id, None)
+
+                # Drop the shared subscription once no deck is being watched
+                dispatcher = None
+                if not self.active_connections:
+                    dispatcher, self._dispatcher = self._dispatcher, None
+
+                # A failed broadcast disconnects from inside the consumer, and
+                # _stop_task only cancels the current task; stop it last so no
+                # later await here absorbs its cancellation
+                await _stop_task(dispatcher)
+                await _stop_task(consumer)
 
         metrics.record_websocket_connection(-1)
         logger.info("WebSocket disconnected", deck_id=str(deck_id))
@@ -71,53 +185,130 @@ class WebSocketManager:
             await websocket.send_text(message)
 
     async def broadcast_to_deck(self, deck_id: UUID, message: str) -> None:
-        """Broadcast message to all connections for a deck."""
-        if deck_id in self.active_connections:
-            connections_to_remove = set()
-
-            for websocket in self.active_connections[deck_id].copy():
-                try:
-                    if websocket.client_state == WebSocketState.CONNECTED:
-                        await websocket.send_text(message)
-                    else:
-                        connections_to_remove.add(websocket)
-                except Exception as e:
-                    logger.warning("Failed to send message to WebSocket", error=str(e))
-                    connections_to_remove.add(websocket)
-
-            # Clean up disconnected connections
-            for websocket in connections_to_remove:
-                await self.disconnect(websocket, deck_id)
+        """Broadcast message to all connections for a deck.
+
+        The message is serialised once by the caller and the same object is
+        handed to every connection, so fan-out never copies or re-encodes it.
+        """
+        connections = self.active_connections.get(deck_id)
+        if not connections:
+            return
+
+        targets = []
+        connections_to_remove = []
+        for websocket in list(connections):
+            if websocket.client_state == WebSocketState.CONNECTED:
+                targets.append(websocket)
+            else:
+                connections_to_remove.append(websocket)
+
+        # Send to every client concurrently; one slow socket must not delay the rest
+        results = []
+        for start in range(0, len(targets), BROADCAST_BATCH_SIZE):
+            if start:
+                # Yield between batches so a large fan-out doesn't starve the loop
+                await asyncio.sleep(0)
+            batch = targets[start : start + BROADCAST_BATCH_SIZE]
+            results.extend(
+                await asyncio.gather(
+                    *(websocket.send_text(message) for websocket in batch),
+                    return_exceptions=True,
+                )
+            )
+        for websocket, result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to send message to WebSocket", error=str(result))
+                connections_to_remove.append(websocket)
+
+        # Clean up disconnected connections
+        for websocket in connections_to_remove:
+            await self.disconnect(websocket, deck_id)
+
+    async def _dispatch_deck_events(self) -> None:
+        """Route events from the shared deck subscription to each deck's queue.
+
+        The pattern subscription delivers every deck's events to every API
+        instance, which parses and drops those for decks without local
+        clients. That costs some decoding for unwatched decks but keeps one
+        pub/sub connection per process regardless of how many decks are open.
+        The subscription is re-established with backoff if it fails or ends.
+        """
+        delay = DISPATCHER_RETRY_DELAY
+        while True:
+            try:
+                stream = self.redis_pubsub.subscribe_to_all_deck_channels()
+                if asyncio.iscoroutine(stream):
+                    stream = await stream
+                async for event in stream:
+                    delay = DISPATCHER_RETRY_DELAY
+                    queue = self._deck_queues.get(event.deck_id)
+                    if queue is None:
+                        continue
+                    if queue.full():
+                        queue.get_nowait()
+                        metrics.record_websocket_event_dropped()
+                        logger.warning(
+                            "Deck event queue full, dropping oldest event",
+                            deck_id=str(event.deck_id),
+                        )
+                    queue.put_nowait(event)
+
+                logger.warning("Deck event subscription ended, resubscribing")
+
+            except asyncio.CancelledError:
+                logger.info("Event dispatcher cancelled")
+                raise
+            except Exception as e:
+                logger.error("Event dispatcher error", error=str(e), retry_in=delay)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, DISPATCHER_RETRY_MAX_DELAY)
 
     async def _consume_deck_events(self, deck_id: UUID) -> None:
-        """Consume Redis events for a specific deck and broadcast to WebSocket clients."""
+        """Consume a deck's queued events and broadcast them to WebSocket clients."""
+        queue = self._deck_queues.get(deck_id)
+        if queue is None:
+            return
+
+        # Runs until disconnect() cancels it
         try:
-            stream = self.redis_pubsub.subscribe_to_deck_channel(deck_id)
-            if asyncio.iscoroutine(stream):
-                stream = await stream
-            async for event in stream:
-                message = {
-                    "type": "event",
-                    "data": {
-                        "event_type": event.event_type,
-                        "deck_id": str(event.deck_id),
-                        "version": event.version,
-                        "timestamp": event.timestamp.isoformat(),
-                        "payload": event.payload,
-                    },
-                }
-
-                await self.broadcast_to_deck(deck_id, json.dumps(message))
+            while True:
+                # Coalesce events that arrive together into a single frame
+                batch = [await queue.get()]
+                while len(batch) < EVENT_BATCH_MAX:
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(
+                                queue.get(), timeout=EVENT_BATCH_WINDOW
+                            )
+                        )
+                    except asyncio.TimeoutError:
+                        break
+
+                # No one left to send to (the last client is disconnecting)
+                if not self.active_connections.get(deck_id):
+                    continue
+
+                if len(batch) == 1:
+                    message = {"type": "event", "data": _event_data(batch[0])}
+                else:
+                    message = {
+                        "type": "event_batch",
+                        "data": [_event_data(event) for event in batch],
+                    }
+
+                await self.broadcast_to_deck(deck_id, orjson.dumps(message).decode())
 
                 logger.debug(
-                    "Event broadcasted to WebSocket clients",
+                    "Events broadcasted to WebSocket clients",
                     deck_id=str(deck_id),
-                    event_type=event.event_type,
+                    events=len(batch),
                     connections=len(self.active_connections.get(deck_id, [])),
                 )
 
         except asyncio.CancelledError:
             logger.info("Event consumer cancelled for deck", deck_id=str(deck_id))
+            raise
         except Exception as e:
             logger.error("Event consumer error", deck_id=str(deck_id), error=str(e))
 
@@ -189,20 +380,18 @@ async def _send_event_replay(
     try:
         events = await deck_service.get_deck_events(deck_id, user_id, from_version)
 
-        for event in events:
-            replay_message = {
-                "type": "replay",
-                "data": {
-                    "event_type": event.event_type,
-                    "deck_id": str(event.deck_id),
-                    "version": event.version,
-                    "timestamp": event.created_at.isoformat(),
-                    "payload": event.payload,
-                },
-            }
+        # Replay in chunks; a lone event keeps the single "replay" frame
+        for start in range(0, len(events), REPLAY_BATCH_SIZE):
+            chunk = events[start : start + REPLAY_BATCH_SIZE]
+            # Cached encodings are embedded as-is rather than re-serialised
+            data = [orjson.Fragment(_encoded_replay_data(event)) for event in chunk]
+            if len(data) == 1:
+                replay_message = {"type": "replay", "data": data[0]}
+            else:
+                replay_message = {"type": "replay_batch", "data": data}
 
             await connection_manager.send_personal_message(
-                json.dumps(replay_message), websocket
+                orjson.dumps(replay_message).decode(), websocket
             )
 
         # Send replay complete signal
@@ -211,7 +400,7 @@ async def _send_event_replay(
             "data": {"replayed_events": len(events)},
         }
         await connection_manager.send_personal_message(
-            json.dumps(complete_message), websocket
+            orjson.dumps(complete_message).decode(), websocket
         )
 
         logger.info(
@@ -228,7 +417,7 @@ async def _send_event_replay(
             "data": {"message": "Failed to replay events"},
         }
         await connection_manager.send_personal_message(
-            json.dumps(error_message), websocket
+            orjson.dumps(error_message).decode(), websocket
         )
 
 
@@ -242,7 +431,7 @@ async def _handle_client_message(
 ) -> None:
     """Handle incoming WebSocket messages from clients."""
     try:
-        message = json.loads(message_data)
+        message = orjson.loads(message_data)
         message_type = message.get("type")
         data = message.get("data", {})
 
@@ -257,7 +446,7 @@ async def _handle_client_message(
         else:
             await _send_error(websocket, f"Unknown message type: {message_type}")
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         await _send_error(websocket, "Invalid JSON message")
     except Exception as e:
         logger.error("Error handling client message", error=str(e))
@@ -279,7 +468,9 @@ async def _handle_slide_update(
             "type": "slide_update_queued",
             "data": {"slide_id": str(request.slide_id)},
         }
-        await connection_manager.send_personal_message(json.dumps(response), websocket)
+        await connection_manager.send_personal_message(
+            orjson.dumps(response).decode(), websocket
+        )
 
     except Exception as e:
         await _send_error(websocket, f"Failed to update slide: {str(e)}")
@@ -300,7 +491,9 @@ async def _handle_slide_addition(
         )
 
         response = {"type": "slide_add_queued", "data": {"position": request.position}}
-        await connection_manager.send_personal_message(json.dumps(response), websocket)
+        await connection_manager.send_personal_message(
+            orjson.dumps(response).decode(), websocket
+        )
 
     except Exception as e:
         await _send_error(websocket, f"Failed to add slide: {str(e)}")
@@ -310,14 +503,16 @@ async def _handle_ping(websocket: WebSocket) -> None:
     """Handle ping message."""
     pong_message = {
         "type": "pong",
-        "data": {"timestamp": asyncio.get_event_loop().time()},
+        "data": {"timestamp": asyncio.get_running_loop().time()},
     }
-    await connection_manager.send_personal_message(json.dumps(pong_message), websocket)
+    await connection_manager.send_personal_message(
+        orjson.dumps(pong_message).decode(), websocket
+    )
 
 
 async def _send_error(websocket: WebSocket, error_message: str) -> None:
     """Send error message to WebSocket client."""
     error_response = {"type": "error", "data": {"message": error_message}}
     await connection_manager.send_personal_message(
-        json.dumps(error_response), websocket
+        orjson.dumps(error_response).decode(), websocket
     )
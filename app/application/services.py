@@ -79,9 +79,10 @@ class DeckService:
                 await self._publish_event(event)
 
                 # Queue deck generation job
+                deck_id_str = str(deck.id)
                 await self.arq_redis.enqueue_job(
                     "generate_deck",
-                    deck_id=str(deck.id),
+                    deck_id=deck_id_str,
                     generation_params={
                         "title": request.title,
                         "topic": request.topic,
@@ -96,7 +97,7 @@ class DeckService:
                 duration = time.time() - start_time
                 logger.info(
                     "Deck creation started",
-                    deck_id=str(deck.id),
+                    deck_id=deck_id_str,
                     user_id=user_id,
                     duration=f"{duration:.2f}s",
                 )
@@ -27,6 +27,8 @@ class Settings(BaseSettings):
     )
     redis_stream_key: str = Field(default="deck_events")
     redis_pubsub_key: str = Field(default="deck_notifications")
+    redis_stream_maxlen: int = Field(default=100_000)
+    redis_max_connections: int = Field(default=64)
 
     # JWT Authentication
     jwt_secret_key: str = Field(
@@ -1,4 +1,5 @@
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import AsyncGenerator, Any
 
 from opentelemetry import trace
@@ -30,6 +31,11 @@ ACTIVE_CONNECTIONS = Gauge(
     "websocket_connections_active", "Number of active WebSocket connections"
 )
 
+WEBSOCKET_EVENTS_DROPPED = Counter(
+    "websocket_events_dropped_total",
+    "Deck events dropped because a deck's WebSocket queue was full",
+)
+
 DECK_GENERATION_DURATION = Histogram(
     "deck_generation_duration_seconds", "Deck generation duration in seconds"
 )
@@ -59,6 +65,19 @@ DATABASE_OPERATIONS = Counter(
 )
 
 
+@lru_cache(maxsize=1024)
+def _database_operation_counter(
+    operation: str, table: str, status: str, exception_type: str
+) -> Counter:
+    """Labelled database counter child, resolved once per label combination."""
+    return DATABASE_OPERATIONS.labels(
+        operation=operation,
+        table=table,
+        status=status,
+        exception_type=exception_type,
+    )
+
+
 def setup_observability() -> None:
     """Setup OpenTelemetry and Prometheus metrics."""
 
@@ -140,6 +159,11 @@ class MetricsCollector:
         """Record WebSocket connection change."""
         ACTIVE_CONNECTIONS.inc(delta)
 
+    @staticmethod
+    def record_websocket_event_dropped() -> None:
+        """Record a deck event dropped from a full WebSocket queue."""
+        WEBSOCKET_EVENTS_DROPPED.inc()
+
     @staticmethod
     def record_deck_generation(status: str, duration: float) -> None:
         """Record deck generation metrics."""
@@ -167,11 +191,8 @@ class MetricsCollector:
         operation: str, table: str, status: str, exception_type: str | None = None
     ) -> None:
         """Record database operation metrics."""
-        DATABASE_OPERATIONS.labels(
-            operation=operation,
-            table=table,
-            status=status,
-            exception_type=exception_type or "none",
+        _database_operation_counter(
+            operation, table, status, exception_type or "none"
         ).inc()
 
 
@@ -32,7 +32,9 @@ async def startup(ctx: Dict[str, Any]) -> None:
     ctx["database"] = database
 
     # Initialize Redis client
-    redis_client = RedisClient(settings.redis_url)
+    redis_client = RedisClient(
+        settings.redis_url, max_connections=settings.redis_max_connections
+    )
     await redis_client.initialize()
     ctx["redis_client"] = redis_client
 
@@ -1,26 +1,63 @@
 import asyncio
-import json
-from typing import Any, AsyncIterator, Dict, Optional, Callable
+from datetime import datetime
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Callable,
+    Tuple,
+    get_args,
+)
 from uuid import UUID
 
+import orjson
 import redis.asyncio as redis
 import structlog
 from redis.asyncio import Redis
 from redis.exceptions import RedisError
 
-from app.api.schemas import Event
+from app.api.schemas import Event, EventType
 from app.core.config import settings
 from app.core.observability import metrics
 from app.domain.exceptions import MessagingException
 
 logger = structlog.get_logger(__name__)
 
+_EVENT_TYPES = frozenset(get_args(EventType))
+
+
+def _checked_event_type(value: str) -> str:
+    """Return value if it is a known EventType, else raise ValueError.
+
+    Events are built with model_construct on the hot path, which skips the
+    Literal check, so it is enforced here instead.
+    """
+    if value not in _EVENT_TYPES:
+        raise ValueError(f"Unknown event_type: {value!r}")
+    return value
+
+
+@lru_cache(maxsize=4096)
+def _deck_channel(prefix: str, deck_id: UUID) -> str:
+    """Pub/sub channel name for a deck, cached per deck."""
+    return f"{prefix}:deck:{deck_id}"
+
+
+@lru_cache(maxsize=4096)
+def _cancel_key(deck_id: UUID) -> str:
+    """Cancellation flag key for a deck, cached per deck."""
+    return f"cancel:deck:{deck_id}"
+
 
 class RedisClient:
     """Redis client manager for connection pooling and operations."""
 
-    def __init__(self, redis_url: str) -> None:
+    def __init__(self, redis_url: str, max_connections: int = 64) -> None:
         self.redis_url = redis_url
+        self.max_connections = max_connections
         self.pool: Optional[redis.ConnectionPool] = None
         self.redis_client: Optional[Redis] = None
 
@@ -30,7 +67,7 @@ class RedisClient:
             self.pool = redis.ConnectionPool.from_url(
                 self.redis_url,
                 decode_responses=True,
-                max_connections=20,
+                max_connections=self.max_connections,
                 health_check_interval=30,
             )
             self.redis_client = Redis(connection_pool=self.pool)
@@ -91,23 +128,32 @@ class RedisStreamPublisher:
     def __init__(self, redis_client: RedisClient) -> None:
         self.redis_client = redis_client
         self.stream_key = settings.redis_stream_key
+        # Approximate MAXLEN trimming keeps the stream bounded at O(1) per add
+        self.maxlen = settings.redis_stream_maxlen
+
+    @staticmethod
+    def _serialize_event(event: Event) -> Dict[str, str]:
+        """Convert event to flat string fields for a stream entry."""
+        return {
+            "event_type": event.event_type,
+            "deck_id": str(event.deck_id),
+            "version": str(event.version),
+            "timestamp": event.timestamp.isoformat(),
+            "payload": orjson.dumps(event.payload).decode(),
+        }
 
     async def publish_event(self, event: Event) -> str:
         """Publish event to Redis Stream."""
         try:
             client = self.redis_client.get_client()
 
-            # Convert event to dict for Redis
-            event_data = {
-                "event_type": event.event_type,
-                "deck_id": str(event.deck_id),
-                "version": str(event.version),
-                "timestamp": event.timestamp.isoformat(),
-                "payload": json.dumps(event.payload),
-            }
-
             # Add to stream
-            stream_id = await client.xadd(self.stream_key, event_data)
+            stream_id = await client.xadd(
+                self.stream_key,
+                self._serialize_event(event),
+                maxlen=self.maxlen,
+                approximate=True,
+            )
 
             logger.info(
                 "Event published to stream",
@@ -124,6 +170,39 @@ class RedisStreamPublisher:
             metrics.record_redis_operation("stream_publish", "error")
             raise MessagingException(f"Stream publish failed: {e}")
 
+    async def publish_events(self, events: List[Event]) -> List[str]:
+        """Publish a batch of events to Redis Stream in one pipelined round trip."""
+        if not events:
+            return []
+
+        try:
+            client = self.redis_client.get_client()
+
+            async with client.pipeline(transaction=False) as pipe:
+                for event in events:
+                    pipe.xadd(
+                        self.stream_key,
+                        self._serialize_event(event),
+                        maxlen=self.maxlen,
+                        approximate=True,
+                    )
+                stream_ids = await pipe.execute()
+
+            logger.info(
+                "Events published to stream",
+                count=len(stream_ids),
+                first_stream_id=stream_ids[0],
+                last_stream_id=stream_ids[-1],
+            )
+
+            metrics.record_redis_operation("stream_publish_batch", "success")
+            return stream_ids
+
+        except RedisError as e:
+            logger.error("Failed to publish events to stream", error=str(e))
+            metrics.record_redis_operation("stream_publish_batch", "error")
+            raise MessagingException(f"Stream batch publish failed: {e}")
+
 
 class RedisStreamConsumer:
     """Consume events from Redis Stream using consumer groups."""
@@ -161,7 +240,6 @@ class RedisStreamConsumer:
     ) -> None:
         """Consume events from Redis Stream with consumer group."""
         await self.create_consumer_group()
-        client = self.redis_client.get_client()
 
         logger.info(
             "Starting event consumer",
@@ -169,58 +247,124 @@ class RedisStreamConsumer:
             consumer=self.consumer_name,
         )
 
+        # Messages delivered to this consumer earlier but never acknowledged
+        # (e.g. it stopped mid-batch) are handled again before new ones
+        pending_from: Optional[str] = "0"
         while True:
             try:
-                # Read from stream
-                messages = await client.xreadgroup(
-                    groupname=self.consumer_group,
-                    consumername=self.consumer_name,
-                    streams={self.stream_key: ">"},
-                    count=batch_size,
-                    block=block_ms,
-                )
-
-                if messages:
-                    for stream_name, stream_messages in messages:
-                        for message_id, fields in stream_messages:
-                            try:
-                                # Parse event
-                                event = self._parse_event(fields)
-
-                                # Process event
-                                await handler(event)
-
-                                # Acknowledge message
-                                await client.xack(
-                                    self.stream_key, self.consumer_group, message_id
-                                )
-
-                                metrics.record_redis_operation(
-                                    "stream_consume", "success"
-                                )
-
-                            except Exception as e:
-                                logger.error(
-                                    "Error processing stream message",
-                                    message_id=message_id,
-                                    error=str(e),
-                                )
-                                metrics.record_redis_operation(
-                                    "stream_consume", "error"
-                                )
+                if pending_from is not None:
+                    # Advance past every entry read, parsed or not, so a page
+                    # of discarded entries does not end the replay early
+                    pending_from, batch = await self._read_batch(
+                        count=batch_size, block_ms=block_ms, start_id=pending_from
+                    )
+                    if pending_from is None:
+                        continue
+                else:
+                    batch = await self.consume_batch(
+                        count=batch_size, block_ms=block_ms
+                    )
+
+                handled: List[str] = []
+                try:
+                    for message_id, event in batch:
+                        try:
+                            await handler(event)
+                            handled.append(message_id)
+                            metrics.record_redis_operation("stream_consume", "success")
+
+                        except Exception as e:
+                            logger.error(
+                                "Error processing stream message",
+                                message_id=message_id,
+                                error=str(e),
+                            )
+                            metrics.record_redis_operation("stream_consume", "error")
+                finally:
+                    # Acknowledge everything handled at once, even when cancelled
+                    await self.ack_batch(handled)
 
             except Exception as e:
                 logger.error("Stream consumer error", error=str(e))
                 await asyncio.sleep(5)  # Wait before retrying
 
+    async def consume_batch(
+        self, count: int = 64, block_ms: int = 1000, start_id: str = ">"
+    ) -> List[Tuple[str, Event]]:
+        """Read up to count messages for this consumer in one XREADGROUP.
+
+        With the default start_id of ">" new messages are read; any other ID
+        re-reads this consumer's own pending messages after it. Messages that
+        fail to parse, or were trimmed from the stream, are logged and acked
+        so they do not stay pending forever.
+        """
+        _, batch = await self._read_batch(count, block_ms, start_id)
+        return batch
+
+    async def _read_batch(
+        self, count: int, block_ms: int, start_id: str
+    ) -> Tuple[Optional[str], List[Tuple[str, Event]]]:
+        """Read a batch, returning the last message ID read alongside it.
+
+        The ID covers discarded entries too and is None when nothing was read.
+        """
+        client = self.redis_client.get_client()
+        messages = await client.xreadgroup(
+            groupname=self.consumer_group,
+            consumername=self.consumer_name,
+            streams={self.stream_key: start_id},
+            count=count,
+            block=block_ms,
+        )
+
+        last_id: Optional[str] = None
+        batch: List[Tuple[str, Event]] = []
+        discarded: List[str] = []
+        for _stream_name, stream_messages in messages or ():
+            for message_id, fields in stream_messages:
+                last_id = message_id
+                if not fields:
+                    # Pending entry whose data was trimmed (MAXLEN) or deleted
+                    logger.warning(
+                        "Discarding trimmed stream message", message_id=message_id
+                    )
+                    discarded.append(message_id)
+                    continue
+                try:
+                    batch.append((message_id, self._parse_event(fields)))
+                except Exception as e:
+                    logger.error(
+                        "Discarding unparsable stream message",
+                        message_id=message_id,
+                        fields=fields,
+                        error=str(e),
+                    )
+                    metrics.record_redis_operation("stream_consume", "error")
+                    discarded.append(message_id)
+
+        await self.ack_batch(discarded)
+        return last_id, batch
+
+    async def ack_batch(self, message_ids: List[str]) -> int:
+        """Acknowledge a batch of messages with a single XACK."""
+        if not message_ids:
+            return 0
+        client = self.redis_client.get_client()
+        return await client.xack(self.stream_key, self.consumer_group, *message_ids)
+
     def _parse_event(self, fields: Dict[str, str]) -> Event:
-        """Parse event from Redis stream fields."""
-        return Event(
-            event_type=fields["event_type"],
+        """Parse event from Redis stream fields.
+
+        Entries are written by RedisStreamPublisher, so fields are converted
+        explicitly and the model is built without re-running validation.
+        """
+        payload = fields.get("payload")
+        return Event.model_construct(
+            event_type=_checked_event_type(fields["event_type"]),
             deck_id=UUID(fields["deck_id"]),
             version=int(fields["version"]),
-            timestamp=fields["timestamp"],
-            payload=json.loads(fields["payload"]) if fields.get("payload") else {},
+            timestamp=datetime.fromisoformat(fields["timestamp"]),
+            payload=orjson.loads(payload) if payload else {},
         )
 
 
@@ -233,7 +377,7 @@ class RedisPubSubManager:
         """Publish event to deck-specific channel."""
         try:
             client = self.redis_client.get_client()
-            channel = f"{self.pubsub_key_prefix}:deck:{deck_id}"
+            channel = _deck_channel(self.pubsub_key_prefix, deck_id)
 
             event_data = {
                 "event_type": event.event_type,
@@ -243,7 +387,7 @@ class RedisPubSubManager:
                 "payload": event.payload,
             }
 
-            await client.publish(channel, json.dumps(event_data))
+            await client.publish(channel, orjson.dumps(event_data))
 
             logger.debug(
                 "Event published to channel",
@@ -258,16 +402,28 @@ class RedisPubSubManager:
             metrics.record_redis_operation("pubsub_publish", "error")
             raise MessagingException(f"Channel publish failed: {e}")
 
-    async def subscribe_to_deck_channel(self, deck_id: UUID) -> AsyncIterator[Event]:
+    def subscribe_to_deck_channel(self, deck_id: UUID) -> AsyncIterator[Event]:
         """Subscribe to deck-specific channel."""
+        return self._subscribe(_deck_channel(self.pubsub_key_prefix, deck_id))
+
+    def subscribe_to_all_deck_channels(self) -> AsyncIterator[Event]:
+        """Subscribe to every deck channel over a single pub/sub connection."""
+        return self._subscribe(f"{self.pubsub_key_prefix}:deck:*", pattern=True)
+
+    async def _subscribe(
+        self, channel: str, pattern: bool = False
+    ) -> AsyncIterator[Event]:
+        """Yield events published to a channel, or to a glob pattern of channels."""
         try:
             client = self.redis_client.get_client()
-            channel = f"{self.pubsub_key_prefix}:deck:{deck_id}"
 
             pubsub = client.pubsub()
             if asyncio.iscoroutine(pubsub):
                 pubsub = await pubsub
-            await pubsub.subscribe(channel)
+            if pattern:
+                await pubsub.psubscribe(channel)
+            else:
+                await pubsub.subscribe(channel)
 
             logger.info("Subscribed to deck channel", channel=channel)
 
@@ -276,14 +432,19 @@ class RedisPubSubManager:
                 if asyncio.iscoroutine(listener):
                     listener = await listener
                 async for message in listener:
-                    if message["type"] == "message":
+                    if message["type"] in ("message", "pmessage"):
                         try:
-                            event_data = json.loads(message["data"])
-                            event = Event(
-                                event_type=event_data["event_type"],
+                            event_data = orjson.loads(message["data"])
+                            # Published by publish_to_deck_channel; skip revalidation
+                            event = Event.model_construct(
+                                event_type=_checked_event_type(
+                                    event_data["event_type"]
+                                ),
                                 deck_id=UUID(event_data["deck_id"]),
-                                version=event_data["version"],
-                                timestamp=event_data["timestamp"],
+                                version=int(event_data["version"]),
+                                timestamp=datetime.fromisoformat(
+                                    event_data["timestamp"]
+                                ),
                                 payload=event_data.get("payload", {}),
                             )
                             yield event
@@ -295,7 +456,10 @@ class RedisPubSubManager:
                                 error=str(e),
                             )
             finally:
-                await pubsub.unsubscribe(channel)
+                if pattern:
+                    await pubsub.punsubscribe(channel)
+                else:
+                    await pubsub.unsubscribe(channel)
                 # Prefer close() for compatibility with tests/mocks; fallback to aclose()
                 aclose_method = getattr(pubsub, "aclose", None)
                 if aclose_method is not None:
@@ -322,7 +486,7 @@ class RedisCacheManager:
         """Set cancellation flag for deck generation."""
         try:
             client = self.redis_client.get_client()
-            key = f"cancel:deck:{deck_id}"
+            key = _cancel_key(deck_id)
             await client.set(key, "true", ex=ttl)
 
             logger.info("Cancellation flag set", deck_id=str(deck_id))
@@ -337,7 +501,7 @@ class RedisCacheManager:
         """Check if deck generation should be cancelled."""
         try:
             client = self.redis_client.get_client()
-            key = f"cancel:deck:{deck_id}"
+            key = _cancel_key(deck_id)
             result = await client.get(key)
 
             metrics.record_redis_operation("cache_get", "success")
@@ -352,7 +516,7 @@ class RedisCacheManager:
         """Clear cancellation flag."""
         try:
             client = self.redis_client.get_client()
-            key = f"cancel:deck:{deck_id}"
+            key = _cancel_key(deck_id)
             await client.delete(key)
 
             logger.debug("Cancellation flag cleared", deck_id=str(deck_id))
@@ -368,7 +532,7 @@ class RedisCacheManager:
         """Set temporary data with TTL."""
         try:
             client = self.redis_client.get_client()
-            await client.set(key, json.dumps(data), ex=ttl)
+            await client.set(key, orjson.dumps(data), ex=ttl)
 
             metrics.record_redis_operation("cache_set", "success")
 
@@ -386,10 +550,10 @@ class RedisCacheManager:
             metrics.record_redis_operation("cache_get", "success")
 
             if result:
-                return json.loads(result)
+                return orjson.loads(result)
             return None
 
-        except (RedisError, json.JSONDecodeError) as e:
+        except (RedisError, orjson.JSONDecodeError) as e:
             logger.error("Failed to get temporary data", key=key, error=str(e))
             metrics.record_redis_operation("cache_get", "error")
             return None
@@ -62,7 +62,9 @@ async def startup_event(app: FastAPI) -> None:
         await database.initialize()
 
         # Initialize Redis
-        redis_client = RedisClient(settings.redis_url)
+        redis_client = RedisClient(
+            settings.redis_url, max_connections=settings.redis_max_connections
+        )
         await redis_client.initialize()
 
         # Initialize ARQ Redis client
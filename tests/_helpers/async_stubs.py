@@ -0,0 +1,27 @@
+"""Lightweight coroutine stubs for tests that don't assert on calls."""
+
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+
+def aret(value: Any) -> Callable[..., Awaitable[Any]]:
+    """Build an async callable that ignores its arguments and returns value."""
+
+    async def _stub(*args: Any, **kwargs: Any) -> Any:
+        return value
+
+    return _stub
+
+
+def araise(exc: BaseException) -> Callable[..., Awaitable[Any]]:
+    """Build an async callable that ignores its arguments and raises exc."""
+
+    async def _stub(*args: Any, **kwargs: Any) -> Any:
+        raise exc
+
+    return _stub
+
+
+async def aiter_of(*items: Any) -> AsyncIterator[Any]:
+    """Async iterator over a fixed sequence of items."""
+    for item in items:
+        yield item
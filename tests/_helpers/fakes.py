@@ -1,11 +1,16 @@
 """Fake repository implementations for testing."""
 
-from typing import Dict, List, Optional
+from bisect import bisect_right, insort
+from collections import defaultdict
+from operator import attrgetter
+from typing import DefaultDict, Dict, List, Optional
 from uuid import UUID
 
 from app.domain.entities import Deck, DeckEvent, Slide
 from app.domain.repositories import DeckRepository, EventRepository, SlideRepository
 
+_event_version = attrgetter("version")
+
 
 class FakeDeckRepository(DeckRepository):
     """In-memory fake implementation of DeckRepository for testing."""
@@ -58,6 +63,10 @@ class FakeSlideRepository(SlideRepository):
         self._slides[slide.id] = slide
         return slide
 
+    async def bulk_create(self, slides: List[Slide]) -> List[Slide]:
+        self._slides.update({slide.id: slide for slide in slides})
+        return slides
+
     async def get_by_id(self, slide_id: UUID) -> Optional[Slide]:
         return self._slides.get(slide_id)
 
@@ -103,28 +112,26 @@ class FakeEventRepository(EventRepository):
 
     def __init__(self) -> None:
         self.events: List[DeckEvent] = []
+        # Per-deck events kept sorted by version on insert
+        self._by_deck: DefaultDict[UUID, List[DeckEvent]] = defaultdict(list)
         self._next_id = 1
 
     async def create(self, event: DeckEvent) -> DeckEvent:
         event.id = self._next_id
         self._next_id += 1
         self.events.append(event)
+        insort(self._by_deck[event.deck_id], event, key=_event_version)
         return event
 
     async def get_by_deck_id(
         self, deck_id: UUID, from_version: int = 0
     ) -> List[DeckEvent]:
-        deck_events = [
-            event
-            for event in self.events
-            if event.deck_id == deck_id and event.version > from_version
-        ]
-        # Sort by version
-        deck_events.sort(key=lambda x: x.version)
-        return deck_events
+        deck_events = self._by_deck.get(deck_id, [])
+        start = bisect_right(deck_events, from_version, key=_event_version)
+        return deck_events[start:]
 
     async def get_latest_version(self, deck_id: UUID) -> int:
-        deck_events = [event for event in self.events if event.deck_id == deck_id]
+        deck_events = self._by_deck.get(deck_id)
         if not deck_events:
             return 0
-        return max(event.version for event in deck_events)
+        return deck_events[-1].version
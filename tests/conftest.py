@@ -23,13 +23,15 @@ from app.domain.entities import Deck, DeckStatus, Slide, DeckEvent
 from app.infrastructure.db.models import Base
 
 
-# Pytest configuration
+# Event loop
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy():
+    """Run async tests on uvloop where available, like the worker does."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
 # Database fixtures
@@ -185,7 +187,9 @@ def mock_stream_publisher():
     """Mock Redis stream publisher for testing."""
     mock = Mock()
     mock.publish_event = AsyncMock()
-    return mock
+    yield mock
+    # Error-handling tests install a side_effect; never let it leak
+    mock.publish_event.reset_mock(side_effect=True)
 
 
 @pytest.fixture
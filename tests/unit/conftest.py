@@ -0,0 +1,46 @@
+"""Unit test configuration and fixtures."""
+
+import pytest
+
+from app.domain.entities import Deck, DeckStatus, Slide
+
+
+# Cleanup fixtures
+@pytest.fixture(autouse=True)
+def cleanup_test_environment():
+    """Override the global async cleanup; unit tests use in-memory fakes only."""
+    yield
+
+
+# Domain entity fixtures
+@pytest.fixture(scope="module")
+def _canonical_deck() -> Deck:
+    """Deck built and validated once per module."""
+    return Deck(
+        user_id="test-user-123",
+        title="Test Presentation",
+        status=DeckStatus.PENDING,
+    )
+
+
+@pytest.fixture(scope="module")
+def _canonical_slide(_canonical_deck: Deck) -> Slide:
+    """Slide built and validated once per module."""
+    return Slide(
+        deck_id=_canonical_deck.id,
+        slide_order=1,
+        html_content="<h1>Test Slide</h1><p>Content</p>",
+        presenter_notes="Test presenter notes",
+    )
+
+
+@pytest.fixture
+def sample_deck(_canonical_deck: Deck, test_user_id: str) -> Deck:
+    """Sample deck entity for testing."""
+    return _canonical_deck.model_copy(update={"user_id": test_user_id}, deep=True)
+
+
+@pytest.fixture
+def sample_slide(_canonical_slide: Slide, sample_deck: Deck) -> Slide:
+    """Sample slide entity for testing."""
+    return _canonical_slide.model_copy(update={"deck_id": sample_deck.id}, deep=True)
@@ -1,9 +1,11 @@
 """Comprehensive application services unit tests."""
 
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
-from uuid import uuid4
+from itertools import count
+from unittest.mock import AsyncMock, Mock
+from uuid import UUID
 
+from app.application import services as services_module
 from app.application.services import DeckService, SlideService
 from app.domain.entities import Deck, DeckStatus, Slide, DeckEvent
 from app.domain.exceptions import (
@@ -19,6 +21,18 @@ from tests._helpers.fakes import (
 )
 
 
+@pytest.fixture
+def mock_sanitizer(monkeypatch):
+    """Replace the services module's HTML sanitizer with a mock."""
+    sanitizer = Mock()
+    monkeypatch.setattr(services_module, "html_sanitizer", sanitizer)
+    return sanitizer
+
+
+# Deterministic counter-based IDs for lookups that must miss the fakes.
+_uuid_iter = (UUID(int=n) for n in count(1))
+
+
 class TestDeckService:
     """Test cases for DeckService."""
 
@@ -46,6 +60,7 @@ class TestDeckService:
         request = DeckCreationRequest(**deck_creation_request)
 
         deck = await deck_service.create_deck(request, test_user_id)
+        deck_id_str = str(deck.id)
 
         # Verify deck properties
         assert deck.user_id == test_user_id
@@ -65,7 +80,7 @@ class TestDeckService:
         # Verify job was enqueued
         deck_service.arq_redis.enqueue_job.assert_called_once_with(
             "generate_deck",
-            deck_id=str(deck.id),
+            deck_id=deck_id_str,
             generation_params={
                 "title": request.title,
                 "topic": request.topic,
@@ -105,7 +120,7 @@ class TestDeckService:
     @pytest.mark.asyncio
     async def test_get_deck_not_found(self, deck_service, test_user_id):
         """Test deck retrieval when deck doesn't exist."""
-        fake_deck_id = uuid4()
+        fake_deck_id = next(_uuid_iter)
 
         with pytest.raises(DeckNotFoundException):
             await deck_service.get_deck(fake_deck_id, test_user_id)
@@ -127,15 +142,15 @@ class TestDeckService:
         # Add deck and slides to repositories
         await deck_service.deck_repo.create(sample_deck)
 
-        slides = []
-        for i in range(3):
-            slide = Slide(
+        slides = [
+            Slide(
                 deck_id=sample_deck.id,
                 slide_order=i + 1,
                 html_content=f"<h1>Slide {i + 1}</h1>",
             )
-            await deck_service.slide_repo.create(slide)
-            slides.append(slide)
+            for i in range(3)
+        ]
+        await deck_service.slide_repo.bulk_create(slides)
 
         deck, retrieved_slides = await deck_service.get_deck_with_slides(
             sample_deck.id, test_user_id
@@ -143,7 +158,7 @@ class TestDeckService:
 
         assert deck.id == sample_deck.id
         assert len(retrieved_slides) == 3
-        assert all(slide.deck_id == sample_deck.id for slide in retrieved_slides)
+        assert {slide.deck_id for slide in retrieved_slides} == {sample_deck.id}
         # Verify slides are ordered
         assert retrieved_slides[0].slide_order == 1
         assert retrieved_slides[1].slide_order == 2
@@ -167,8 +182,7 @@ class TestDeckService:
         user_decks = await deck_service.list_decks(test_user_id)
 
         assert len(user_decks) == 5
-        assert all(deck.user_id == test_user_id for deck in user_decks)
-        assert not any(deck.user_id == "other-user" for deck in user_decks)
+        assert {deck.user_id for deck in user_decks} == {test_user_id}
 
     @pytest.mark.asyncio
     async def test_list_decks_with_pagination(self, deck_service, test_user_id):
@@ -231,7 +245,7 @@ class TestDeckService:
     @pytest.mark.asyncio
     async def test_cancel_deck_not_found(self, deck_service, test_user_id):
         """Test cancellation of non-existent deck."""
-        fake_deck_id = uuid4()
+        fake_deck_id = next(_uuid_iter)
 
         with pytest.raises(DeckNotFoundException):
             await deck_service.cancel_deck_generation(fake_deck_id, test_user_id)
@@ -269,7 +283,7 @@ class TestDeckService:
         )
 
         assert len(retrieved_events) == 5
-        assert all(event.deck_id == sample_deck.id for event in retrieved_events)
+        assert {event.deck_id for event in retrieved_events} == {sample_deck.id}
 
         # Get events from specific version
         recent_events = await deck_service.get_deck_events(
@@ -345,7 +359,7 @@ class TestSlideService:
     @pytest.mark.asyncio
     async def test_get_slide_not_found(self, slide_service, test_user_id):
         """Test slide retrieval when slide doesn't exist."""
-        fake_slide_id = uuid4()
+        fake_slide_id = next(_uuid_iter)
 
         with pytest.raises(DeckNotFoundException):
             await slide_service.get_slide(fake_slide_id, test_user_id)
@@ -431,7 +445,9 @@ class TestSlideService:
             )
 
     @pytest.mark.asyncio
-    async def test_create_slide_internal(self, slide_service, completed_deck):
+    async def test_create_slide_internal(
+        self, slide_service, completed_deck, mock_sanitizer
+    ):
         """Test internal slide creation (used by workers)."""
         await slide_service.deck_repo.create(completed_deck)
         original_version = completed_deck.version
@@ -442,17 +458,14 @@ class TestSlideService:
         presenter_notes = "Speaker notes"
 
         # Mock HTML sanitizer
-        with patch("app.application.services.html_sanitizer") as mock_sanitizer:
-            mock_sanitizer.sanitize.return_value = (
-                "<h1>New Slide</h1><p>Content with </p>"
-            )
+        mock_sanitizer.sanitize.return_value = "<h1>New Slide</h1><p>Content with </p>"
 
-            created_slide = await slide_service.create_slide(
-                deck_id=completed_deck.id,
-                slide_order=1,
-                html_content=html_content,
-                presenter_notes=presenter_notes,
-            )
+        created_slide = await slide_service.create_slide(
+            deck_id=completed_deck.id,
+            slide_order=1,
+            html_content=html_content,
+            presenter_notes=presenter_notes,
+        )
 
         # Verify slide was created
         assert created_slide.deck_id == completed_deck.id
@@ -472,7 +485,7 @@ class TestSlideService:
 
     @pytest.mark.asyncio
     async def test_update_slide_content_internal(
-        self, slide_service, completed_deck, sample_slide
+        self, slide_service, completed_deck, sample_slide, mock_sanitizer
     ):
         """Test internal slide content update (used by workers)."""
         await slide_service.deck_repo.create(completed_deck)
@@ -484,14 +497,13 @@ class TestSlideService:
         new_notes = "Updated notes"
 
         # Mock HTML sanitizer
-        with patch("app.application.services.html_sanitizer") as mock_sanitizer:
-            mock_sanitizer.sanitize.return_value = new_content
+        mock_sanitizer.sanitize.return_value = new_content
 
-            updated_slide = await slide_service.update_slide_content(
-                slide_id=sample_slide.id,
-                html_content=new_content,
-                presenter_notes=new_notes,
-            )
+        updated_slide = await slide_service.update_slide_content(
+            slide_id=sample_slide.id,
+            html_content=new_content,
+            presenter_notes=new_notes,
+        )
 
         # Verify slide was updated
         assert updated_slide.html_content == new_content
@@ -508,7 +520,7 @@ class TestSlideService:
     @pytest.mark.asyncio
     async def test_update_slide_content_not_found(self, slide_service):
         """Test updating content of non-existent slide."""
-        fake_slide_id = uuid4()
+        fake_slide_id = next(_uuid_iter)
 
         with pytest.raises(DeckNotFoundException):
             await slide_service.update_slide_content(
@@ -536,7 +548,7 @@ class TestSlideService:
 
     @pytest.mark.asyncio
     async def test_service_error_handling(
-        self, slide_service, sample_deck, test_user_id
+        self, slide_service, sample_deck, test_user_id, mock_sanitizer
     ):
         """Test service error handling and logging."""
         # Mock stream publisher to raise exception
@@ -547,23 +559,23 @@ class TestSlideService:
         # Should log error but not raise exception
         await slide_service.deck_repo.create(sample_deck)
 
-        with patch("app.application.services.html_sanitizer") as mock_sanitizer:
-            mock_sanitizer.sanitize.return_value = "<h1>Test</h1>"
+        mock_sanitizer.sanitize.return_value = "<h1>Test</h1>"
 
-            slide = await slide_service.create_slide(
-                deck_id=sample_deck.id, slide_order=1, html_content="<h1>Test</h1>"
-            )
+        slide = await slide_service.create_slide(
+            deck_id=sample_deck.id, slide_order=1, html_content="<h1>Test</h1>"
+        )
 
         # Slide should still be created despite publishing failure
         assert slide.deck_id == sample_deck.id
 
 
+@pytest.mark.integration
 class TestServiceIntegration:
     """Test integration between services."""
 
-    @pytest.mark.asyncio
-    async def test_deck_and_slide_service_integration(self, test_user_id):
-        """Test interaction between DeckService and SlideService."""
+    @pytest.fixture(scope="class")
+    def services(self):
+        """Create DeckService and SlideService sharing repositories and mocks."""
         # Create shared repositories
         deck_repo = FakeDeckRepository()
         slide_repo = FakeSlideRepository()
@@ -595,6 +607,17 @@ class TestServiceIntegration:
             arq_redis=mock_arq_redis,
         )
 
+        return deck_service, slide_service
+
+    @pytest.mark.asyncio
+    async def test_deck_and_slide_service_integration(
+        self, services, test_user_id, mock_sanitizer
+    ):
+        """Test interaction between DeckService and SlideService."""
+        deck_service, slide_service = services
+        deck_repo = deck_service.deck_repo
+        event_repo = deck_service.event_repo
+
         # Create deck using DeckService
         request = DeckCreationRequest(
             title="Integration Test Deck", topic="Testing service integration"
@@ -606,12 +629,11 @@ class TestServiceIntegration:
         await deck_repo.update(deck)
 
         # Add slide using SlideService
-        with patch("app.application.services.html_sanitizer") as mock_sanitizer:
-            mock_sanitizer.sanitize.return_value = "<h1>Integration Test</h1>"
+        mock_sanitizer.sanitize.return_value = "<h1>Integration Test</h1>"
 
-            slide = await slide_service.create_slide(
-                deck_id=deck.id, slide_order=1, html_content="<h1>Integration Test</h1>"
-            )
+        slide = await slide_service.create_slide(
+            deck_id=deck.id, slide_order=1, html_content="<h1>Integration Test</h1>"
+        )
 
         # Retrieve deck with slides using DeckService
         retrieved_deck, slides = await deck_service.get_deck_with_slides(
@@ -1,141 +1,212 @@
 """Comprehensive domain entity tests."""
 
 from datetime import datetime, UTC, timedelta
-from uuid import uuid4, UUID
+from itertools import count
+from operator import attrgetter
+from uuid import UUID
 
+import orjson
+import pytest
+
+from app.domain import entities
 from app.domain.entities import Deck, DeckStatus, Slide, DeckEvent
 
+pytestmark = [pytest.mark.filterwarnings("error::DeprecationWarning")]
+
+NOW = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+_STATUS_VALUES = frozenset(status.value for status in DeckStatus)
+
+
+class _FakeDateTime(datetime):
+    """datetime whose now() advances by one microsecond per call."""
+
+    _base = NOW
+    _ticks = count()
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls._base + timedelta(microseconds=next(cls._ticks))
+
+
+_UUIDS = tuple(UUID(int=i) for i in range(1, 10_001))
+
+
+@pytest.fixture
+def det_uuid():
+    """Draw explicit test IDs from a fixed pool instead of os.urandom."""
+    return iter(_UUIDS).__next__
+
+
+@pytest.fixture(scope="module", autouse=True)
+def fake_clock():
+    """Drive entity timestamps from a monotonic fake clock instead of sleeping."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(entities, "datetime", _FakeDateTime)
+        yield
+
+
+_DECK_ID = _UUIDS[-1]
+_CUSTOM_DECK = {
+    "id": _UUIDS[-2],
+    "user_id": "custom-user",
+    "title": "Custom Deck",
+    "status": DeckStatus.COMPLETED,
+    "version": 5,
+    "deck_plan": {"slides": [{"title": "Slide 1"}]},
+    "created_at": NOW,
+    "updated_at": NOW,
+}
+_CUSTOM_SLIDE = {
+    "id": _UUIDS[-3],
+    "deck_id": _DECK_ID,
+    "slide_order": 3,
+    "html_content": "<h1>Custom Slide</h1><p>Content</p>",
+    "presenter_notes": "Custom presenter notes",
+    "created_at": NOW,
+    "updated_at": NOW,
+}
+_EVENT_PAYLOAD = {"title": "Test Deck", "slide_count": 5, "user_action": "create"}
+
+_MINIMAL_ENTITIES = [
+    (Deck, {"user_id": "test-user", "title": "Test Deck"}),
+    (Slide, {"deck_id": _DECK_ID, "slide_order": 1, "html_content": ""}),
+]
+
+
+class TestEntityCreation:
+    """Test cases for entity construction across Deck, Slide and DeckEvent."""
+
+    @pytest.mark.parametrize(
+        "cls,kwargs,expected",
+        [
+            pytest.param(
+                Deck,
+                {"user_id": "test-user", "title": "Test Deck"},
+                {
+                    "user_id": "test-user",
+                    "title": "Test Deck",
+                    "status": DeckStatus.PENDING,
+                    "version": 1,
+                    "deck_plan": None,
+                },
+                id="deck-defaults",
+            ),
+            pytest.param(Deck, _CUSTOM_DECK, _CUSTOM_DECK, id="deck-custom"),
+            pytest.param(
+                Slide,
+                {"deck_id": _DECK_ID, "slide_order": 1, "html_content": "<h1>T</h1>"},
+                {
+                    "deck_id": _DECK_ID,
+                    "slide_order": 1,
+                    "html_content": "<h1>T</h1>",
+                    "presenter_notes": None,
+                },
+                id="slide-defaults",
+            ),
+            pytest.param(Slide, _CUSTOM_SLIDE, _CUSTOM_SLIDE, id="slide-custom"),
+            pytest.param(
+                DeckEvent,
+                {"deck_id": _DECK_ID, "version": 1, "event_type": "DeckStarted"},
+                {
+                    "id": None,  # ID set by database
+                    "deck_id": _DECK_ID,
+                    "version": 1,
+                    "event_type": "DeckStarted",
+                    "payload": {},
+                },
+                id="event-defaults",
+            ),
+            pytest.param(
+                DeckEvent,
+                {
+                    "deck_id": _DECK_ID,
+                    "version": 2,
+                    "event_type": "SlideAdded",
+                    "payload": _EVENT_PAYLOAD,
+                },
+                {"version": 2, "event_type": "SlideAdded", "payload": _EVENT_PAYLOAD},
+                id="event-payload",
+            ),
+        ],
+    )
+    def test_entity_creation(self, cls, kwargs, expected):
+        """Test entity creation with default and custom values."""
+        obj = cls(**kwargs)
+
+        assert {name: getattr(obj, name) for name in expected} == expected
+
+    @pytest.mark.parametrize("cls,kwargs", _MINIMAL_ENTITIES)
+    def test_default_timestamps_synced(self, cls, kwargs):
+        """Test that default created_at and updated_at are synced."""
+        obj = cls(**kwargs)
+
+        assert obj.created_at == obj.updated_at
+
+    @pytest.mark.parametrize("cls,kwargs", _MINIMAL_ENTITIES)
+    def test_default_id_is_fresh_uuid4(self, cls, kwargs):
+        """Test that each entity gets its own random UUID by default."""
+        first, second = cls(**kwargs), cls(**kwargs)
+
+        assert first.id.version == 4
+        assert first.id != second.id
+
 
 class TestDeck:
     """Test cases for Deck entity."""
 
-    def test_deck_creation_with_defaults(self):
-        """Test deck creation with default values."""
-        deck = Deck(user_id="test-user", title="Test Deck")
-
-        assert isinstance(deck.id, UUID)
-        assert deck.user_id == "test-user"
-        assert deck.title == "Test Deck"
-        assert deck.status == DeckStatus.PENDING
-        assert deck.version == 1
-        assert deck.deck_plan is None
-        assert isinstance(deck.created_at, datetime)
-        assert isinstance(deck.updated_at, datetime)
-        # created_at and updated_at should be very close (within 1 second)
-        assert abs((deck.updated_at - deck.created_at).total_seconds()) < 1
-
-    def test_deck_creation_with_custom_values(self):
-        """Test deck creation with custom values."""
-        custom_id = uuid4()
-        custom_time = datetime.now(UTC)
-        deck_plan = {"slides": [{"title": "Slide 1"}]}
-
-        deck = Deck(
-            id=custom_id,
-            user_id="custom-user",
-            title="Custom Deck",
-            status=DeckStatus.COMPLETED,
-            version=5,
-            deck_plan=deck_plan,
-            created_at=custom_time,
-            updated_at=custom_time,
-        )
-
-        assert deck.id == custom_id
-        assert deck.user_id == "custom-user"
-        assert deck.title == "Custom Deck"
-        assert deck.status == DeckStatus.COMPLETED
-        assert deck.version == 5
-        assert deck.deck_plan == deck_plan
-        assert deck.created_at == custom_time
-        assert deck.updated_at == custom_time
-
-    def test_can_be_cancelled_states(self, sample_deck):
-        """Test can_be_cancelled for various deck states."""
-        # PENDING state
-        sample_deck.status = DeckStatus.PENDING
-        assert sample_deck.can_be_cancelled() is True
-
-        # PLANNING state
-        sample_deck.status = DeckStatus.PLANNING
-        assert sample_deck.can_be_cancelled() is True
-
-        # GENERATING state
-        sample_deck.status = DeckStatus.GENERATING
-        assert sample_deck.can_be_cancelled() is True
-
-        # COMPLETED state
-        sample_deck.status = DeckStatus.COMPLETED
-        assert sample_deck.can_be_cancelled() is False
-
-        # FAILED state
-        sample_deck.status = DeckStatus.FAILED
-        assert sample_deck.can_be_cancelled() is False
-
-        # CANCELLED state
-        sample_deck.status = DeckStatus.CANCELLED
-        assert sample_deck.can_be_cancelled() is False
-
-    def test_can_be_modified_states(self, sample_deck):
-        """Test can_be_modified for various deck states."""
-        # PENDING state
-        sample_deck.status = DeckStatus.PENDING
-        assert sample_deck.can_be_modified() is True
-
-        # PLANNING state
-        sample_deck.status = DeckStatus.PLANNING
-        assert sample_deck.can_be_modified() is True
-
-        # GENERATING state
-        sample_deck.status = DeckStatus.GENERATING
-        assert sample_deck.can_be_modified() is True
-
-        # COMPLETED state
-        sample_deck.status = DeckStatus.COMPLETED
-        assert sample_deck.can_be_modified() is True
-
-        # FAILED state
-        sample_deck.status = DeckStatus.FAILED
-        assert sample_deck.can_be_modified() is False
-
-        # CANCELLED state
-        sample_deck.status = DeckStatus.CANCELLED
-        assert sample_deck.can_be_modified() is False
-
-    def test_is_in_progress_states(self, sample_deck):
-        """Test is_in_progress for various deck states."""
-        # In progress states
-        in_progress_states = [
-            DeckStatus.PENDING,
-            DeckStatus.PLANNING,
-            DeckStatus.GENERATING,
-        ]
-
-        for status in in_progress_states:
-            sample_deck.status = status
-            assert sample_deck.is_in_progress() is True
-
-        # Not in progress states
-        not_in_progress_states = [
-            DeckStatus.COMPLETED,
-            DeckStatus.FAILED,
-            DeckStatus.CANCELLED,
-        ]
-
-        for status in not_in_progress_states:
-            sample_deck.status = status
-            assert sample_deck.is_in_progress() is False
+    @pytest.mark.parametrize(
+        "status,expected",
+        [
+            (DeckStatus.PENDING, True),
+            (DeckStatus.PLANNING, True),
+            (DeckStatus.GENERATING, True),
+            (DeckStatus.COMPLETED, False),
+            (DeckStatus.FAILED, False),
+            (DeckStatus.CANCELLED, False),
+        ],
+    )
+    def test_can_be_cancelled(self, sample_deck, status, expected):
+        """Test can_be_cancelled for each deck state."""
+        sample_deck.status = status
+        assert sample_deck.can_be_cancelled() is expected
+
+    @pytest.mark.parametrize(
+        "status,expected",
+        [
+            (DeckStatus.PENDING, True),
+            (DeckStatus.PLANNING, True),
+            (DeckStatus.GENERATING, True),
+            (DeckStatus.COMPLETED, True),
+            (DeckStatus.FAILED, False),
+            (DeckStatus.CANCELLED, False),
+        ],
+    )
+    def test_can_be_modified(self, sample_deck, status, expected):
+        """Test can_be_modified for each deck state."""
+        sample_deck.status = status
+        assert sample_deck.can_be_modified() is expected
+
+    @pytest.mark.parametrize(
+        "status,expected",
+        [
+            (DeckStatus.PENDING, True),
+            (DeckStatus.PLANNING, True),
+            (DeckStatus.GENERATING, True),
+            (DeckStatus.COMPLETED, False),
+            (DeckStatus.FAILED, False),
+            (DeckStatus.CANCELLED, False),
+        ],
+    )
+    def test_is_in_progress(self, sample_deck, status, expected):
+        """Test is_in_progress for each deck state."""
+        sample_deck.status = status
+        assert sample_deck.is_in_progress() is expected
 
     def test_increment_version(self, sample_deck):
         """Test version increment functionality."""
         initial_version = sample_deck.version
         initial_updated_at = sample_deck.updated_at
 
-        # Small delay to ensure timestamp difference
-        import time
-
-        time.sleep(0.001)
-
         sample_deck.increment_version()
 
         assert sample_deck.version == initial_version + 1
@@ -146,11 +217,6 @@ class TestDeck:
         initial_version = sample_deck.version
         initial_updated_at = sample_deck.updated_at
 
-        # Small delay to ensure timestamp difference
-        import time
-
-        time.sleep(0.001)
-
         sample_deck.update_status(DeckStatus.PLANNING)
 
         assert sample_deck.status == DeckStatus.PLANNING
@@ -163,11 +229,6 @@ class TestDeck:
         initial_updated_at = sample_deck.updated_at
         plan_data = {"slides": [{"title": "New Slide"}]}
 
-        # Small delay to ensure timestamp difference
-        import time
-
-        time.sleep(0.001)
-
         sample_deck.update_plan(plan_data)
 
         assert sample_deck.deck_plan == plan_data
@@ -205,15 +266,15 @@ class TestDeck:
             assert sample_deck.status == DeckStatus.CANCELLED
             assert sample_deck.can_be_cancelled() is False
 
-    def test_deck_equality_and_hash(self):
+    def test_deck_equality_and_hash(self, det_uuid):
         """Test deck equality and hashing."""
-        deck_id = uuid4()
+        deck_id = det_uuid()
         deck1 = Deck(id=deck_id, user_id="user1", title="Deck 1")
         deck2 = Deck(
             id=deck_id, user_id="user2", title="Deck 2"
         )  # Same ID, different data
         deck3 = Deck(
-            id=uuid4(), user_id="user1", title="Deck 1"
+            id=det_uuid(), user_id="user1", title="Deck 1"
         )  # Different ID, same data
 
         # Equality should be based on ID
@@ -228,53 +289,10 @@ class TestDeck:
 class TestSlide:
     """Test cases for Slide entity."""
 
-    def test_slide_creation_with_defaults(self, sample_deck):
-        """Test slide creation with default values."""
-        slide = Slide(
-            deck_id=sample_deck.id, slide_order=1, html_content="<h1>Test</h1>"
-        )
-
-        assert isinstance(slide.id, UUID)
-        assert slide.deck_id == sample_deck.id
-        assert slide.slide_order == 1
-        assert slide.html_content == "<h1>Test</h1>"
-        assert slide.presenter_notes is None
-        assert isinstance(slide.created_at, datetime)
-        assert isinstance(slide.updated_at, datetime)
-        assert slide.created_at == slide.updated_at
-
-    def test_slide_creation_with_all_fields(self, sample_deck):
-        """Test slide creation with all fields specified."""
-        slide_id = uuid4()
-        custom_time = datetime.now(UTC)
-
-        slide = Slide(
-            id=slide_id,
-            deck_id=sample_deck.id,
-            slide_order=3,
-            html_content="<h1>Custom Slide</h1><p>Content</p>",
-            presenter_notes="Custom presenter notes",
-            created_at=custom_time,
-            updated_at=custom_time,
-        )
-
-        assert slide.id == slide_id
-        assert slide.deck_id == sample_deck.id
-        assert slide.slide_order == 3
-        assert slide.html_content == "<h1>Custom Slide</h1><p>Content</p>"
-        assert slide.presenter_notes == "Custom presenter notes"
-        assert slide.created_at == custom_time
-        assert slide.updated_at == custom_time
-
     def test_update_content_with_notes(self, sample_slide):
         """Test updating slide content with presenter notes."""
         initial_updated_at = sample_slide.updated_at
 
-        # Small delay to ensure timestamp difference
-        import time
-
-        time.sleep(0.001)
-
         new_content = "<h1>Updated Slide</h1><p>New content</p>"
         new_notes = "Updated presenter notes"
 
@@ -289,11 +307,6 @@ class TestSlide:
         initial_notes = sample_slide.presenter_notes
         initial_updated_at = sample_slide.updated_at
 
-        # Small delay to ensure timestamp difference
-        import time
-
-        time.sleep(0.001)
-
         new_content = "<h1>Updated Slide</h1><p>New content</p>"
 
         sample_slide.update_content(new_content, None)
@@ -306,11 +319,6 @@ class TestSlide:
         """Test updating slide content with empty notes."""
         initial_updated_at = sample_slide.updated_at
 
-        # Small delay to ensure timestamp difference
-        import time
-
-        time.sleep(0.001)
-
         new_content = "<h1>Updated Slide</h1>"
         empty_notes = ""
 
@@ -322,25 +330,25 @@ class TestSlide:
 
     def test_slide_ordering(self, sample_deck):
         """Test slide ordering functionality."""
-        slides = []
-        for i in range(5, 0, -1):  # Create in reverse order
-            slide = Slide(
+        slides = [
+            Slide(
                 deck_id=sample_deck.id,
                 slide_order=i,
                 html_content=f"<h1>Slide {i}</h1>",
             )
-            slides.append(slide)
+            for i in range(5, 0, -1)  # Create in reverse order
+        ]
 
         # Sort by slide_order
-        sorted_slides = sorted(slides, key=lambda s: s.slide_order)
+        slides.sort(key=attrgetter("slide_order"))
 
-        for i, slide in enumerate(sorted_slides, 1):
+        for i, slide in enumerate(slides, 1):
             assert slide.slide_order == i
             assert f"Slide {i}" in slide.html_content
 
-    def test_slide_equality_and_hash(self, sample_deck):
+    def test_slide_equality_and_hash(self, sample_deck, det_uuid):
         """Test slide equality and hashing."""
-        slide_id = uuid4()
+        slide_id = det_uuid()
         slide1 = Slide(
             id=slide_id, deck_id=sample_deck.id, slide_order=1, html_content="Content 1"
         )
@@ -348,7 +356,10 @@ class TestSlide:
             id=slide_id, deck_id=sample_deck.id, slide_order=2, html_content="Content 2"
         )
         slide3 = Slide(
-            id=uuid4(), deck_id=sample_deck.id, slide_order=1, html_content="Content 1"
+            id=det_uuid(),
+            deck_id=sample_deck.id,
+            slide_order=1,
+            html_content="Content 1",
         )
 
         assert slide1 == slide2  # Same ID
@@ -360,33 +371,9 @@ class TestSlide:
 class TestDeckEvent:
     """Test cases for DeckEvent entity."""
 
-    def test_deck_event_creation_with_defaults(self, sample_deck):
-        """Test deck event creation with default values."""
-        event = DeckEvent(deck_id=sample_deck.id, version=1, event_type="DeckStarted")
-
-        assert event.id is None  # ID set by database
-        assert event.deck_id == sample_deck.id
-        assert event.version == 1
-        assert event.event_type == "DeckStarted"
-        assert event.payload == {}
-        assert isinstance(event.created_at, datetime)
-
-    def test_deck_event_creation_with_payload(self, sample_deck):
-        """Test deck event creation with payload."""
-        payload = {"title": "Test Deck", "slide_count": 5, "user_action": "create"}
-
-        event = DeckEvent(
-            deck_id=sample_deck.id, version=2, event_type="SlideAdded", payload=payload
-        )
-
-        assert event.deck_id == sample_deck.id
-        assert event.version == 2
-        assert event.event_type == "SlideAdded"
-        assert event.payload == payload
-
     def test_deck_event_with_custom_timestamp(self, sample_deck):
         """Test deck event creation with custom timestamp."""
-        custom_time = datetime.now(UTC) - timedelta(hours=1)
+        custom_time = NOW - timedelta(hours=1)
 
         event = DeckEvent(
             deck_id=sample_deck.id,
@@ -397,9 +384,9 @@ class TestDeckEvent:
 
         assert event.created_at == custom_time
 
-    def test_deck_event_types(self, sample_deck):
-        """Test various deck event types."""
-        event_types = [
+    @pytest.mark.parametrize(
+        "event_type",
+        [
             "DeckStarted",
             "PlanUpdated",
             "SlideAdded",
@@ -408,16 +395,16 @@ class TestDeckEvent:
             "DeckFailed",
             "DeckCancelled",
             "Heartbeat",
-        ]
-
-        for i, event_type in enumerate(event_types, 1):
-            event = DeckEvent(deck_id=sample_deck.id, version=i, event_type=event_type)
-            assert event.event_type == event_type
-            assert event.version == i
+        ],
+    )
+    def test_deck_event_type(self, sample_deck, event_type):
+        """Test various deck event types."""
+        event = DeckEvent(deck_id=sample_deck.id, version=1, event_type=event_type)
+        assert event.event_type == event_type
 
-    def test_deck_event_payload_types(self, sample_deck):
-        """Test deck event with various payload types."""
-        payloads = [
+    @pytest.mark.parametrize(
+        "payload",
+        [
             {},  # Empty dict
             {"simple": "value"},  # Simple dict
             {"nested": {"key": "value"}},  # Nested dict
@@ -425,16 +412,17 @@ class TestDeckEvent:
             {
                 "mixed": {"string": "value", "number": 42, "boolean": True}
             },  # Mixed types
-        ]
-
-        for i, payload in enumerate(payloads, 1):
-            event = DeckEvent(
-                deck_id=sample_deck.id,
-                version=i,
-                event_type="TestEvent",
-                payload=payload,
-            )
-            assert event.payload == payload
+        ],
+    )
+    def test_deck_event_payload_type(self, sample_deck, payload):
+        """Test deck event with various payload types."""
+        event = DeckEvent(
+            deck_id=sample_deck.id,
+            version=1,
+            event_type="TestEvent",
+            payload=payload,
+        )
+        assert event.payload == payload
 
     def test_deck_event_version_ordering(self, sample_deck):
         """Test deck event version ordering."""
@@ -446,13 +434,25 @@ class TestDeckEvent:
             events.append(event)
 
         # Sort by version
-        sorted_events = sorted(events, key=lambda e: e.version)
+        sorted_events = sorted(events, key=attrgetter("version"))
 
         for i, event in enumerate(sorted_events, 1):
             assert event.version == i
             assert event.event_type == f"Event{i}"
 
 
+class TestDeckSchema:
+    """Test cases for entity field type declarations."""
+
+    def test_field_types(self):
+        """Test that identifier and timestamp fields are declared with their types."""
+        for model in (Deck, Slide):
+            assert model.model_fields["id"].annotation is UUID
+            assert issubclass(model.model_fields["created_at"].annotation, datetime)
+            assert issubclass(model.model_fields["updated_at"].annotation, datetime)
+        assert issubclass(DeckEvent.model_fields["created_at"].annotation, datetime)
+
+
 class TestDeckStatusEnum:
     """Test cases for DeckStatus enum."""
 
@@ -491,8 +491,8 @@ class TestDeckStatusEnum:
 
     def test_deck_status_membership(self):
         """Test deck status membership testing."""
-        assert "PENDING" in [status.value for status in DeckStatus]
-        assert "INVALID" not in [status.value for status in DeckStatus]
+        assert "PENDING" in _STATUS_VALUES
+        assert "INVALID" not in _STATUS_VALUES
 
 
 class TestEntityValidation:
@@ -538,7 +538,9 @@ class TestEntitySerializationAndCopy:
 
     def test_deck_dict_conversion(self, sample_deck):
         """Test deck to dict conversion."""
-        deck_dict = sample_deck.model_dump()
+        deck_dict = sample_deck.model_dump(
+            include={"id", "user_id", "title", "status", "version"}
+        )
 
         assert deck_dict["id"] == sample_deck.id
         assert deck_dict["user_id"] == sample_deck.user_id
@@ -548,18 +550,19 @@ class TestEntitySerializationAndCopy:
 
     def test_deck_json_conversion(self, sample_deck):
         """Test deck JSON serialization."""
-        json_str = sample_deck.model_dump_json()
-        assert isinstance(json_str, str)
-        assert sample_deck.user_id in json_str
-        assert sample_deck.title in json_str
+        parsed = orjson.loads(sample_deck.model_dump_json())
+        assert parsed["user_id"] == sample_deck.user_id
+        assert parsed["title"] == sample_deck.title
 
     def test_deck_copy(self, sample_deck):
         """Test deck copying."""
+        sample_deck.deck_plan = {"slides": []}
         deck_copy = sample_deck.model_copy()
 
         assert deck_copy.id == sample_deck.id
         assert deck_copy.user_id == sample_deck.user_id
         assert deck_copy is not sample_deck  # Different instances
+        assert deck_copy.deck_plan is sample_deck.deck_plan  # Shallow copy
 
     def test_deck_copy_with_updates(self, sample_deck):
         """Test deck copying with field updates."""
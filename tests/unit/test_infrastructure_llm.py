@@ -1,68 +1,99 @@
 """Tests for LLM infrastructure layer."""
 
+import asyncio
 import pytest
-import json
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
+from app.infrastructure.llm import client as client_module
 from app.infrastructure.llm.client import LLMClient
-from app.infrastructure.llm.models import DeckPlan, SlideContent
+from app.infrastructure.llm.models import DeckPlan, SlideContent, SlideInfo
+from app.infrastructure.llm.prompts import (
+    DECK_PLAN_PROMPT,
+    SLIDE_CONTENT_PROMPT,
+    SLIDE_UPDATE_PROMPT,
+)
 from app.domain.exceptions import LLMException
-
-
-class TestLLMClient:
-    """Test cases for LLMClient."""
-
-    @pytest.fixture
-    def llm_client(self):
-        """Create LLM client for testing."""
-        return LLMClient()
-
-    @pytest.fixture
-    def mock_openai_response(self):
-        """Mock OpenAI response."""
-        mock_response = Mock()
-        mock_response.content = json.dumps(
-            {
-                "title": "AI in Business",
-                "slides": [
-                    {
-                        "slide_number": 1,
-                        "title": "Introduction",
-                        "type": "title",
-                        "key_points": ["Welcome", "Overview"],
-                        "content_type": "text",
-                        "estimated_duration": 2,
-                    },
-                    {
-                        "slide_number": 2,
-                        "title": "AI Applications",
-                        "type": "content",
-                        "key_points": ["Machine Learning", "Automation"],
-                        "content_type": "text",
-                        "estimated_duration": 3,
-                    },
-                ],
-                "total_slides": 2,
-                "estimated_duration": 5,
-                "target_audience": "Business Leaders",
-            }
-        )
-        return mock_response
-
-    @pytest.fixture
-    def mock_slide_response(self):
-        """Mock slide content response."""
-        mock_response = Mock()
-        mock_response.content = json.dumps(
-            {
-                "title": "Introduction to AI",
-                "content": "AI is transforming business operations",
-                "html_content": "<h1>Introduction to AI</h1><p>AI is transforming business operations</p>",
-                "presenter_notes": "Welcome the audience and introduce the topic",
-                "slide_number": 1,
-            }
-        )
-        return mock_response
+from tests._helpers.async_stubs import aret
+
+_SLIDE_INFO_BASIC = {
+    "slide_number": 1,
+    "title": "Introduction",
+    "type": "title",
+    "key_points": ["Welcome", "Overview"],
+    "content_type": "text",
+}
+_DECK_CTX_BASIC = {
+    "title": "AI Presentation",
+    "topic": "AI in Business",
+    "audience": "Executives",
+}
+
+_DECK_PLAN_VARS = frozenset(DECK_PLAN_PROMPT.input_variables)
+_SLIDE_CONTENT_VARS = frozenset(SLIDE_CONTENT_PROMPT.input_variables)
+_SLIDE_UPDATE_VARS = frozenset(SLIDE_UPDATE_PROMPT.input_variables)
+
+# Return sentinels for the input-mapping tests; validation is not under test
+_EMPTY_DECK_PLAN = DeckPlan.model_construct(
+    title="T", slides=[], total_slides=0, estimated_duration=0, target_audience="A"
+)
+_SLIDE_CONTENT = SlideContent.model_construct(
+    title="t",
+    content="c",
+    html_content="<h1>t</h1>",
+    presenter_notes="n",
+    slide_number=1,
+)
+_UPDATED_SLIDE_CONTENT = SlideContent.model_construct(
+    title="t2",
+    content="c2",
+    html_content="<h1>u</h1>",
+    presenter_notes="n2",
+    slide_number=1,
+)
+
+
+@pytest.fixture(scope="module")
+def llm_client():
+    """Create LLM client for testing, shared across the module."""
+    return LLMClient()
+
+
+@pytest.fixture(autouse=True)
+def _reset_llm_client(llm_client):
+    """Restore the shared client's mutable state before each test."""
+    llm_client.client = None
+    llm_client.max_retries = 3
+    llm_client.base_delay = 1.0
+    # Drop per-test stubs assigned over the instance method
+    vars(llm_client).pop("_invoke_chain_with_retry", None)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Make retry backoff instant for every client test."""
+    monkeypatch.setattr(client_module.asyncio, "sleep", AsyncMock())
+
+
+@pytest.fixture
+def mock_metrics(monkeypatch):
+    """Replace the client module's metrics recorder with a mock."""
+    mock = Mock()
+    monkeypatch.setattr(client_module, "metrics", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_chat_openai(monkeypatch):
+    """Replace the client module's ChatOpenAI class with a mock."""
+    mock = Mock()
+    monkeypatch.setattr(client_module, "ChatOpenAI", mock)
+    return mock
+
+
+class TestLLMClientSync:
+    """Synchronous test cases for LLMClient."""
 
     def test_llm_client_initialization(self, llm_client):
         """Test LLM client initialization."""
@@ -70,19 +101,56 @@ class TestLLMClient:
         assert llm_client.max_retries == 3
         assert llm_client.base_delay == 1.0
 
-    @pytest.mark.asyncio
-    async def test_initialize_success(self, llm_client):
+    @pytest.mark.parametrize(
+        "actual,expected",
+        [
+            (
+                _DECK_PLAN_VARS,
+                frozenset(
+                    {"title", "topic", "audience", "slide_count", "style", "language"}
+                ),
+            ),
+            (
+                _SLIDE_CONTENT_VARS,
+                frozenset(
+                    {
+                        "deck_title",
+                        "deck_topic",
+                        "deck_audience",
+                        "slide_number",
+                        "slide_title",
+                        "slide_type",
+                        "key_points",
+                        "content_type",
+                        "notes_detail",
+                    }
+                ),
+            ),
+            (
+                _SLIDE_UPDATE_VARS,
+                frozenset({"current_content", "update_prompt", "slide_context"}),
+            ),
+        ],
+        ids=["deck_plan", "slide_content", "slide_update"],
+    )
+    def test_prompts_have_expected_placeholders(self, actual, expected):
+        """Ensure prompt variables align with client inputs."""
+        assert actual == expected
+
+
+class TestLLMClientAsync:
+    """Asynchronous test cases for LLMClient."""
+
+    async def test_initialize_success(self, llm_client, mock_chat_openai):
         """Test successful LLM client initialization."""
-        with patch("app.infrastructure.llm.client.ChatOpenAI") as mock_openai:
-            mock_client = Mock()
-            mock_openai.return_value = mock_client
+        mock_client = Mock()
+        mock_chat_openai.return_value = mock_client
 
-            await llm_client.initialize()
+        await llm_client.initialize()
 
-            assert llm_client.client == mock_client
-            mock_openai.assert_called_once()
+        assert llm_client.client == mock_client
+        mock_chat_openai.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_initialize_missing_api_key(self, llm_client):
         """Test initialization without API key."""
         with patch("app.infrastructure.llm.client.settings") as mock_settings:
@@ -91,28 +159,23 @@ class TestLLMClient:
             with pytest.raises(LLMException, match="OpenAI API key not configured"):
                 await llm_client.initialize()
 
-    @pytest.mark.asyncio
-    async def test_initialize_error(self, llm_client):
+    async def test_initialize_error(self, llm_client, mock_chat_openai):
         """Test initialization error handling."""
-        with patch("app.infrastructure.llm.client.ChatOpenAI") as mock_openai:
-            mock_openai.side_effect = Exception("Connection error")
+        mock_chat_openai.side_effect = Exception("Connection error")
 
-            with pytest.raises(LLMException, match="LLM client initialization failed"):
-                await llm_client.initialize()
+        with pytest.raises(LLMException, match="LLM client initialization failed"):
+            await llm_client.initialize()
 
-    @pytest.mark.asyncio
-    async def test_generate_deck_plan_success(self, llm_client, mock_openai_response):
+    async def test_generate_deck_plan_success(self, llm_client, mock_metrics):
         """Test successful deck plan generation."""
         # Mock initialized client
         llm_client.client = Mock()
 
-        from app.infrastructure.llm.models import SlideInfo
-
         # Create a proper DeckPlan object for mocking
-        mock_deck_plan = DeckPlan(
+        mock_deck_plan = DeckPlan.model_construct(
             title="AI in Business",
             slides=[
-                SlideInfo(
+                SlideInfo.model_construct(
                     slide_number=1,
                     title="Introduction",
                     type="title",
@@ -120,7 +183,7 @@ class TestLLMClient:
                     content_type="text",
                     estimated_duration=2,
                 ),
-                SlideInfo(
+                SlideInfo.model_construct(
                     slide_number=2,
                     title="AI Applications",
                     type="content",
@@ -134,17 +197,16 @@ class TestLLMClient:
             target_audience="Business Leaders",
         )
 
-        llm_client._invoke_chain_with_retry = AsyncMock(return_value=mock_deck_plan)
+        llm_client._invoke_chain_with_retry = aret(mock_deck_plan)
 
-        with patch("app.infrastructure.llm.client.metrics") as mock_metrics:
-            plan = await llm_client.generate_deck_plan(
-                title="AI in Business",
-                topic="How AI transforms business",
-                audience="Executives",
-                slide_count=2,
-                style="professional",
-                language="en",
-            )
+        plan = await llm_client.generate_deck_plan(
+            title="AI in Business",
+            topic="How AI transforms business",
+            audience="Executives",
+            slide_count=2,
+            style="professional",
+            language="en",
+        )
 
         assert isinstance(plan, DeckPlan)
         assert plan.title == "AI in Business"
@@ -158,7 +220,6 @@ class TestLLMClient:
         # Verify metrics were recorded
         mock_metrics.record_llm_usage.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_generate_deck_plan_llm_error(self, llm_client):
         """Test deck plan generation with LLM error."""
         llm_client.client = Mock()
@@ -171,43 +232,25 @@ class TestLLMClient:
                 title="Test", topic="Test topic", slide_count=3
             )
 
-    @pytest.mark.asyncio
-    async def test_generate_slide_content_success(
-        self, llm_client, mock_slide_response
-    ):
+    async def test_generate_slide_content_success(self, llm_client, mock_metrics):
         """Test successful slide content generation."""
         llm_client.client = Mock()
         # Return a SlideContent object directly from the retry wrapper
-        expected = SlideContent(
+        expected = SlideContent.model_construct(
             title="Introduction to AI",
             content="AI is transforming business operations",
             html_content="<h1>Introduction to AI</h1><p>AI is transforming business operations</p>",
             presenter_notes="Welcome the audience and introduce the topic",
             slide_number=1,
         )
-        llm_client._invoke_chain_with_retry = AsyncMock(return_value=expected)
-
-        slide_info = {
-            "slide_number": 1,
-            "title": "Introduction",
-            "type": "title",
-            "key_points": ["Welcome", "Overview"],
-            "content_type": "text",
-        }
-
-        deck_context = {
-            "title": "AI Presentation",
-            "topic": "AI in Business",
-            "audience": "Executives",
-        }
-
-        with patch("app.infrastructure.llm.client.metrics") as mock_metrics:
-            content = await llm_client.generate_slide_content(
-                slide_info=slide_info,
-                deck_context=deck_context,
-                slide_number=1,
-                include_speaker_notes=True,
-            )
+        llm_client._invoke_chain_with_retry = aret(expected)
+
+        content = await llm_client.generate_slide_content(
+            slide_info=_SLIDE_INFO_BASIC,
+            deck_context=_DECK_CTX_BASIC,
+            slide_number=1,
+            include_speaker_notes=True,
+        )
 
         assert isinstance(content, SlideContent)
         assert content.title == "Introduction to AI"
@@ -218,20 +261,17 @@ class TestLLMClient:
 
         mock_metrics.record_llm_usage.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_generate_slide_content_without_notes(
-        self, llm_client, mock_slide_response
-    ):
+    async def test_generate_slide_content_without_notes(self, llm_client):
         """Test slide content generation without speaker notes."""
         llm_client.client = Mock()
-        expected = SlideContent(
+        expected = SlideContent.model_construct(
             title="Slide 1",
             content="Content",
             html_content="<h1>Slide</h1>",
             presenter_notes="",
             slide_number=1,
         )
-        llm_client._invoke_chain_with_retry = AsyncMock(return_value=expected)
+        llm_client._invoke_chain_with_retry = aret(expected)
 
         slide_info = {"slide_number": 1, "title": "Test"}
         deck_context = {"title": "Test Deck"}
@@ -245,35 +285,32 @@ class TestLLMClient:
 
         assert isinstance(content, SlideContent)
 
-    @pytest.mark.asyncio
-    async def test_update_slide_content_success(self, llm_client, mock_slide_response):
+    async def test_update_slide_content_success(self, llm_client, mock_metrics):
         """Test successful slide content update."""
         llm_client.client = Mock()
-        expected = SlideContent(
+        expected = SlideContent.model_construct(
             title="Updated",
             content="Updated content",
             html_content="<h1>Updated</h1>",
             presenter_notes="Notes",
             slide_number=1,
         )
-        llm_client._invoke_chain_with_retry = AsyncMock(return_value=expected)
+        llm_client._invoke_chain_with_retry = aret(expected)
 
         current_content = "<h1>Old Title</h1><p>Old content</p>"
         update_prompt = "Make it more engaging"
         slide_context = {"slide_number": 1, "deck_title": "Test Deck"}
 
-        with patch("app.infrastructure.llm.client.metrics") as mock_metrics:
-            updated_content = await llm_client.update_slide_content(
-                current_content=current_content,
-                update_prompt=update_prompt,
-                slide_context=slide_context,
-            )
+        updated_content = await llm_client.update_slide_content(
+            current_content=current_content,
+            update_prompt=update_prompt,
+            slide_context=slide_context,
+        )
 
         assert isinstance(updated_content, SlideContent)
         assert updated_content.title == "Updated"
         mock_metrics.record_llm_usage.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_invoke_chain_with_retry_success(self, llm_client):
         """Test successful chain invoke with retry logic."""
         chain = Mock()
@@ -282,29 +319,24 @@ class TestLLMClient:
         assert result == {"ok": True}
         chain.ainvoke.assert_called_once_with({"x": 1})
 
-    @pytest.mark.asyncio
     async def test_invoke_chain_with_retry_failure_then_success(self, llm_client):
         """Test chain invoke with retry after initial failure."""
         chain = Mock()
         chain.ainvoke = AsyncMock(side_effect=[Exception("Temporary"), {"ok": True}])
         llm_client.max_retries = 2
-        with patch("asyncio.sleep"):
-            result = await llm_client._invoke_chain_with_retry(chain, {"x": 1})
+        result = await llm_client._invoke_chain_with_retry(chain, {"x": 1})
         assert result == {"ok": True}
         assert chain.ainvoke.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_invoke_chain_with_retry_max_failures(self, llm_client):
         """Test chain invoke exceeding max retries."""
         chain = Mock()
         chain.ainvoke = AsyncMock(side_effect=Exception("Persistent"))
         llm_client.max_retries = 2
-        with patch("asyncio.sleep"):
-            with pytest.raises(LLMException):
-                await llm_client._invoke_chain_with_retry(chain, {"x": 1})
+        with pytest.raises(LLMException):
+            await llm_client._invoke_chain_with_retry(chain, {"x": 1})
         assert chain.ainvoke.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_invoke_chain_with_retry_propagates_exceptions(self, llm_client):
         """Test that missing variables or chain errors bubble through retry and wrap."""
         chain = Mock()
@@ -313,151 +345,91 @@ class TestLLMClient:
         with pytest.raises(LLMException):
             await llm_client._invoke_chain_with_retry(chain, {"x": 1})
 
-    def test_prompts_have_expected_placeholders_deck_plan(self):
-        """Ensure deck plan prompt variables align with client inputs."""
-        from app.infrastructure.llm.prompts import DECK_PLAN_PROMPT
-
-        vars_ = set(DECK_PLAN_PROMPT.input_variables)
-        assert vars_ == {
-            "title",
-            "topic",
-            "audience",
-            "slide_count",
-            "style",
-            "language",
-        }
-
-    def test_prompts_have_expected_placeholders_slide_content(self):
-        """Ensure slide content prompt variables align with client inputs."""
-        from app.infrastructure.llm.prompts import SLIDE_CONTENT_PROMPT
-
-        vars_ = set(SLIDE_CONTENT_PROMPT.input_variables)
-        assert vars_ == {
-            "deck_title",
-            "deck_topic",
-            "deck_audience",
-            "slide_number",
-            "slide_title",
-            "slide_type",
-            "key_points",
-            "content_type",
-            "notes_detail",
-        }
-
-    def test_prompts_have_expected_placeholders_slide_update(self):
-        """Ensure slide update prompt variables align with client inputs."""
-        from app.infrastructure.llm.prompts import SLIDE_UPDATE_PROMPT
-
-        vars_ = set(SLIDE_UPDATE_PROMPT.input_variables)
-        assert vars_ == {"current_content", "update_prompt", "slide_context"}
-
-    @pytest.mark.asyncio
-    async def test_generate_deck_plan_passes_expected_inputs(self, llm_client):
-        """Verify input mapping for deck plan generation."""
-        llm_client.client = Mock()
-        llm_client.client.with_structured_output = Mock(return_value=Mock())
-        expected = DeckPlan(
-            title="T",
-            slides=[],
-            total_slides=0,
-            estimated_duration=0,
-            target_audience="A",
-        )
-        with patch.object(
-            llm_client, "_invoke_chain_with_retry", return_value=expected
-        ) as spy:
-            await llm_client.generate_deck_plan(
-                title="T",
-                topic="Top",
-                audience="Aud",
-                slide_count=3,
-                style="pro",
-                language="en",
-            )
-        args, kwargs = spy.call_args
-        input_dict = args[1]
-        assert set(input_dict.keys()) == {
-            "title",
-            "topic",
-            "audience",
-            "slide_count",
-            "style",
-            "language",
-        }
-
-    @pytest.mark.asyncio
-    async def test_generate_slide_content_passes_expected_inputs(self, llm_client):
-        """Verify input mapping for slide content generation."""
-        llm_client.client = Mock()
-        llm_client.client.with_structured_output = Mock(return_value=Mock())
-        expected = SlideContent(
-            title="t",
-            content="c",
-            html_content="<h1>t</h1>",
-            presenter_notes="n",
-            slide_number=1,
-        )
-        with patch.object(
-            llm_client, "_invoke_chain_with_retry", return_value=expected
-        ) as spy:
-            await llm_client.generate_slide_content(
-                slide_info={
-                    "title": "Intro",
-                    "type": "title",
-                    "key_points": ["a", "b"],
+    @pytest.mark.parametrize(
+        "method,expected_kwargs,result,expected_inputs",
+        [
+            (
+                "generate_deck_plan",
+                {
+                    "title": "T",
+                    "topic": "Top",
+                    "audience": "Aud",
+                    "slide_count": 3,
+                    "style": "pro",
+                    "language": "en",
+                },
+                _EMPTY_DECK_PLAN,
+                {
+                    "title": "T",
+                    "topic": "Top",
+                    "audience": "Aud",
+                    "slide_count": 3,
+                    "style": "pro",
+                    "language": "en",
+                },
+            ),
+            (
+                "generate_slide_content",
+                {
+                    "slide_info": {
+                        "title": "Intro",
+                        "type": "title",
+                        "key_points": ["a", "b"],
+                        "content_type": "text",
+                    },
+                    "deck_context": {
+                        "title": "Deck",
+                        "topic": "Topic",
+                        "audience": "People",
+                    },
+                    "slide_number": 1,
+                    "include_speaker_notes": True,
+                },
+                _SLIDE_CONTENT,
+                {
+                    "deck_title": "Deck",
+                    "deck_topic": "Topic",
+                    "deck_audience": "People",
+                    "slide_number": 1,
+                    "slide_title": "Intro",
+                    "slide_type": "title",
+                    "key_points": "a, b",
                     "content_type": "text",
+                    "notes_detail": "detailed",
                 },
-                deck_context={"title": "Deck", "topic": "Topic", "audience": "People"},
-                slide_number=1,
-                include_speaker_notes=True,
-            )
-        args, kwargs = spy.call_args
-        input_dict = args[1]
-        assert set(input_dict.keys()) == {
-            "deck_title",
-            "deck_topic",
-            "deck_audience",
-            "slide_number",
-            "slide_title",
-            "slide_type",
-            "key_points",
-            "content_type",
-            "notes_detail",
-        }
-        assert input_dict["notes_detail"] == "detailed"
-
-    @pytest.mark.asyncio
-    async def test_update_slide_content_passes_expected_inputs(self, llm_client):
-        """Verify input mapping for slide update generation."""
+            ),
+            (
+                "update_slide_content",
+                {
+                    "current_content": "<h1>Old</h1>",
+                    "update_prompt": "Make it better",
+                    "slide_context": {"x": 1},
+                },
+                _UPDATED_SLIDE_CONTENT,
+                {
+                    "current_content": "<h1>Old</h1>",
+                    "update_prompt": "Make it better",
+                    "slide_context": "{'x': 1}",
+                },
+            ),
+        ],
+        ids=["deck_plan", "slide_content", "slide_update"],
+    )
+    async def test_passes_expected_inputs(
+        self, llm_client, method, expected_kwargs, result, expected_inputs
+    ):
+        """Verify input mapping from client arguments to prompt variables."""
         llm_client.client = Mock()
         llm_client.client.with_structured_output = Mock(return_value=Mock())
-        expected = SlideContent(
-            title="t2",
-            content="c2",
-            html_content="<h1>u</h1>",
-            presenter_notes="n2",
-            slide_number=1,
-        )
         with patch.object(
-            llm_client, "_invoke_chain_with_retry", return_value=expected
+            llm_client, "_invoke_chain_with_retry", return_value=result
         ) as spy:
-            await llm_client.update_slide_content(
-                current_content="<h1>Old</h1>",
-                update_prompt="Make it better",
-                slide_context={"x": 1},
-            )
-        args, kwargs = spy.call_args
-        input_dict = args[1]
-        assert set(input_dict.keys()) == {
-            "current_content",
-            "update_prompt",
-            "slide_context",
-        }
+            await getattr(llm_client, method)(**expected_kwargs)
+        assert spy.call_args.args[1] == expected_inputs
 
     # Prompt string construction unit tests have been replaced by placeholder
     # assertions and input mapping checks above, which align with structured outputs.
 
-    @pytest.mark.asyncio
     async def test_close_client(self, llm_client):
         """Test client closing."""
         # Should not raise any exceptions
@@ -469,8 +441,6 @@ class TestDeckPlan:
 
     def test_deck_plan_creation(self):
         """Test DeckPlan creation."""
-        from app.infrastructure.llm.models import SlideInfo
-
         slides = [
             SlideInfo(
                 slide_number=1,
@@ -504,8 +474,8 @@ class TestDeckPlan:
         assert plan.estimated_duration == 5
         assert plan.target_audience == "Developers"
 
-    def test_deck_plan_dict(self):
-        """Test DeckPlan dict conversion."""
+    def test_deck_plan_fields(self):
+        """Test DeckPlan exposes the expected fields."""
         plan = DeckPlan(
             title="Test Deck",
             slides=[],
@@ -514,13 +484,14 @@ class TestDeckPlan:
             target_audience="Test",
         )
 
-        plan_dict = plan.model_dump()
-
-        assert plan_dict["title"] == "Test Deck"
-        assert "slides" in plan_dict
-        assert "total_slides" in plan_dict
-        assert "estimated_duration" in plan_dict
-        assert "target_audience" in plan_dict
+        assert plan.title == "Test Deck"
+        assert {
+            "title",
+            "slides",
+            "total_slides",
+            "estimated_duration",
+            "target_audience",
+        } <= DeckPlan.model_fields.keys()
 
 
 class TestSlideContent:
@@ -559,3 +530,32 @@ class TestSlideContent:
         assert "html_content" in content_dict
         assert "presenter_notes" in content_dict
         assert "slide_number" in content_dict
+
+
+class TestLLMClientBenchmarks:
+    """Micro-benchmarks for LLMClient, deselected by default (-m benchmark)."""
+
+    @pytest.mark.benchmark(group="llm")
+    def test_bench_invoke_retry_success(self, benchmark, llm_client):
+        """Benchmark a retry round trip: one failed attempt, then success."""
+        calls = 0
+
+        async def flaky_ainvoke(input_data):
+            nonlocal calls
+            calls += 1
+            if calls % 2:
+                raise Exception("Temporary")
+            return {"ok": True}
+
+        chain = SimpleNamespace(ainvoke=flaky_ainvoke)
+        loop = asyncio.new_event_loop()
+        try:
+            result = benchmark(
+                lambda: loop.run_until_complete(
+                    llm_client._invoke_chain_with_retry(chain, {"x": 1})
+                )
+            )
+        finally:
+            loop.close()
+
+        assert result == {"ok": True}
@@ -1,23 +1,128 @@
 """Unit tests for Redis infrastructure components."""
 
+import asyncio
 import json
+import orjson
 import pytest
-from datetime import datetime
+import fakeredis
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
 from redis.exceptions import RedisError, ResponseError
 
 from app.api.schemas import Event
 from app.core.config import settings
+from app.core.observability import metrics
 from app.domain.exceptions import MessagingException
+from app.infrastructure.messaging import redis_client as redis_client_module
 from app.infrastructure.messaging.redis_client import (
     RedisClient,
     RedisStreamPublisher,
     RedisStreamConsumer,
     RedisPubSubManager,
     RedisCacheManager,
+    _cancel_key,
+    _deck_channel,
 )
+from tests._helpers.async_stubs import aiter_of, araise
+
+# Fixed ID for tests that only format keys/channels from it
+TEST_DECK_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+@pytest.fixture(scope="module")
+def fake_redis_server():
+    """In-process Redis server shared by the module."""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+async def fake_redis(fake_redis_server):
+    """FakeRedis connection on the shared server, decoding like the real pool.
+
+    Connections bind to the running event loop, so only the server is shared.
+    """
+    client = fakeredis.aioredis.FakeRedis(
+        server=fake_redis_server, decode_responses=True
+    )
+    yield client
+    await client.flushall()
+    await client.aclose()
+
+
+@pytest.fixture
+def redis_backend(fake_redis):
+    """RedisClient wired to the FakeRedis connection."""
+    client = RedisClient("redis://localhost:6379/0")
+    client.redis_client = fake_redis
+    return client
+
+
+@pytest.fixture
+def mock_redis_client():
+    """Create mock Redis client for fault-injection tests."""
+    client = Mock()
+    mock_redis = AsyncMock(spec=Redis)
+    client.get_client.return_value = mock_redis
+    return client, mock_redis
+
+
+@pytest.fixture
+def stream_publisher(mock_redis_client):
+    """Create stream publisher with mock."""
+    client, _ = mock_redis_client
+    return RedisStreamPublisher(client)
+
+
+@pytest.fixture
+def stream_consumer(mock_redis_client):
+    """Create stream consumer with mock."""
+    client, _ = mock_redis_client
+    return RedisStreamConsumer(client, "test-group", "test-consumer")
+
+
+@pytest.fixture
+def pubsub_manager(mock_redis_client):
+    """Create pubsub manager with mock."""
+    client, _ = mock_redis_client
+    return RedisPubSubManager(client)
+
+
+@pytest.fixture
+def cache_manager(mock_redis_client):
+    """Create cache manager with mock."""
+    client, _ = mock_redis_client
+    return RedisCacheManager(client)
+
+
+@pytest.fixture(autouse=True)
+def mock_metrics(monkeypatch):
+    """Replace the Redis metrics recorder with a mock for every test."""
+    mock = Mock()
+    monkeypatch.setattr(metrics, "record_redis_operation", mock)
+    return mock
+
+
+async def test_uvloop_in_use():
+    """Test async Redis tests run on the uvloop event loop."""
+    pytest.importorskip("uvloop")
+    assert type(asyncio.get_running_loop()).__module__.startswith("uvloop")
+
+
+def test_deck_keys_are_formatted_and_cached():
+    """Test channel and cancellation key helpers reuse the cached string."""
+    deck_id = TEST_DECK_ID
+
+    channel = _deck_channel(settings.redis_pubsub_key, deck_id)
+    assert channel == f"{settings.redis_pubsub_key}:deck:{deck_id}"
+    assert _deck_channel(settings.redis_pubsub_key, deck_id) is channel
+
+    key = _cancel_key(deck_id)
+    assert key == f"cancel:deck:{deck_id}"
+    assert _cancel_key(deck_id) is key
 
 
 class TestRedisClient:
@@ -28,28 +133,40 @@ class TestRedisClient:
         """Create Redis client instance."""
         return RedisClient("redis://localhost:6379/0")
 
-    @pytest.mark.asyncio
-    async def test_initialize_success(self, redis_client):
-        """Test successful Redis initialization."""
-        mock_pool = Mock()
+    @pytest.fixture
+    def patched_redis(self, monkeypatch):
+        """Stub pool construction and the Redis class used by initialize()."""
+        from_url = Mock(return_value=Mock())
         mock_redis = AsyncMock()
-        mock_redis.ping = AsyncMock()
+        monkeypatch.setattr(
+            redis_client_module.redis.ConnectionPool, "from_url", from_url
+        )
+        monkeypatch.setattr(redis_client_module, "Redis", Mock(return_value=mock_redis))
+        return from_url, mock_redis
 
-        with (
-            patch("redis.asyncio.ConnectionPool.from_url", return_value=mock_pool),
-            patch(
-                "app.infrastructure.messaging.redis_client.Redis",
-                return_value=mock_redis,
-            ),
-        ):
+    async def test_initialize_success(self, redis_client, patched_redis):
+        """Test successful Redis initialization."""
+        from_url, mock_redis = patched_redis
+
+        await redis_client.initialize()
 
-            await redis_client.initialize()
+        assert redis_client.pool is from_url.return_value
+        assert redis_client.redis_client is mock_redis
+        mock_redis.ping.assert_awaited_once()
 
-            assert redis_client.pool == mock_pool
-            assert redis_client.redis_client == mock_redis
-            mock_redis.ping.assert_called_once()
+    async def test_initialize_uses_configured_pool_size(
+        self, redis_client, patched_redis
+    ):
+        """Test the pool is built with the configured size and decoding."""
+        from_url, _ = patched_redis
+
+        await redis_client.initialize()
+
+        from_url.assert_called_once()
+        assert from_url.call_args.args == ("redis://localhost:6379/0",)
+        assert from_url.call_args.kwargs["max_connections"] == 64
+        assert from_url.call_args.kwargs["decode_responses"] is True
 
-    @pytest.mark.asyncio
     async def test_initialize_connection_failure(self, redis_client):
         """Test Redis initialization with connection failure."""
         with patch(
@@ -62,7 +179,6 @@ class TestRedisClient:
 
             assert "Redis initialization failed" in str(exc.value)
 
-    @pytest.mark.asyncio
     async def test_close(self, redis_client):
         """Test closing Redis connection."""
         mock_redis = AsyncMock()
@@ -72,11 +188,9 @@ class TestRedisClient:
 
         mock_redis.aclose.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_health_check_success(self, redis_client):
         """Test successful health check."""
         mock_redis = AsyncMock()
-        mock_redis.ping = AsyncMock()
         redis_client.redis_client = mock_redis
 
         result = await redis_client.health_check()
@@ -84,17 +198,15 @@ class TestRedisClient:
         assert result is True
         mock_redis.ping.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_health_check_no_client(self, redis_client):
         """Test health check with no client."""
         result = await redis_client.health_check()
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_health_check_ping_failure(self, redis_client):
         """Test health check with ping failure."""
         mock_redis = AsyncMock()
-        mock_redis.ping = AsyncMock(side_effect=RedisError("Connection lost"))
+        mock_redis.ping = araise(RedisError("Connection lost"))
         redis_client.redis_client = mock_redis
 
         result = await redis_client.health_check()
@@ -121,21 +233,7 @@ class TestRedisClient:
 class TestRedisStreamPublisher:
     """Test cases for RedisStreamPublisher."""
 
-    @pytest.fixture
-    def mock_redis_client(self):
-        """Create mock Redis client."""
-        client = Mock()
-        mock_redis = AsyncMock()
-        client.get_client.return_value = mock_redis
-        return client, mock_redis
-
-    @pytest.fixture
-    def stream_publisher(self, mock_redis_client):
-        """Create stream publisher with mock."""
-        client, _ = mock_redis_client
-        return RedisStreamPublisher(client)
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_event(self):
         """Create sample event."""
         return Event(
@@ -146,115 +244,281 @@ class TestRedisStreamPublisher:
             payload={"title": "Test Deck"},
         )
 
-    @pytest.mark.asyncio
+    @pytest.fixture(scope="module")
+    def sample_event_payload(self, sample_event):
+        """Stream field encoding of the sample event payload, computed once."""
+        return orjson.dumps(sample_event.payload).decode()
+
     async def test_publish_event_success(
-        self, stream_publisher, mock_redis_client, sample_event
+        self,
+        redis_backend,
+        fake_redis,
+        sample_event,
+        sample_event_payload,
+        mock_metrics,
     ):
         """Test successful event publishing."""
-        _, mock_redis = mock_redis_client
-        mock_redis.xadd = AsyncMock(return_value="1234567890-0")
+        stream_publisher = RedisStreamPublisher(redis_backend)
 
-        with patch(
-            "app.core.observability.metrics.record_redis_operation"
-        ) as mock_metrics:
-            stream_id = await stream_publisher.publish_event(sample_event)
-
-        assert stream_id == "1234567890-0"
-        mock_redis.xadd.assert_called_once()
+        stream_id = await stream_publisher.publish_event(sample_event)
 
-        # Check xadd was called with correct data
-        call_args = mock_redis.xadd.call_args
-        assert call_args[0][0] == settings.redis_stream_key
-        event_data = call_args[0][1]
+        entries = await fake_redis.xrange(settings.redis_stream_key)
+        assert [entry_id for entry_id, _ in entries] == [stream_id]
 
+        event_data = entries[0][1]
         assert event_data["event_type"] == "DeckStarted"
         assert event_data["deck_id"] == str(sample_event.deck_id)
         assert event_data["version"] == "1"
-        assert json.loads(event_data["payload"]) == {"title": "Test Deck"}
+        assert event_data["payload"] == sample_event_payload
 
         mock_metrics.assert_called_with("stream_publish", "success")
 
-    @pytest.mark.asyncio
+    async def test_publish_event_applies_maxlen(
+        self, redis_backend, fake_redis, sample_event
+    ):
+        """Test every XADD trims the stream with approximate MAXLEN."""
+        stream_publisher = RedisStreamPublisher(redis_backend)
+
+        with patch.object(fake_redis, "xadd", wraps=fake_redis.xadd) as xadd_spy:
+            await stream_publisher.publish_event(sample_event)
+
+        assert stream_publisher.maxlen == settings.redis_stream_maxlen == 100_000
+        assert xadd_spy.call_args.kwargs["maxlen"] == 100_000
+        assert xadd_spy.call_args.kwargs["approximate"] is True
+
     async def test_publish_event_redis_error(
-        self, stream_publisher, mock_redis_client, sample_event
+        self, stream_publisher, mock_redis_client, sample_event, mock_metrics
     ):
         """Test event publishing with Redis error."""
         _, mock_redis = mock_redis_client
-        mock_redis.xadd = AsyncMock(side_effect=RedisError("Stream error"))
+        mock_redis.xadd = araise(RedisError("Stream error"))
 
-        with patch(
-            "app.core.observability.metrics.record_redis_operation"
-        ) as mock_metrics:
-            with pytest.raises(MessagingException) as exc:
-                await stream_publisher.publish_event(sample_event)
+        with pytest.raises(MessagingException) as exc:
+            await stream_publisher.publish_event(sample_event)
 
         assert "Stream publish failed" in str(exc.value)
         mock_metrics.assert_called_with("stream_publish", "error")
 
+    async def test_publish_events_pipelined(
+        self, redis_backend, fake_redis, sample_event, mock_metrics
+    ):
+        """Test batch publishing coalesces XADDs into one pipeline execute."""
+        stream_publisher = RedisStreamPublisher(redis_backend)
+        events = [sample_event.model_copy(update={"version": v}) for v in (1, 2, 3)]
 
-class TestRedisStreamConsumer:
-    """Test cases for RedisStreamConsumer."""
+        with patch.object(
+            fake_redis, "pipeline", wraps=fake_redis.pipeline
+        ) as pipeline_spy:
+            stream_ids = await stream_publisher.publish_events(events)
 
-    @pytest.fixture
-    def mock_redis_client(self):
-        """Create mock Redis client."""
-        client = Mock()
-        mock_redis = AsyncMock()
-        client.get_client.return_value = mock_redis
-        return client, mock_redis
+        pipeline_spy.assert_called_once_with(transaction=False)
+        entries = await fake_redis.xrange(settings.redis_stream_key)
+        assert [entry_id for entry_id, _ in entries] == stream_ids
+        assert [fields["version"] for _, fields in entries] == ["1", "2", "3"]
+        mock_metrics.assert_called_with("stream_publish_batch", "success")
 
-    @pytest.fixture
-    def stream_consumer(self, mock_redis_client):
-        """Create stream consumer with mock."""
-        client, _ = mock_redis_client
-        return RedisStreamConsumer(client, "test-group", "test-consumer")
+    async def test_publish_events_empty(self, redis_backend, fake_redis):
+        """Test batch publishing with no events writes nothing."""
+        stream_publisher = RedisStreamPublisher(redis_backend)
 
-    @pytest.mark.asyncio
-    async def test_create_consumer_group_success(
-        self, stream_consumer, mock_redis_client
-    ):
+        assert await stream_publisher.publish_events([]) == []
+        assert await fake_redis.exists(settings.redis_stream_key) == 0
+
+
+class TestRedisStreamConsumer:
+    """Test cases for RedisStreamConsumer."""
+
+    async def test_create_consumer_group_success(self, redis_backend, fake_redis):
         """Test successful consumer group creation."""
-        _, mock_redis = mock_redis_client
-        mock_redis.xgroup_create = AsyncMock()
+        stream_consumer = RedisStreamConsumer(
+            redis_backend, "test-group", "test-consumer"
+        )
 
         await stream_consumer.create_consumer_group()
 
-        mock_redis.xgroup_create.assert_called_once_with(
-            name=settings.redis_stream_key,
-            groupname="test-group",
-            id="0",
-            mkstream=True,
-        )
+        groups = await fake_redis.xinfo_groups(settings.redis_stream_key)
+        assert [group["name"] for group in groups] == ["test-group"]
 
-    @pytest.mark.asyncio
-    async def test_create_consumer_group_already_exists(
-        self, stream_consumer, mock_redis_client
-    ):
+    async def test_create_consumer_group_already_exists(self, redis_backend):
         """Test consumer group creation when group already exists."""
-        _, mock_redis = mock_redis_client
-        mock_redis.xgroup_create = AsyncMock(
-            side_effect=ResponseError("BUSYGROUP Consumer group already exists")
+        stream_consumer = RedisStreamConsumer(
+            redis_backend, "test-group", "test-consumer"
         )
+        await stream_consumer.create_consumer_group()
 
         # Should not raise exception
         await stream_consumer.create_consumer_group()
 
-    @pytest.mark.asyncio
     async def test_create_consumer_group_other_error(
         self, stream_consumer, mock_redis_client
     ):
         """Test consumer group creation with other error."""
         _, mock_redis = mock_redis_client
-        mock_redis.xgroup_create = AsyncMock(side_effect=ResponseError("Other error"))
+        mock_redis.xgroup_create = araise(ResponseError("Other error"))
 
         with pytest.raises(MessagingException) as exc:
             await stream_consumer.create_consumer_group()
 
         assert "Failed to create consumer group" in str(exc.value)
 
+    async def test_consume_batch_reads_and_acks_in_bulk(
+        self, redis_backend, fake_redis, mock_metrics
+    ):
+        """Test one XREADGROUP fetches the batch and one XACK settles it."""
+        publisher = RedisStreamPublisher(redis_backend)
+        consumer = RedisStreamConsumer(redis_backend, "test-group", "test-consumer")
+        await consumer.create_consumer_group()
+        deck_id = TEST_DECK_ID
+        await publisher.publish_events(
+            [
+                Event(event_type="SlideAdded", deck_id=deck_id, version=v)
+                for v in range(64)
+            ]
+        )
+
+        with (
+            patch.object(
+                fake_redis, "xreadgroup", wraps=fake_redis.xreadgroup
+            ) as read_spy,
+            patch.object(fake_redis, "xack", wraps=fake_redis.xack) as ack_spy,
+        ):
+            batch = await consumer.consume_batch(count=64, block_ms=10)
+            acked = await consumer.ack_batch([message_id for message_id, _ in batch])
+
+        assert [event.version for _, event in batch] == list(range(64))
+        assert all(event.deck_id == deck_id for _, event in batch)
+        read_spy.assert_called_once()
+        ack_spy.assert_called_once()
+        assert acked == 64
+        pending = await fake_redis.xpending(settings.redis_stream_key, "test-group")
+        assert pending["pending"] == 0
+
+    async def test_consume_batch_acks_unparsable_messages(
+        self, redis_backend, fake_redis, mock_metrics
+    ):
+        """Test a malformed entry is skipped and acked without dropping the rest."""
+        consumer = RedisStreamConsumer(redis_backend, "test-group", "test-consumer")
+        await consumer.create_consumer_group()
+        await fake_redis.xadd(settings.redis_stream_key, {"event_type": "Broken"})
+        await RedisStreamPublisher(redis_backend).publish_event(
+            Event(event_type="DeckStarted", deck_id=TEST_DECK_ID, version=1)
+        )
+
+        batch = await consumer.consume_batch(count=10, block_ms=10)
+
+        assert [event.event_type for _, event in batch] == ["DeckStarted"]
+        mock_metrics.assert_any_call("stream_consume", "error")
+        pending = await fake_redis.xpending(settings.redis_stream_key, "test-group")
+        assert pending["pending"] == 1
+
+    async def test_consume_events_replays_past_unparsable_pending_page(
+        self, redis_backend, fake_redis
+    ):
+        """Test a pending page with nothing parsable does not end the replay."""
+        consumer = RedisStreamConsumer(redis_backend, "test-group", "test-consumer")
+        await consumer.create_consumer_group()
+        stream_key = settings.redis_stream_key
+        await fake_redis.xadd(stream_key, {"event_type": "Broken"})
+        trimmed_id = await fake_redis.xadd(stream_key, {"event_type": "Trimmed"})
+        await RedisStreamPublisher(redis_backend).publish_events(
+            [
+                Event(event_type="SlideAdded", deck_id=TEST_DECK_ID, version=v)
+                for v in (1, 2)
+            ]
+        )
+        # Deliver everything without acking, as if the consumer had crashed
+        await fake_redis.xreadgroup(
+            "test-group", "test-consumer", {stream_key: ">"}, count=10
+        )
+        await fake_redis.xdel(stream_key, trimmed_id)
+
+        replayed = []
+        done = asyncio.Event()
+
+        async def recording_handler(event):
+            replayed.append(event.version)
+            if len(replayed) == 2:
+                done.set()
+
+        task = asyncio.create_task(
+            consumer.consume_events(recording_handler, batch_size=2, block_ms=10)
+        )
+        async with asyncio.timeout(2):
+            await done.wait()
+            while (await fake_redis.xpending(stream_key, "test-group"))["pending"]:
+                await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert replayed == [1, 2]
+
+    async def test_consume_events_redelivers_after_cancel_mid_batch(
+        self, redis_backend, fake_redis
+    ):
+        """Test a batch cut short acks what ran and replays the rest on restart."""
+        consumer = RedisStreamConsumer(redis_backend, "test-group", "test-consumer")
+        await RedisStreamPublisher(redis_backend).publish_events(
+            [
+                Event(event_type="SlideAdded", deck_id=TEST_DECK_ID, version=v)
+                for v in (1, 2, 3)
+            ]
+        )
+
+        stalled = asyncio.Event()
+
+        async def stalling_handler(event):
+            if event.version == 2:
+                stalled.set()
+                await asyncio.Event().wait()
+
+        task = asyncio.create_task(
+            consumer.consume_events(stalling_handler, block_ms=10)
+        )
+        async with asyncio.timeout(2):
+            await stalled.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # The handled message was acked despite the cancellation
+        pending = await fake_redis.xpending(settings.redis_stream_key, "test-group")
+        assert pending["pending"] == 2
+
+        replayed = []
+        done = asyncio.Event()
+
+        async def recording_handler(event):
+            replayed.append(event.version)
+            if len(replayed) == 2:
+                done.set()
+
+        task = asyncio.create_task(
+            consumer.consume_events(recording_handler, block_ms=10)
+        )
+        async with asyncio.timeout(2):
+            await done.wait()
+            # The replayed batch is acked once its last handler returns
+            while (await fake_redis.xpending(settings.redis_stream_key, "test-group"))[
+                "pending"
+            ]:
+                await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert replayed == [2, 3]
+
+    async def test_ack_batch_empty(self, stream_consumer, mock_redis_client):
+        """Test acknowledging nothing skips the XACK round trip."""
+        _, mock_redis = mock_redis_client
+
+        assert await stream_consumer.ack_batch([]) == 0
+        mock_redis.xack.assert_not_called()
+
     def test_parse_event(self, stream_consumer):
         """Test event parsing from Redis fields."""
-        deck_id = uuid4()
+        deck_id = TEST_DECK_ID
         fields = {
             "event_type": "DeckStarted",
             "deck_id": str(deck_id),
@@ -271,9 +535,85 @@ class TestRedisStreamConsumer:
         assert event.timestamp.isoformat().startswith("2024-01-01T00:00:00")
         assert event.payload == {"title": "Test Deck"}
 
+    @pytest.mark.parametrize("n", [1, 10, 100])
+    def test_parse_event_matches_validated_event(self, stream_consumer, n):
+        """Test fast-path parsing matches full validation across many entries."""
+        base = datetime(2024, 1, 1)
+        fields_list = [
+            {
+                "event_type": "SlideUpdated",
+                "deck_id": str(uuid4()),
+                "version": str(i),
+                "timestamp": (base + timedelta(seconds=i)).isoformat(),
+                "payload": orjson.dumps({"slide": i}).decode(),
+            }
+            for i in range(n)
+        ]
+
+        parsed = [stream_consumer._parse_event(fields) for fields in fields_list]
+
+        assert parsed == [
+            Event(
+                event_type=fields["event_type"],
+                deck_id=fields["deck_id"],
+                version=fields["version"],
+                timestamp=fields["timestamp"],
+                payload=orjson.loads(fields["payload"]),
+            )
+            for fields in fields_list
+        ]
+
+    @pytest.mark.benchmark(group="redis-parse")
+    def test_parse_event_perf(self, benchmark, stream_consumer):
+        """Benchmark the per-message stream parse hot path."""
+        fields = {
+            "event_type": "SlideUpdated",
+            "deck_id": str(TEST_DECK_ID),
+            "version": "3",
+            "timestamp": "2024-01-01T00:00:00",
+            "payload": '{"slide_id": "123", "status": "completed"}',
+        }
+
+        event = benchmark.pedantic(
+            stream_consumer._parse_event, args=(fields,), rounds=10, iterations=1000
+        )
+
+        assert event.version == 3
+
+    def test_parse_event_rejects_unknown_event_type(self, stream_consumer):
+        """Test the fast path still enforces the EventType literal."""
+        fields = {
+            "event_type": "DeckExploded",
+            "deck_id": str(TEST_DECK_ID),
+            "version": "1",
+            "timestamp": "2024-01-01T00:00:00",
+        }
+
+        with pytest.raises(ValueError, match="DeckExploded"):
+            stream_consumer._parse_event(fields)
+
+    async def test_consume_batch_skips_unknown_event_type(
+        self, redis_backend, fake_redis, mock_metrics
+    ):
+        """Test an entry with an unknown event_type never reaches callers."""
+        consumer = RedisStreamConsumer(redis_backend, "test-group", "test-consumer")
+        await consumer.create_consumer_group()
+        await fake_redis.xadd(
+            settings.redis_stream_key,
+            {
+                "event_type": "DeckExploded",
+                "deck_id": str(TEST_DECK_ID),
+                "version": "1",
+                "timestamp": "2024-01-01T00:00:00",
+            },
+        )
+
+        assert await consumer.consume_batch(count=10, block_ms=10) == []
+        mock_metrics.assert_any_call("stream_consume", "error")
+
     def test_parse_event_no_payload(self, stream_consumer):
         """Test event parsing without payload."""
-        deck_id = uuid4()
+        deck_id = TEST_DECK_ID
         fields = {
             "event_type": "DeckStarted",
             "deck_id": str(deck_id),
@@ -289,21 +629,7 @@ class TestRedisStreamConsumer:
 class TestRedisPubSubManager:
     """Test cases for RedisPubSubManager."""
 
-    @pytest.fixture
-    def mock_redis_client(self):
-        """Create mock Redis client."""
-        client = Mock()
-        mock_redis = AsyncMock()
-        client.get_client.return_value = mock_redis
-        return client, mock_redis
-
-    @pytest.fixture
-    def pubsub_manager(self, mock_redis_client):
-        """Create pubsub manager with mock."""
-        client, _ = mock_redis_client
-        return RedisPubSubManager(client)
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_event(self):
         """Create sample event."""
         return Event(
@@ -314,56 +640,54 @@ class TestRedisPubSubManager:
             payload={"slide_id": "123", "status": "completed"},
         )
 
-    @pytest.mark.asyncio
     async def test_publish_to_deck_channel_success(
-        self, pubsub_manager, mock_redis_client, sample_event
+        self, redis_backend, fake_redis, sample_event, mock_metrics
     ):
         """Test successful publishing to deck channel."""
-        _, mock_redis = mock_redis_client
-        mock_redis.publish = AsyncMock()
+        pubsub_manager = RedisPubSubManager(redis_backend)
+        expected_channel = f"{settings.redis_pubsub_key}:deck:{sample_event.deck_id}"
+        listener = fake_redis.pubsub()
+        await listener.subscribe(expected_channel)
 
-        with patch(
-            "app.core.observability.metrics.record_redis_operation"
-        ) as mock_metrics:
+        try:
             await pubsub_manager.publish_to_deck_channel(
                 sample_event.deck_id, sample_event
             )
+            # The first read may only consume the subscribe confirmation
+            for _ in range(3):
+                message = await listener.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if message is not None:
+                    break
+        finally:
+            await listener.aclose()
 
-        # Verify publish was called
-        mock_redis.publish.assert_called_once()
-        call_args = mock_redis.publish.call_args
-
-        expected_channel = f"{settings.redis_pubsub_key}:deck:{sample_event.deck_id}"
-        assert call_args[0][0] == expected_channel
+        assert message["channel"] == expected_channel
 
         # Parse the published data
-        published_data = json.loads(call_args[0][1])
+        published_data = orjson.loads(message["data"])
         assert published_data["event_type"] == "SlideUpdated"
         assert published_data["deck_id"] == str(sample_event.deck_id)
         assert published_data["version"] == 2
 
         mock_metrics.assert_called_with("pubsub_publish", "success")
 
-    @pytest.mark.asyncio
     async def test_publish_to_deck_channel_redis_error(
-        self, pubsub_manager, mock_redis_client, sample_event
+        self, pubsub_manager, mock_redis_client, sample_event, mock_metrics
     ):
         """Test publishing with Redis error."""
         _, mock_redis = mock_redis_client
-        mock_redis.publish = AsyncMock(side_effect=RedisError("Publish failed"))
+        mock_redis.publish = araise(RedisError("Publish failed"))
 
-        with patch(
-            "app.core.observability.metrics.record_redis_operation"
-        ) as mock_metrics:
-            with pytest.raises(MessagingException) as exc:
-                await pubsub_manager.publish_to_deck_channel(
-                    sample_event.deck_id, sample_event
-                )
+        with pytest.raises(MessagingException) as exc:
+            await pubsub_manager.publish_to_deck_channel(
+                sample_event.deck_id, sample_event
+            )
 
         assert "Channel publish failed" in str(exc.value)
         mock_metrics.assert_called_with("pubsub_publish", "error")
 
-    @pytest.mark.asyncio
     async def test_subscribe_to_deck_channel_success(
         self, pubsub_manager, mock_redis_client, sample_event
     ):
@@ -371,7 +695,7 @@ class TestRedisPubSubManager:
         _, mock_redis = mock_redis_client
 
         # Mock pubsub behavior
-        mock_pubsub = AsyncMock()
+        mock_pubsub = AsyncMock(spec=PubSub)
         mock_redis.pubsub.return_value = mock_pubsub
 
         # Create mock message
@@ -385,11 +709,7 @@ class TestRedisPubSubManager:
 
         mock_message = {"type": "message", "data": json.dumps(event_data)}
 
-        # Mock async iterator
-        async def mock_listen():
-            yield mock_message
-
-        mock_pubsub.listen.return_value = mock_listen()
+        mock_pubsub.listen.return_value = aiter_of(mock_message)
 
         # Test subscription
         events = []
@@ -404,12 +724,71 @@ class TestRedisPubSubManager:
         assert event.event_type == sample_event.event_type
         assert event.deck_id == sample_event.deck_id
         assert event.version == sample_event.version
+        assert event == sample_event
 
         # Verify pubsub subscribe was called
         expected_channel = f"{settings.redis_pubsub_key}:deck:{sample_event.deck_id}"
         mock_pubsub.subscribe.assert_called_once_with(expected_channel)
 
-    @pytest.mark.asyncio
+    async def test_subscribe_skips_unknown_event_type(
+        self, pubsub_manager, mock_redis_client, sample_event
+    ):
+        """Test a message with an unknown event_type is dropped, not yielded."""
+        _, mock_redis = mock_redis_client
+        mock_pubsub = AsyncMock(spec=PubSub)
+        mock_redis.pubsub.return_value = mock_pubsub
+        event_data = {
+            "deck_id": str(sample_event.deck_id),
+            "version": sample_event.version,
+            "timestamp": sample_event.timestamp.isoformat(),
+        }
+        mock_pubsub.listen.return_value = aiter_of(
+            {
+                "type": "message",
+                "data": json.dumps({**event_data, "event_type": "DeckExploded"}),
+            },
+            {
+                "type": "message",
+                "data": json.dumps({**event_data, "event_type": "DeckStarted"}),
+            },
+        )
+
+        async for event in pubsub_manager.subscribe_to_deck_channel(
+            sample_event.deck_id
+        ):
+            break
+
+        assert event.event_type == "DeckStarted"
+
+    async def test_subscribe_to_all_deck_channels(self, redis_backend, sample_event):
+        """Test one pattern subscription receives events for every deck."""
+        pubsub_manager = RedisPubSubManager(redis_backend)
+        other_event = sample_event.model_copy(update={"deck_id": uuid4()})
+        stream = pubsub_manager.subscribe_to_all_deck_channels()
+
+        async def publish():
+            # Give the subscriber a moment to register its pattern
+            await asyncio.sleep(0.05)
+            for event in (sample_event, other_event):
+                await pubsub_manager.publish_to_deck_channel(event.deck_id, event)
+
+        publisher = asyncio.create_task(publish())
+        received = []
+        try:
+            async with asyncio.timeout(2):
+                async for event in stream:
+                    received.append(event)
+                    if len(received) == 2:
+                        break
+        finally:
+            await stream.aclose()
+            await publisher
+
+        assert [e.deck_id for e in received] == [
+            sample_event.deck_id,
+            other_event.deck_id,
+        ]
+
     async def test_subscribe_to_deck_channel_redis_error(
         self, pubsub_manager, mock_redis_client, sample_event
     ):
@@ -429,267 +808,183 @@ class TestRedisPubSubManager:
 class TestRedisCacheManager:
     """Test cases for RedisCacheManager."""
 
-    @pytest.fixture
-    def mock_redis_client(self):
-        """Create mock Redis client."""
-        client = Mock()
-        mock_redis = AsyncMock()
-        client.get_client.return_value = mock_redis
-        return client, mock_redis
-
-    @pytest.fixture
-    def cache_manager(self, mock_redis_client):
-        """Create cache manager with mock."""
-        client, _ = mock_redis_client
-        return RedisCacheManager(client)
-
-    @pytest.mark.asyncio
     async def test_set_cancellation_flag_success(
-        self, cache_manager, mock_redis_client
+        self, redis_backend, fake_redis, mock_metrics
     ):
         """Test successful cancellation flag setting."""
-        _, mock_redis = mock_redis_client
-        mock_redis.set = AsyncMock()
-
-        deck_id = uuid4()
+        cache_manager = RedisCacheManager(redis_backend)
+        deck_id = TEST_DECK_ID
 
-        with patch(
-            "app.core.observability.metrics.record_redis_operation"
-        ) as mock_metrics:
-            await cache_manager.set_cancellation_flag(deck_id, ttl=1800)
+        await cache_manager.set_cancellation_flag(deck_id, ttl=1800)
 
         expected_key = f"cancel:deck:{deck_id}"
-        mock_redis.set.assert_called_once_with(expected_key, "true", ex=1800)
+        assert await fake_redis.get(expected_key) == "true"
+        assert 0 < await fake_redis.ttl(expected_key) <= 1800
         mock_metrics.assert_called_with("cache_set", "success")
 
-    @pytest.mark.asyncio
-    async def test_set_cancellation_flag_default_ttl(
-        self, cache_manager, mock_redis_client
-    ):
+    async def test_set_cancellation_flag_default_ttl(self, redis_backend, fake_redis):
         """Test cancellation flag with default TTL."""
-        _, mock_redis = mock_redis_client
-        mock_redis.set = AsyncMock()
+        cache_manager = RedisCacheManager(redis_backend)
+        deck_id = TEST_DECK_ID
 
-        deck_id = uuid4()
         await cache_manager.set_cancellation_flag(deck_id)
 
-        expected_key = f"cancel:deck:{deck_id}"
-        mock_redis.set.assert_called_once_with(expected_key, "true", ex=3600)
+        assert 1800 < await fake_redis.ttl(f"cancel:deck:{deck_id}") <= 3600
 
-    @pytest.mark.asyncio
     async def test_set_cancellation_flag_redis_error(
-        self, cache_manager, mock_redis_client
+        self, cache_manager, mock_redis_client, mock_metrics
     ):
         """Test cancellation flag setting with Redis error."""
         _, mock_redis = mock_redis_client
-        mock_redis.set = AsyncMock(side_effect=RedisError("Set failed"))
+        mock_redis.set = araise(RedisError("Set failed"))
 
-        deck_id = uuid4()
+        deck_id = TEST_DECK_ID
 
-        with patch(
-            "app.core.observability.metrics.record_redis_operation"
-        ) as mock_metrics:
-            with pytest.raises(MessagingException) as exc:
-                await cache_manager.set_cancellation_flag(deck_id)
+        with pytest.raises(MessagingException) as exc:
+            await cache_manager.set_cancellation_flag(deck_id)
 
         assert "Cache set failed" in str(exc.value)
         mock_metrics.assert_called_with("cache_set", "error")
 
-    @pytest.mark.asyncio
     async def test_check_cancellation_flag_exists(
-        self, cache_manager, mock_redis_client
+        self, redis_backend, fake_redis, mock_metrics
     ):
         """Test checking cancellation flag when it exists."""
-        _, mock_redis = mock_redis_client
-        mock_redis.get = AsyncMock(return_value="true")
-
-        deck_id = uuid4()
+        cache_manager = RedisCacheManager(redis_backend)
+        deck_id = TEST_DECK_ID
+        await fake_redis.set(f"cancel:deck:{deck_id}", "true")
 
-        with patch(
-            "app.core.observability.metrics.record_redis_operation"
-        ) as mock_metrics:
-            result = await cache_manager.check_cancellation_flag(deck_id)
+        result = await cache_manager.check_cancellation_flag(deck_id)
 
         assert result is True
-        expected_key = f"cancel:deck:{deck_id}"
-        mock_redis.get.assert_called_once_with(expected_key)
         mock_metrics.assert_called_with("cache_get", "success")
 
-    @pytest.mark.asyncio
-    async def test_check_cancellation_flag_not_exists(
-        self, cache_manager, mock_redis_client
-    ):
+    async def test_check_cancellation_flag_not_exists(self, redis_backend):
         """Test checking cancellation flag when it doesn't exist."""
-        _, mock_redis = mock_redis_client
-        mock_redis.get = AsyncMock(return_value=None)
+        cache_manager = RedisCacheManager(redis_backend)
 
-        deck_id = uuid4()
-        result = await cache_manager.check_cancellation_flag(deck_id)
+        result = await cache_manager.check_cancellation_flag(TEST_DECK_ID)
 
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_check_cancellation_flag_redis_error(
-        self, cache_manager, mock_redis_client
+        self, cache_manager, mock_redis_client, mock_metrics
     ):
         """Test checking cancellation flag with Redis error."""
         _, mock_redis = mock_redis_client
-        mock_redis.get = AsyncMock(side_effect=RedisError("Get failed"))
+        mock_redis.get = araise(RedisError("Get failed"))
 
-        deck_id = uuid4()
+        deck_id = TEST_DECK_ID
 
-        with patch(
-            "app.core.observability.metrics.record_redis_operation"
-        ) as mock_metrics:
-            result = await cache_manager.check_cancellation_flag(deck_id)
+        result = await cache_manager.check_cancellation_flag(deck_id)
 
         assert result is False  # Default to not cancelled
         mock_metrics.assert_called_with("cache_get", "error")
 
-    @pytest.mark.asyncio
     async def test_clear_cancellation_flag_success(
-        self, cache_manager, mock_redis_client
+        self, redis_backend, fake_redis, mock_metrics
     ):
         """Test successful cancellation flag clearing."""
-        _, mock_redis = mock_redis_client
-        mock_redis.delete = AsyncMock(return_value=1)
+        cache_manager = RedisCacheManager(redis_backend)
+        deck_id = TEST_DECK_ID
+        expected_key = f"cancel:deck:{deck_id}"
+        await fake_redis.set(expected_key, "true")
 
-        deck_id = uuid4()
+        await cache_manager.clear_cancellation_flag(deck_id)
 
-        with patch(
-            "app.core.observability.metrics.record_redis_operation"
-        ) as mock_metrics:
-            await cache_manager.clear_cancellation_flag(deck_id)
-
-        expected_key = f"cancel:deck:{deck_id}"
-        mock_redis.delete.assert_called_once_with(expected_key)
+        assert await fake_redis.exists(expected_key) == 0
         mock_metrics.assert_called_with("cache_delete", "success")
 
-    @pytest.mark.asyncio
     async def test_clear_cancellation_flag_redis_error(
-        self, cache_manager, mock_redis_client
+        self, cache_manager, mock_redis_client, mock_metrics
     ):
         """Test cancellation flag clearing with Redis error."""
         _, mock_redis = mock_redis_client
-        mock_redis.delete = AsyncMock(side_effect=RedisError("Delete failed"))
+        mock_redis.delete = araise(RedisError("Delete failed"))
 
-        deck_id = uuid4()
+        deck_id = TEST_DECK_ID
 
-        with patch(
-            "app.core.observability.metrics.record_redis_operation"
-        ) as mock_metrics:
-            await cache_manager.clear_cancellation_flag(deck_id)  # Should not raise
+        await cache_manager.clear_cancellation_flag(deck_id)  # Should not raise
 
         mock_metrics.assert_called_with("cache_delete", "error")
 
-    @pytest.mark.asyncio
-    async def test_set_temporary_data_success(self, cache_manager, mock_redis_client):
+    async def test_set_temporary_data_success(
+        self, redis_backend, fake_redis, mock_metrics
+    ):
         """Test successful temporary data setting."""
-        _, mock_redis = mock_redis_client
-        mock_redis.set = AsyncMock()
-
+        cache_manager = RedisCacheManager(redis_backend)
         test_data = {"status": "processing", "progress": 50}
 
-        with patch(
-            "app.core.observability.metrics.record_redis_operation"
-        ) as mock_metrics:
-            await cache_manager.set_temporary_data("test:key", test_data, ttl=1800)
+        await cache_manager.set_temporary_data("test:key", test_data, ttl=1800)
 
-        mock_redis.set.assert_called_once_with(
-            "test:key", json.dumps(test_data), ex=1800
-        )
+        assert orjson.loads(await fake_redis.get("test:key")) == test_data
+        assert 0 < await fake_redis.ttl("test:key") <= 1800
         mock_metrics.assert_called_with("cache_set", "success")
 
-    @pytest.mark.asyncio
-    async def test_set_temporary_data_default_ttl(
-        self, cache_manager, mock_redis_client
-    ):
+    async def test_set_temporary_data_default_ttl(self, redis_backend, fake_redis):
         """Test temporary data setting with default TTL."""
-        _, mock_redis = mock_redis_client
-        mock_redis.set = AsyncMock()
+        cache_manager = RedisCacheManager(redis_backend)
 
-        test_data = {"status": "processing"}
-        await cache_manager.set_temporary_data("test:key", test_data)
+        await cache_manager.set_temporary_data("test:key", {"status": "processing"})
 
-        mock_redis.set.assert_called_once_with(
-            "test:key", json.dumps(test_data), ex=3600
-        )
+        assert 1800 < await fake_redis.ttl("test:key") <= 3600
 
-    @pytest.mark.asyncio
     async def test_set_temporary_data_redis_error(
-        self, cache_manager, mock_redis_client
+        self, cache_manager, mock_redis_client, mock_metrics
     ):
         """Test temporary data setting with Redis error."""
         _, mock_redis = mock_redis_client
-        mock_redis.set = AsyncMock(side_effect=RedisError("Set failed"))
+        mock_redis.set = araise(RedisError("Set failed"))
 
         test_data = {"status": "processing"}
 
-        with patch(
-            "app.core.observability.metrics.record_redis_operation"
-        ) as mock_metrics:
-            with pytest.raises(MessagingException) as exc:
-                await cache_manager.set_temporary_data("test:key", test_data)
+        with pytest.raises(MessagingException) as exc:
+            await cache_manager.set_temporary_data("test:key", test_data)
 
         assert "Cache set failed" in str(exc.value)
         mock_metrics.assert_called_with("cache_set", "error")
 
-    @pytest.mark.asyncio
-    async def test_get_temporary_data_success(self, cache_manager, mock_redis_client):
+    async def test_get_temporary_data_success(
+        self, redis_backend, fake_redis, mock_metrics
+    ):
         """Test successful temporary data retrieval."""
-        _, mock_redis = mock_redis_client
+        cache_manager = RedisCacheManager(redis_backend)
         test_data = {"status": "completed", "result": "success"}
-        mock_redis.get = AsyncMock(return_value=json.dumps(test_data))
+        await fake_redis.set("test:key", json.dumps(test_data))
 
-        with patch(
-            "app.core.observability.metrics.record_redis_operation"
-        ) as mock_metrics:
-            result = await cache_manager.get_temporary_data("test:key")
+        result = await cache_manager.get_temporary_data("test:key")
 
         assert result == test_data
-        mock_redis.get.assert_called_once_with("test:key")
         mock_metrics.assert_called_with("cache_get", "success")
 
-    @pytest.mark.asyncio
-    async def test_get_temporary_data_not_exists(
-        self, cache_manager, mock_redis_client
-    ):
+    async def test_get_temporary_data_not_exists(self, redis_backend):
         """Test temporary data retrieval when key doesn't exist."""
-        _, mock_redis = mock_redis_client
-        mock_redis.get = AsyncMock(return_value=None)
+        cache_manager = RedisCacheManager(redis_backend)
 
         result = await cache_manager.get_temporary_data("test:key")
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_temporary_data_redis_error(
-        self, cache_manager, mock_redis_client
+        self, cache_manager, mock_redis_client, mock_metrics
     ):
         """Test temporary data retrieval with Redis error."""
         _, mock_redis = mock_redis_client
-        mock_redis.get = AsyncMock(side_effect=RedisError("Get failed"))
+        mock_redis.get = araise(RedisError("Get failed"))
 
-        with patch(
-            "app.core.observability.metrics.record_redis_operation"
-        ) as mock_metrics:
-            result = await cache_manager.get_temporary_data("test:key")
+        result = await cache_manager.get_temporary_data("test:key")
 
         assert result is None
         mock_metrics.assert_called_with("cache_get", "error")
 
-    @pytest.mark.asyncio
     async def test_get_temporary_data_json_decode_error(
-        self, cache_manager, mock_redis_client
+        self, redis_backend, fake_redis, mock_metrics
     ):
         """Test temporary data retrieval with JSON decode error."""
-        _, mock_redis = mock_redis_client
-        mock_redis.get = AsyncMock(return_value="invalid json")
+        cache_manager = RedisCacheManager(redis_backend)
+        await fake_redis.set("test:key", "invalid json")
 
-        with patch(
-            "app.core.observability.metrics.record_redis_operation"
-        ) as mock_metrics:
-            result = await cache_manager.get_temporary_data("test:key")
+        result = await cache_manager.get_temporary_data("test:key")
 
         assert result is None
         mock_metrics.assert_called_with("cache_get", "error")
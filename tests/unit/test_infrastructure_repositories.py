@@ -2,60 +2,171 @@
 
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.observability import metrics
 from app.domain.entities import Deck, DeckStatus, Slide, DeckEvent
 from app.infrastructure.db.repositories import (
     PostgresDeckRepository,
     PostgresSlideRepository,
     PostgresEventRepository,
 )
-from app.infrastructure.db.models import DeckModel, SlideModel, DeckEventModel
+from app.infrastructure.db.models import DeckModel, SlideModel
 
 
-class TestPostgresDeckRepository:
-    """Test cases for PostgresDeckRepository."""
+_NOW = datetime(2024, 1, 1)
 
-    @pytest.fixture
-    def mock_session(self):
-        """Create mock database session."""
-        return AsyncMock()
 
-    @pytest.fixture
-    def deck_repository(self, mock_session):
-        """Create deck repository with mock session."""
-        return PostgresDeckRepository(mock_session)
+def _set_scalar_one_or_none(session, value):
+    """Make session.execute() return a result whose scalar_one_or_none() is value."""
+    session.execute = AsyncMock(
+        return_value=SimpleNamespace(scalar_one_or_none=lambda: value)
+    )
+
+
+def _set_scalar(session, value):
+    """Make session.execute() return a result whose scalar() is value."""
+    session.execute = AsyncMock(return_value=SimpleNamespace(scalar=lambda: value))
+
+
+class _ScalarsResult:
+    """Query result stub that serves both scalars() and all()."""
+
+    def __init__(self, items):
+        self._items = items
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._items
+
+
+def _set_scalars_all(session, items):
+    """Make session.execute() return a result whose scalars().all() is items."""
+    session.execute = AsyncMock(return_value=_ScalarsResult(items))
+
+
+def _assign_event_id(obj, _id=123):
+    """Stand in for the database assigning an event ID on insert."""
+    obj.id = _id
+
+
+@pytest.fixture(autouse=True)
+def mock_metrics(monkeypatch):
+    """Replace the database metrics recorder with a mock for every test."""
+    mock = Mock()
+    monkeypatch.setattr(metrics, "record_database_operation", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_session():
+    """Create mock database session."""
+    session = AsyncMock()
+    # AsyncSession.add is synchronous; everything else is awaited.
+    session.add = Mock()
+    return session
+
+
+class _CrudRepositoryTests:
+    """Test cases shared by the deck and slide repositories."""
+
+    repository_cls: type
+    table: str
+    entity_name: str
 
     @pytest.fixture
-    def sample_deck(self, test_user_id):
-        """Create sample deck entity."""
+    def repository(self, mock_session):
+        """Create repository with mock session."""
+        return self.repository_cls(mock_session)
+
+    async def test_get_by_id_not_found(self, repository, mock_session):
+        """Test getting an entity by ID when not found."""
+        _set_scalar_one_or_none(mock_session, None)
+
+        result = await repository.get_by_id(uuid4())
+
+        assert result is None
+
+    async def test_update_not_found(
+        self, repository, mock_session, sample_entity, mock_metrics
+    ):
+        """Test updating an entity that doesn't exist."""
+        _set_scalar_one_or_none(mock_session, None)
+
+        message = f"{self.entity_name} with ID {sample_entity.id} not found"
+        with pytest.raises(ValueError, match=message):
+            await repository.update(sample_entity)
+
+        mock_metrics.assert_called_with("update", self.table, "not_found")
+
+    async def test_delete_success(self, repository, mock_session, mock_metrics):
+        """Test successful entity deletion."""
+        mock_db_row = SimpleNamespace()
+        _set_scalar_one_or_none(mock_session, mock_db_row)
+
+        result = await repository.delete(uuid4())
+
+        assert result is True
+        mock_session.delete.assert_called_once_with(mock_db_row)
+        mock_session.flush.assert_called_once()
+        mock_metrics.assert_called_with("delete", self.table, "success")
+
+    async def test_delete_not_found(self, repository, mock_session, mock_metrics):
+        """Test deleting an entity that doesn't exist."""
+        _set_scalar_one_or_none(mock_session, None)
+
+        result = await repository.delete(uuid4())
+
+        assert result is False
+        mock_metrics.assert_called_with("delete", self.table, "not_found")
+
+
+@pytest.mark.xdist_group(name="deck_repo")
+class TestPostgresDeckRepository(_CrudRepositoryTests):
+    """Test cases for PostgresDeckRepository."""
+
+    repository_cls = PostgresDeckRepository
+    table = "decks"
+    entity_name = "Deck"
+
+    @pytest.fixture(scope="class")
+    def _sample_deck_proto(self):
+        """Create the sample deck entity once per class."""
         return Deck(
             id=uuid4(),
-            user_id=test_user_id,
+            user_id="",
             title="Test Presentation",
             status=DeckStatus.PENDING,
             version=1,
             deck_plan={"title": "Test", "slides": []},
         )
 
-    @pytest.mark.asyncio
-    async def test_create_success(self, deck_repository, mock_session, sample_deck):
-        """Test successful deck creation."""
-        mock_session.add = Mock()
-        mock_session.flush = AsyncMock()
+    @pytest.fixture
+    def sample_deck(self, _sample_deck_proto, test_user_id):
+        """Create sample deck entity."""
+        return _sample_deck_proto.model_copy(update={"user_id": test_user_id})
 
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await deck_repository.create(sample_deck)
+    @pytest.fixture
+    def sample_entity(self, sample_deck):
+        """Expose the sample deck to the shared CRUD tests."""
+        return sample_deck
+
+    async def test_create_success(
+        self, repository, mock_session, sample_deck, mock_metrics
+    ):
+        """Test successful deck creation."""
+        result = await repository.create(sample_deck)
 
         assert result == sample_deck
         mock_session.add.assert_called_once()
         mock_session.flush.assert_called_once()
-        mock_metrics.assert_called_with("create", "decks", "success")
+        mock_metrics.assert_called_with("create", self.table, "success")
 
         # Verify the model was created correctly
         call_args = mock_session.add.call_args[0][0]
@@ -65,27 +176,12 @@ class TestPostgresDeckRepository:
         assert call_args.title == sample_deck.title
         assert call_args.status == sample_deck.status.value
 
-    @pytest.mark.asyncio
-    async def test_create_database_error(
-        self, deck_repository, mock_session, sample_deck
+    async def test_get_by_id_found(
+        self, repository, mock_session, sample_deck, mock_metrics
     ):
-        """Test deck creation with database error."""
-        mock_session.add = Mock()
-        mock_session.flush = AsyncMock(side_effect=SQLAlchemyError("Database error"))
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            with pytest.raises(SQLAlchemyError):
-                await deck_repository.create(sample_deck)
-
-        mock_metrics.assert_called_with("create", "decks", "error")
-
-    @pytest.mark.asyncio
-    async def test_get_by_id_found(self, deck_repository, mock_session, sample_deck):
         """Test getting deck by ID when found."""
         # Create mock database model
-        mock_db_deck = Mock(spec=DeckModel)
+        mock_db_deck = SimpleNamespace()
         mock_db_deck.id = sample_deck.id
         mock_db_deck.user_id = sample_deck.user_id
         mock_db_deck.title = sample_deck.title
@@ -96,315 +192,174 @@ class TestPostgresDeckRepository:
         mock_db_deck.updated_at = sample_deck.updated_at
 
         # Mock query result
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = mock_db_deck
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await deck_repository.get_by_id(sample_deck.id)
-
-        assert result is not None
-        assert result.id == sample_deck.id
-        assert result.user_id == sample_deck.user_id
-        assert result.title == sample_deck.title
-        assert result.status == DeckStatus.PENDING
-        mock_metrics.assert_called_with("get", "decks", "success")
-
-    @pytest.mark.asyncio
-    async def test_get_by_id_not_found(self, deck_repository, mock_session):
-        """Test getting deck by ID when not found."""
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        result = await deck_repository.get_by_id(uuid4())
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_get_by_id_database_error(self, deck_repository, mock_session):
-        """Test getting deck by ID with database error."""
-        mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("Database error"))
+        _set_scalar_one_or_none(mock_session, mock_db_deck)
 
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            with pytest.raises(SQLAlchemyError):
-                await deck_repository.get_by_id(uuid4())
+        result = await repository.get_by_id(sample_deck.id)
 
-        mock_metrics.assert_called_with("get", "decks", "error")
+        assert (result.id, result.user_id, result.title, result.status) == (
+            sample_deck.id,
+            sample_deck.user_id,
+            sample_deck.title,
+            DeckStatus.PENDING,
+        )
+        mock_metrics.assert_called_with("get", self.table, "success")
 
-    @pytest.mark.asyncio
     async def test_get_by_user_id_success(
-        self, deck_repository, mock_session, test_user_id
+        self, repository, mock_session, test_user_id, mock_metrics
     ):
         """Test getting decks by user ID."""
         # Create mock database models
-        mock_decks = []
-        for i in range(3):
-            mock_deck = Mock(spec=DeckModel)
-            mock_deck.id = uuid4()
-            mock_deck.user_id = test_user_id
-            mock_deck.title = f"Deck {i+1}"
-            mock_deck.status = DeckStatus.PENDING
-            mock_deck.version = 1
-            mock_deck.deck_plan = {}
-            mock_deck.created_at = datetime.now()
-            mock_deck.updated_at = datetime.now()
-            mock_decks.append(mock_deck)
+        mock_decks = [
+            SimpleNamespace(
+                id=uuid4(),
+                user_id=test_user_id,
+                title=f"Deck {i+1}",
+                status=DeckStatus.PENDING,
+                version=1,
+                deck_plan={},
+                created_at=_NOW,
+                updated_at=_NOW,
+            )
+            for i in range(3)
+        ]
 
         # Mock query result
-        mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = mock_decks
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await deck_repository.get_by_user_id(
-                test_user_id, limit=5, offset=0
-            )
+        _set_scalars_all(mock_session, mock_decks)
+
+        result = await repository.get_by_user_id(test_user_id, limit=5, offset=0)
 
         assert len(result) == 3
         for i, deck in enumerate(result):
             assert deck.title == f"Deck {i+1}"
             assert deck.user_id == test_user_id
 
-        mock_metrics.assert_called_with("list", "decks", "success")
+        mock_metrics.assert_called_with("list", self.table, "success")
 
-    @pytest.mark.asyncio
-    async def test_get_by_user_id_database_error(
-        self, deck_repository, mock_session, test_user_id
+    async def test_update_success(
+        self, repository, mock_session, sample_deck, mock_metrics
     ):
-        """Test getting decks by user ID with database error."""
-        mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("Database error"))
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            with pytest.raises(SQLAlchemyError):
-                await deck_repository.get_by_user_id(test_user_id)
-
-        mock_metrics.assert_called_with("list", "decks", "error")
-
-    @pytest.mark.asyncio
-    async def test_update_success(self, deck_repository, mock_session, sample_deck):
         """Test successful deck update."""
         # Create mock database model
-        mock_db_deck = Mock(spec=DeckModel)
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = mock_db_deck
-        mock_session.execute = AsyncMock(return_value=mock_result)
-        mock_session.flush = AsyncMock()
+        mock_db_deck = SimpleNamespace()
+        _set_scalar_one_or_none(mock_session, mock_db_deck)
 
         # Update deck properties
         sample_deck.title = "Updated Title"
         sample_deck.status = DeckStatus.COMPLETED
         sample_deck.version = 2
 
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await deck_repository.update(sample_deck)
+        result = await repository.update(sample_deck)
 
         assert result == sample_deck
         assert mock_db_deck.title == "Updated Title"
         assert mock_db_deck.status == DeckStatus.COMPLETED.value
         assert mock_db_deck.version == 2
         mock_session.flush.assert_called_once()
-        mock_metrics.assert_called_with("update", "decks", "success")
-
-    @pytest.mark.asyncio
-    async def test_update_not_found(self, deck_repository, mock_session, sample_deck):
-        """Test updating deck that doesn't exist."""
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            with pytest.raises(ValueError) as exc:
-                await deck_repository.update(sample_deck)
-
-        assert f"Deck with ID {sample_deck.id} not found" in str(exc.value)
-        mock_metrics.assert_called_with("update", "decks", "not_found")
-
-    @pytest.mark.asyncio
-    async def test_update_database_error(
-        self, deck_repository, mock_session, sample_deck
-    ):
-        """Test deck update with database error."""
-        mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("Database error"))
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            with pytest.raises(SQLAlchemyError):
-                await deck_repository.update(sample_deck)
-
-        mock_metrics.assert_called_with("update", "decks", "error")
+        mock_metrics.assert_called_with("update", self.table, "success")
 
-    @pytest.mark.asyncio
-    async def test_delete_success(self, deck_repository, mock_session):
-        """Test successful deck deletion."""
-        deck_id = uuid4()
-        mock_db_deck = Mock(spec=DeckModel)
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = mock_db_deck
-        mock_session.execute = AsyncMock(return_value=mock_result)
-        mock_session.delete = AsyncMock()
-        mock_session.flush = AsyncMock()
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await deck_repository.delete(deck_id)
-
-        assert result is True
-        mock_session.delete.assert_called_once_with(mock_db_deck)
-        mock_session.flush.assert_called_once()
-        mock_metrics.assert_called_with("delete", "decks", "success")
-
-    @pytest.mark.asyncio
-    async def test_delete_not_found(self, deck_repository, mock_session):
-        """Test deleting deck that doesn't exist."""
-        deck_id = uuid4()
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await deck_repository.delete(deck_id)
-
-        assert result is False
-        mock_metrics.assert_called_with("delete", "decks", "not_found")
-
-    @pytest.mark.asyncio
-    async def test_delete_database_error(self, deck_repository, mock_session):
-        """Test deck deletion with database error."""
-        deck_id = uuid4()
-        mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("Database error"))
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            with pytest.raises(SQLAlchemyError):
-                await deck_repository.delete(deck_id)
-
-        mock_metrics.assert_called_with("delete", "decks", "error")
-
-    @pytest.mark.asyncio
-    async def test_exists_true(self, deck_repository, mock_session):
+    async def test_exists_true(self, repository, mock_session, mock_metrics):
         """Test deck existence check when deck exists."""
         deck_id = uuid4()
-        mock_result = Mock()
-        mock_result.scalar.return_value = 1
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        _set_scalar(mock_session, 1)
 
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await deck_repository.exists(deck_id)
+        result = await repository.exists(deck_id)
 
         assert result is True
-        mock_metrics.assert_called_with("exists", "decks", "success")
+        mock_metrics.assert_called_with("exists", self.table, "success")
 
-    @pytest.mark.asyncio
-    async def test_exists_false(self, deck_repository, mock_session):
+    async def test_exists_false(self, repository, mock_session):
         """Test deck existence check when deck doesn't exist."""
         deck_id = uuid4()
-        mock_result = Mock()
-        mock_result.scalar.return_value = 0
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        _set_scalar(mock_session, 0)
 
-        result = await deck_repository.exists(deck_id)
+        result = await repository.exists(deck_id)
 
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_exists_database_error(self, deck_repository, mock_session):
-        """Test deck existence check with database error."""
-        deck_id = uuid4()
-        mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("Database error"))
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            with pytest.raises(SQLAlchemyError):
-                await deck_repository.exists(deck_id)
-
-        mock_metrics.assert_called_with("exists", "decks", "error")
-
-    @pytest.mark.asyncio
     async def test_is_owned_by_user_true(
-        self, deck_repository, mock_session, test_user_id
+        self, repository, mock_session, test_user_id, mock_metrics
     ):
         """Test ownership check when user owns deck."""
         deck_id = uuid4()
-        mock_result = Mock()
-        mock_result.scalar.return_value = 1
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        _set_scalar(mock_session, 1)
 
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await deck_repository.is_owned_by_user(deck_id, test_user_id)
+        result = await repository.is_owned_by_user(deck_id, test_user_id)
 
         assert result is True
-        mock_metrics.assert_called_with("ownership_check", "decks", "success")
+        mock_metrics.assert_called_with("ownership_check", self.table, "success")
 
-    @pytest.mark.asyncio
-    async def test_is_owned_by_user_false(
-        self, deck_repository, mock_session, test_user_id
-    ):
+    async def test_is_owned_by_user_false(self, repository, mock_session, test_user_id):
         """Test ownership check when user doesn't own deck."""
         deck_id = uuid4()
-        mock_result = Mock()
-        mock_result.scalar.return_value = 0
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        _set_scalar(mock_session, 0)
 
-        result = await deck_repository.is_owned_by_user(deck_id, test_user_id)
+        result = await repository.is_owned_by_user(deck_id, test_user_id)
 
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_is_owned_by_user_database_error(
-        self, deck_repository, mock_session, test_user_id
+    @pytest.mark.parametrize(
+        "operation, call",
+        [
+            pytest.param(
+                "create", lambda repo, deck, user_id: repo.create(deck), id="create"
+            ),
+            pytest.param(
+                "get",
+                lambda repo, deck, user_id: repo.get_by_id(deck.id),
+                id="get_by_id",
+            ),
+            pytest.param(
+                "list",
+                lambda repo, deck, user_id: repo.get_by_user_id(user_id),
+                id="get_by_user_id",
+            ),
+            pytest.param(
+                "update", lambda repo, deck, user_id: repo.update(deck), id="update"
+            ),
+            pytest.param(
+                "delete", lambda repo, deck, user_id: repo.delete(deck.id), id="delete"
+            ),
+            pytest.param(
+                "exists", lambda repo, deck, user_id: repo.exists(deck.id), id="exists"
+            ),
+            pytest.param(
+                "ownership_check",
+                lambda repo, deck, user_id: repo.is_owned_by_user(deck.id, user_id),
+                id="is_owned_by_user",
+            ),
+        ],
+    )
+    async def test_database_error(
+        self,
+        repository,
+        mock_session,
+        sample_deck,
+        test_user_id,
+        mock_metrics,
+        operation,
+        call,
     ):
-        """Test ownership check with database error."""
-        deck_id = uuid4()
+        """Test deck operations record an error metric on database error."""
         mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("Database error"))
+        mock_session.flush = AsyncMock(side_effect=SQLAlchemyError("Database error"))
 
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            with pytest.raises(SQLAlchemyError):
-                await deck_repository.is_owned_by_user(deck_id, test_user_id)
+        with pytest.raises(SQLAlchemyError):
+            await call(repository, sample_deck, test_user_id)
 
-        mock_metrics.assert_called_with("ownership_check", "decks", "error")
+        mock_metrics.assert_called_with(operation, self.table, "error")
 
 
-class TestPostgresSlideRepository:
+@pytest.mark.xdist_group(name="slide_repo")
+class TestPostgresSlideRepository(_CrudRepositoryTests):
     """Test cases for PostgresSlideRepository."""
 
-    @pytest.fixture
-    def mock_session(self):
-        """Create mock database session."""
-        return AsyncMock()
-
-    @pytest.fixture
-    def slide_repository(self, mock_session):
-        """Create slide repository with mock session."""
-        return PostgresSlideRepository(mock_session)
+    repository_cls = PostgresSlideRepository
+    table = "slides"
+    entity_name = "Slide"
 
-    @pytest.fixture
-    def sample_slide(self):
-        """Create sample slide entity."""
+    @pytest.fixture(scope="class")
+    def _sample_slide_proto(self):
+        """Create the sample slide entity once per class."""
         return Slide(
             id=uuid4(),
             deck_id=uuid4(),
@@ -413,21 +368,26 @@ class TestPostgresSlideRepository:
             presenter_notes="Test notes",
         )
 
-    @pytest.mark.asyncio
-    async def test_create_success(self, slide_repository, mock_session, sample_slide):
-        """Test successful slide creation."""
-        mock_session.add = Mock()
-        mock_session.flush = AsyncMock()
+    @pytest.fixture
+    def sample_slide(self, _sample_slide_proto):
+        """Create sample slide entity."""
+        return _sample_slide_proto.model_copy()
 
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await slide_repository.create(sample_slide)
+    @pytest.fixture
+    def sample_entity(self, sample_slide):
+        """Expose the sample slide to the shared CRUD tests."""
+        return sample_slide
+
+    async def test_create_success(
+        self, repository, mock_session, sample_slide, mock_metrics
+    ):
+        """Test successful slide creation."""
+        result = await repository.create(sample_slide)
 
         assert result == sample_slide
         mock_session.add.assert_called_once()
         mock_session.flush.assert_called_once()
-        mock_metrics.assert_called_with("create", "slides", "success")
+        mock_metrics.assert_called_with("create", self.table, "success")
 
         # Verify the model was created correctly
         call_args = mock_session.add.call_args[0][0]
@@ -437,27 +397,23 @@ class TestPostgresSlideRepository:
         assert call_args.slide_order == sample_slide.slide_order
         assert call_args.html_content == sample_slide.html_content
 
-    @pytest.mark.asyncio
     async def test_create_database_error(
-        self, slide_repository, mock_session, sample_slide
+        self, repository, mock_session, sample_slide, mock_metrics
     ):
         """Test slide creation with database error."""
-        mock_session.add = Mock()
         mock_session.flush = AsyncMock(side_effect=SQLAlchemyError("Database error"))
 
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            with pytest.raises(SQLAlchemyError):
-                await slide_repository.create(sample_slide)
+        with pytest.raises(SQLAlchemyError):
+            await repository.create(sample_slide)
 
-        mock_metrics.assert_called_with("create", "slides", "error")
+        mock_metrics.assert_called_with("create", self.table, "error")
 
-    @pytest.mark.asyncio
-    async def test_get_by_id_found(self, slide_repository, mock_session, sample_slide):
+    async def test_get_by_id_found(
+        self, repository, mock_session, sample_slide, mock_metrics
+    ):
         """Test getting slide by ID when found."""
         # Create mock database model
-        mock_db_slide = Mock(spec=SlideModel)
+        mock_db_slide = SimpleNamespace()
         mock_db_slide.id = sample_slide.id
         mock_db_slide.deck_id = sample_slide.deck_id
         mock_db_slide.slide_order = sample_slide.slide_order
@@ -467,214 +423,126 @@ class TestPostgresSlideRepository:
         mock_db_slide.updated_at = sample_slide.updated_at
 
         # Mock query result
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = mock_db_slide
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await slide_repository.get_by_id(sample_slide.id)
-
-        assert result is not None
-        assert result.id == sample_slide.id
-        assert result.deck_id == sample_slide.deck_id
-        assert result.slide_order == sample_slide.slide_order
-        assert result.html_content == sample_slide.html_content
-        mock_metrics.assert_called_with("get", "slides", "success")
-
-    @pytest.mark.asyncio
-    async def test_get_by_id_not_found(self, slide_repository, mock_session):
-        """Test getting slide by ID when not found."""
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        result = await slide_repository.get_by_id(uuid4())
-
-        assert result is None
+        _set_scalar_one_or_none(mock_session, mock_db_slide)
+
+        result = await repository.get_by_id(sample_slide.id)
+
+        assert (
+            result.id,
+            result.deck_id,
+            result.slide_order,
+            result.html_content,
+        ) == (
+            sample_slide.id,
+            sample_slide.deck_id,
+            sample_slide.slide_order,
+            sample_slide.html_content,
+        )
+        mock_metrics.assert_called_with("get", self.table, "success")
 
-    @pytest.mark.asyncio
-    async def test_get_by_deck_id_success(self, slide_repository, mock_session):
+    async def test_get_by_deck_id_success(self, repository, mock_session, mock_metrics):
         """Test getting slides by deck ID."""
         deck_id = uuid4()
 
         # Create mock database models
-        mock_slides = []
-        for i in range(3):
-            mock_slide = Mock(spec=SlideModel)
-            mock_slide.id = uuid4()
-            mock_slide.deck_id = deck_id
-            mock_slide.slide_order = i + 1
-            mock_slide.html_content = f"<h1>Slide {i+1}</h1>"
-            mock_slide.presenter_notes = f"Notes {i+1}"
-            mock_slide.created_at = datetime.now()
-            mock_slide.updated_at = datetime.now()
-            mock_slides.append(mock_slide)
+        mock_slides = [
+            SimpleNamespace(
+                id=uuid4(),
+                deck_id=deck_id,
+                slide_order=i + 1,
+                html_content=f"<h1>Slide {i+1}</h1>",
+                presenter_notes=f"Notes {i+1}",
+                created_at=_NOW,
+                updated_at=_NOW,
+            )
+            for i in range(3)
+        ]
 
         # Mock query result
-        mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = mock_slides
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        _set_scalars_all(mock_session, mock_slides)
 
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await slide_repository.get_by_deck_id(deck_id)
+        result = await repository.get_by_deck_id(deck_id)
 
         assert len(result) == 3
         for i, slide in enumerate(result):
             assert slide.slide_order == i + 1
             assert slide.deck_id == deck_id
 
-        mock_metrics.assert_called_with("list", "slides", "success")
+        mock_metrics.assert_called_with("list", self.table, "success")
 
-    @pytest.mark.asyncio
-    async def test_update_success(self, slide_repository, mock_session, sample_slide):
+    async def test_update_success(
+        self, repository, mock_session, sample_slide, mock_metrics
+    ):
         """Test successful slide update."""
         # Create mock database model
-        mock_db_slide = Mock(spec=SlideModel)
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = mock_db_slide
-        mock_session.execute = AsyncMock(return_value=mock_result)
-        mock_session.flush = AsyncMock()
+        mock_db_slide = SimpleNamespace()
+        _set_scalar_one_or_none(mock_session, mock_db_slide)
 
         # Update slide properties
         sample_slide.html_content = "<h1>Updated Content</h1>"
         sample_slide.presenter_notes = "Updated notes"
 
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await slide_repository.update(sample_slide)
+        result = await repository.update(sample_slide)
 
         assert result == sample_slide
         assert mock_db_slide.html_content == "<h1>Updated Content</h1>"
         assert mock_db_slide.presenter_notes == "Updated notes"
         mock_session.flush.assert_called_once()
-        mock_metrics.assert_called_with("update", "slides", "success")
-
-    @pytest.mark.asyncio
-    async def test_update_not_found(self, slide_repository, mock_session, sample_slide):
-        """Test updating slide that doesn't exist."""
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            with pytest.raises(ValueError) as exc:
-                await slide_repository.update(sample_slide)
-
-        assert f"Slide with ID {sample_slide.id} not found" in str(exc.value)
-        mock_metrics.assert_called_with("update", "slides", "not_found")
-
-    @pytest.mark.asyncio
-    async def test_delete_success(self, slide_repository, mock_session):
-        """Test successful slide deletion."""
-        slide_id = uuid4()
-        mock_db_slide = Mock(spec=SlideModel)
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = mock_db_slide
-        mock_session.execute = AsyncMock(return_value=mock_result)
-        mock_session.delete = AsyncMock()
-        mock_session.flush = AsyncMock()
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await slide_repository.delete(slide_id)
+        mock_metrics.assert_called_with("update", self.table, "success")
 
-        assert result is True
-        mock_session.delete.assert_called_once_with(mock_db_slide)
-        mock_session.flush.assert_called_once()
-        mock_metrics.assert_called_with("delete", "slides", "success")
-
-    @pytest.mark.asyncio
-    async def test_delete_not_found(self, slide_repository, mock_session):
-        """Test deleting slide that doesn't exist."""
-        slide_id = uuid4()
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await slide_repository.delete(slide_id)
-
-        assert result is False
-        mock_metrics.assert_called_with("delete", "slides", "not_found")
-
-    @pytest.mark.asyncio
-    async def test_delete_by_deck_id_success(self, slide_repository, mock_session):
+    async def test_delete_by_deck_id_success(
+        self, repository, mock_session, mock_metrics
+    ):
         """Test deleting all slides for a deck."""
         deck_id = uuid4()
 
         # Create mock slides
-        mock_slides = [Mock(spec=SlideModel) for _ in range(3)]
-        mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = mock_slides
-        mock_session.execute = AsyncMock(return_value=mock_result)
-        mock_session.delete = AsyncMock()
-        mock_session.flush = AsyncMock()
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await slide_repository.delete_by_deck_id(deck_id)
+        mock_slides = [SimpleNamespace() for _ in range(3)]
+        _set_scalars_all(mock_session, mock_slides)
+
+        result = await repository.delete_by_deck_id(deck_id)
 
         assert result == 3  # Number of deleted slides
         assert mock_session.delete.call_count == 3
         mock_session.flush.assert_called_once()
-        mock_metrics.assert_called_with("delete_by_deck", "slides", "success")
+        mock_metrics.assert_called_with("delete_by_deck", self.table, "success")
 
-    @pytest.mark.asyncio
-    async def test_get_max_order_with_slides(self, slide_repository, mock_session):
+    async def test_get_max_order_with_slides(
+        self, repository, mock_session, mock_metrics
+    ):
         """Test getting max slide order when slides exist."""
         deck_id = uuid4()
-        mock_result = Mock()
-        mock_result.scalar.return_value = 5
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        _set_scalar(mock_session, 5)
 
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await slide_repository.get_max_order(deck_id)
+        result = await repository.get_max_order(deck_id)
 
         assert result == 5
-        mock_metrics.assert_called_with("max_order", "slides", "success")
+        mock_metrics.assert_called_with("max_order", self.table, "success")
 
-    @pytest.mark.asyncio
-    async def test_get_max_order_no_slides(self, slide_repository, mock_session):
+    async def test_get_max_order_no_slides(self, repository, mock_session):
         """Test getting max slide order when no slides exist."""
         deck_id = uuid4()
-        mock_result = Mock()
-        mock_result.scalar.return_value = None
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        _set_scalar(mock_session, None)
 
-        result = await slide_repository.get_max_order(deck_id)
+        result = await repository.get_max_order(deck_id)
 
         assert result == 0
 
 
+@pytest.mark.xdist_group(name="event_repo")
 class TestPostgresEventRepository:
     """Test cases for PostgresEventRepository."""
 
-    @pytest.fixture
-    def mock_session(self):
-        """Create mock database session."""
-        return AsyncMock()
+    table = "deck_events"
 
     @pytest.fixture
     def event_repository(self, mock_session):
         """Create event repository with mock session."""
         return PostgresEventRepository(mock_session)
 
-    @pytest.fixture
-    def sample_event(self):
-        """Create sample deck event entity."""
+    @pytest.fixture(scope="class")
+    def _sample_event_proto(self):
+        """Create the sample deck event entity once per class."""
         return DeckEvent(
             deck_id=uuid4(),
             version=1,
@@ -682,26 +550,19 @@ class TestPostgresEventRepository:
             payload={"title": "Test Deck"},
         )
 
-    @pytest.mark.asyncio
-    async def test_create_success(self, event_repository, mock_session, sample_event):
-        """Test successful event creation."""
-        # Create mock database model with generated ID
-        mock_db_event = Mock(spec=DeckEventModel)
-        mock_db_event.id = 123
-
-        mock_session.add = Mock()
-        mock_session.flush = AsyncMock()
+    @pytest.fixture
+    def sample_event(self, _sample_event_proto):
+        """Create sample deck event entity."""
+        return _sample_event_proto.model_copy()
 
+    async def test_create_success(
+        self, event_repository, mock_session, sample_event, mock_metrics
+    ):
+        """Test successful event creation."""
         # Mock the add method to set the db model
-        def mock_add(obj):
-            obj.id = 123
-
-        mock_session.add.side_effect = mock_add
+        mock_session.add.side_effect = _assign_event_id
 
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await event_repository.create(sample_event)
+        result = await event_repository.create(sample_event)
 
         assert result.id == 123  # ID should be set from database
         assert result.deck_id == sample_event.deck_id
@@ -709,50 +570,31 @@ class TestPostgresEventRepository:
         assert result.event_type == sample_event.event_type
         mock_session.add.assert_called_once()
         mock_session.flush.assert_called_once()
-        mock_metrics.assert_called_with("create", "deck_events", "success")
+        mock_metrics.assert_called_with("create", self.table, "success")
 
-    @pytest.mark.asyncio
-    async def test_create_database_error(
-        self, event_repository, mock_session, sample_event
+    async def test_get_by_deck_id_success(
+        self, event_repository, mock_session, mock_metrics
     ):
-        """Test event creation with database error."""
-        mock_session.add = Mock()
-        mock_session.flush = AsyncMock(side_effect=SQLAlchemyError("Database error"))
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            with pytest.raises(SQLAlchemyError):
-                await event_repository.create(sample_event)
-
-        mock_metrics.assert_called_with("create", "deck_events", "error")
-
-    @pytest.mark.asyncio
-    async def test_get_by_deck_id_success(self, event_repository, mock_session):
         """Test getting events by deck ID."""
         deck_id = uuid4()
 
         # Create mock database models
-        mock_events = []
-        for i in range(3):
-            mock_event = Mock(spec=DeckEventModel)
-            mock_event.id = i + 1
-            mock_event.deck_id = deck_id
-            mock_event.version = i + 1
-            mock_event.event_type = f"Event{i+1}"
-            mock_event.payload = {"data": f"event{i+1}"}
-            mock_event.created_at = datetime.now()
-            mock_events.append(mock_event)
+        mock_events = [
+            SimpleNamespace(
+                id=i + 1,
+                deck_id=deck_id,
+                version=i + 1,
+                event_type=f"Event{i+1}",
+                payload={"data": f"event{i+1}"},
+                created_at=_NOW,
+            )
+            for i in range(3)
+        ]
 
         # Mock query result
-        mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = mock_events
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        _set_scalars_all(mock_session, mock_events)
 
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await event_repository.get_by_deck_id(deck_id, from_version=0)
+        result = await event_repository.get_by_deck_id(deck_id, from_version=0)
 
         assert len(result) == 3
         for i, event in enumerate(result):
@@ -760,9 +602,8 @@ class TestPostgresEventRepository:
             assert event.deck_id == deck_id
             assert event.version == i + 1
 
-        mock_metrics.assert_called_with("list", "deck_events", "success")
+        mock_metrics.assert_called_with("list", self.table, "success")
 
-    @pytest.mark.asyncio
     async def test_get_by_deck_id_with_from_version(
         self, event_repository, mock_session
     ):
@@ -770,20 +611,19 @@ class TestPostgresEventRepository:
         deck_id = uuid4()
 
         # Should only return events with version > 2
-        mock_events = []
-        for i in range(2, 5):  # versions 3, 4, 5
-            mock_event = Mock(spec=DeckEventModel)
-            mock_event.id = i + 1
-            mock_event.deck_id = deck_id
-            mock_event.version = i + 1
-            mock_event.event_type = f"Event{i+1}"
-            mock_event.payload = {"data": f"event{i+1}"}
-            mock_event.created_at = datetime.now()
-            mock_events.append(mock_event)
-
-        mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = mock_events
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        mock_events = [
+            SimpleNamespace(
+                id=i + 1,
+                deck_id=deck_id,
+                version=i + 1,
+                event_type=f"Event{i+1}",
+                payload={"data": f"event{i+1}"},
+                created_at=_NOW,
+            )
+            for i in range(2, 5)  # versions 3, 4, 5
+        ]
+
+        _set_scalars_all(mock_session, mock_events)
 
         result = await event_repository.get_by_deck_id(deck_id, from_version=2)
 
@@ -791,60 +631,57 @@ class TestPostgresEventRepository:
         for i, event in enumerate(result):
             assert event.version >= 3  # Should only have versions > 2
 
-    @pytest.mark.asyncio
-    async def test_get_by_deck_id_database_error(self, event_repository, mock_session):
-        """Test getting events with database error."""
-        deck_id = uuid4()
-        mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("Database error"))
-
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            with pytest.raises(SQLAlchemyError):
-                await event_repository.get_by_deck_id(deck_id)
-
-        mock_metrics.assert_called_with("list", "deck_events", "error")
-
-    @pytest.mark.asyncio
-    async def test_get_latest_version_with_events(self, event_repository, mock_session):
+    async def test_get_latest_version_with_events(
+        self, event_repository, mock_session, mock_metrics
+    ):
         """Test getting latest version when events exist."""
         deck_id = uuid4()
-        mock_result = Mock()
-        mock_result.scalar.return_value = 5
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        _set_scalar(mock_session, 5)
 
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            result = await event_repository.get_latest_version(deck_id)
+        result = await event_repository.get_latest_version(deck_id)
 
         assert result == 5
-        mock_metrics.assert_called_with("latest_version", "deck_events", "success")
+        mock_metrics.assert_called_with("latest_version", self.table, "success")
 
-    @pytest.mark.asyncio
     async def test_get_latest_version_no_events(self, event_repository, mock_session):
         """Test getting latest version when no events exist."""
         deck_id = uuid4()
-        mock_result = Mock()
-        mock_result.scalar.return_value = None
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        _set_scalar(mock_session, None)
 
         result = await event_repository.get_latest_version(deck_id)
 
         assert result == 0
 
-    @pytest.mark.asyncio
-    async def test_get_latest_version_database_error(
-        self, event_repository, mock_session
+    @pytest.mark.parametrize(
+        "operation, call",
+        [
+            pytest.param("create", lambda repo, event: repo.create(event), id="create"),
+            pytest.param(
+                "list",
+                lambda repo, event: repo.get_by_deck_id(event.deck_id),
+                id="get_by_deck_id",
+            ),
+            pytest.param(
+                "latest_version",
+                lambda repo, event: repo.get_latest_version(event.deck_id),
+                id="get_latest_version",
+            ),
+        ],
+    )
+    async def test_database_error(
+        self,
+        event_repository,
+        mock_session,
+        sample_event,
+        mock_metrics,
+        operation,
+        call,
     ):
-        """Test getting latest version with database error."""
-        deck_id = uuid4()
+        """Test event operations record an error metric on database error."""
         mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("Database error"))
+        mock_session.flush = AsyncMock(side_effect=SQLAlchemyError("Database error"))
 
-        with patch(
-            "app.core.observability.metrics.record_database_operation"
-        ) as mock_metrics:
-            with pytest.raises(SQLAlchemyError):
-                await event_repository.get_latest_version(deck_id)
+        with pytest.raises(SQLAlchemyError):
+            await call(event_repository, sample_event)
 
-        mock_metrics.assert_called_with("latest_version", "deck_events", "error")
+        mock_metrics.assert_called_with(operation, self.table, "error")
@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import orjson
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
@@ -12,14 +13,89 @@ from starlette.websockets import WebSocketState
 
 from app.api.schemas import Event
 from app.api.websocket import (
+    DECK_QUEUE_MAXSIZE,
+    DISPATCHER_RETRY_DELAY,
+    EVENT_BATCH_WINDOW,
     WebSocketManager,
     _handle_client_message,
+    _replay_cache,
+    _replay_data,
     _send_event_replay,
 )
 from app.domain.entities import Deck, DeckStatus, DeckEvent
 from app.domain.exceptions import DeckNotFoundException, UnauthorizedAccessException
 
 
+# Computed once: speccing against the class re-inspects WebSocket per mock
+_WEBSOCKET_SPEC = dir(WebSocket)
+
+
+def _make_websocket(client_state=WebSocketState.CONNECTED):
+    """Create a mock WebSocket with async I/O methods."""
+    ws = Mock(spec=_WEBSOCKET_SPEC)
+    ws.accept = AsyncMock()
+    ws.send_text = AsyncMock()
+    ws.receive_text = AsyncMock()
+    ws.close = AsyncMock()
+    ws.client_state = client_state
+    return ws
+
+
+def _decoded_calls(mock, arg=0):
+    """Decode the JSON frame passed as positional argument ``arg`` of each call."""
+    return [json.loads(call.args[arg]) for call in mock.call_args_list]
+
+
+async def _live_stream(events, drained):
+    """Yield events like a live subscription, then stay open.
+
+    ``drained`` is set once the consumer has asked for the next event after
+    the last one, i.e. when every event has been handled.
+    """
+    for event in events:
+        yield event
+    drained.set()
+    await asyncio.Event().wait()
+
+
+async def _run_until(coro, done):
+    """Run a long-lived coroutine until ``done`` is set, then cancel it."""
+    task = asyncio.create_task(coro)
+    async with asyncio.timeout(2):
+        await done.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.fixture(autouse=True)
+def clear_replay_cache():
+    """Run every test against an empty replay encoding cache."""
+    _replay_cache.clear()
+    yield
+    _replay_cache.clear()
+
+
+@pytest.fixture(scope="session")
+def deck_id():
+    """Deck ID shared by tests that need only one deck."""
+    return uuid4()
+
+
+@pytest.fixture
+def mock_websocket():
+    """Create mock WebSocket."""
+    return _make_websocket()
+
+
+@pytest.fixture
+def mock_connection_manager(monkeypatch):
+    """Install a mock as the module-level connection manager."""
+    manager = AsyncMock()
+    monkeypatch.setattr("app.api.websocket.connection_manager", manager)
+    return manager
+
+
 class TestWebSocketManager:
     """Test cases for WebSocketManager."""
 
@@ -29,25 +105,20 @@ class TestWebSocketManager:
         return AsyncMock()
 
     @pytest.fixture
-    def ws_manager(self, mock_redis_pubsub):
-        """Create WebSocket manager instance."""
-        return WebSocketManager(mock_redis_pubsub)
-
-    @pytest.fixture
-    def mock_websocket(self):
-        """Create mock WebSocket."""
-        ws = Mock(spec=WebSocket)
-        ws.accept = AsyncMock()
-        ws.send_text = AsyncMock()
-        ws.client_state = WebSocketState.CONNECTED
-        return ws
+    async def ws_manager(self, mock_redis_pubsub):
+        """Create WebSocket manager instance, stopping its tasks afterwards."""
+        manager = WebSocketManager(mock_redis_pubsub)
+        yield manager
+        # The dispatcher resubscribes forever; don't leave it on the shared loop
+        for task in (manager._dispatcher, *manager._consumer_tasks):
+            if task is not None:
+                task.cancel()
 
     @pytest.mark.asyncio
     async def test_connect_first_connection(
-        self, ws_manager, mock_websocket, mock_redis_pubsub
+        self, ws_manager, mock_websocket, mock_redis_pubsub, deck_id
     ):
         """Test connecting the first WebSocket for a deck."""
-        deck_id = uuid4()
         user_id = "test-user-123"
 
         with patch(
@@ -61,25 +132,66 @@ class TestWebSocketManager:
         assert mock_websocket in ws_manager.active_connections[deck_id]
         assert deck_id in ws_manager._consumers
         assert isinstance(ws_manager._consumers[deck_id], asyncio.Task)
+        assert ws_manager._consumers[deck_id] in ws_manager._consumer_tasks
+        assert ws_manager._dispatcher is not None
+        assert ws_manager._deck_queues[deck_id].maxsize == DECK_QUEUE_MAXSIZE
         mock_metrics.assert_called_once_with(1)
 
     @pytest.mark.asyncio
-    async def test_connect_additional_connection(self, ws_manager, mock_redis_pubsub):
+    async def test_consumer_task_released_when_done(
+        self, ws_manager, mock_websocket, deck_id
+    ):
+        """Test finished consumer tasks drop out of the strong-reference set."""
+        await ws_manager.connect(mock_websocket, deck_id, "test-user-123")
+        consumer = ws_manager._consumers[deck_id]
+        await ws_manager.disconnect(mock_websocket, deck_id)
+
+        assert consumer.done()
+        assert ws_manager._dispatcher is None
+        await asyncio.sleep(0)
+        assert consumer not in ws_manager._consumer_tasks
+
+    @pytest.mark.asyncio
+    async def test_broadcast_failure_on_last_socket_releases_consumer(
+        self, ws_manager, mock_websocket, deck_id
+    ):
+        """Test a consumer that drops the last watched socket still finishes."""
+        mock_websocket.send_text.side_effect = Exception("Connection lost")
+        await ws_manager.connect(mock_websocket, deck_id, "test-user-123")
+        consumer = ws_manager._consumers[deck_id]
+
+        ws_manager._deck_queues[deck_id].put_nowait(
+            Event(
+                event_type="SlideAdded",
+                deck_id=deck_id,
+                version=1,
+                timestamp=datetime(2024, 1, 1, 10, 0, 0),
+                payload={},
+            )
+        )
+        await asyncio.wait({consumer}, timeout=2)
+
+        # The broadcast disconnected the socket from inside the consumer
+        assert consumer.cancelled()
+        assert deck_id not in ws_manager.active_connections
+        assert ws_manager._dispatcher is None
+        await asyncio.sleep(0)
+        assert not ws_manager._consumer_tasks
+
+    @pytest.mark.asyncio
+    async def test_connect_additional_connection(
+        self, ws_manager, mock_redis_pubsub, deck_id
+    ):
         """Test connecting additional WebSocket for existing deck."""
-        deck_id = uuid4()
         user_id = "test-user-123"
 
         # Setup existing connection
-        first_ws = Mock(spec=WebSocket)
-        first_ws.accept = AsyncMock()
-        first_ws.client_state = WebSocketState.CONNECTED
+        first_ws = _make_websocket()
         ws_manager.active_connections[deck_id] = {first_ws}
         ws_manager._consumers[deck_id] = Mock()
 
         # Connect second WebSocket
-        second_ws = Mock(spec=WebSocket)
-        second_ws.accept = AsyncMock()
-        second_ws.client_state = WebSocketState.CONNECTED
+        second_ws = _make_websocket()
 
         consumer_count_before = len(ws_manager._consumers)
 
@@ -93,15 +205,14 @@ class TestWebSocketManager:
         assert len(ws_manager._consumers) == consumer_count_before
 
     @pytest.mark.asyncio
-    async def test_disconnect_last_connection(self, ws_manager, mock_websocket):
+    async def test_disconnect_last_connection(
+        self, ws_manager, mock_websocket, deck_id
+    ):
         """Test disconnecting the last WebSocket for a deck."""
-        deck_id = uuid4()
-
         # Setup existing connection
-        mock_consumer = Mock()
-        mock_consumer.cancel = Mock()
+        consumer = asyncio.create_task(asyncio.sleep(3600))
         ws_manager.active_connections[deck_id] = {mock_websocket}
-        ws_manager._consumers[deck_id] = mock_consumer
+        ws_manager._consumers[deck_id] = consumer
 
         with patch(
             "app.api.websocket.metrics.record_websocket_connection"
@@ -111,17 +222,37 @@ class TestWebSocketManager:
         # Assertions
         assert deck_id not in ws_manager.active_connections
         assert deck_id not in ws_manager._consumers
-        mock_consumer.cancel.assert_called_once()
+        assert consumer.cancelled()
         mock_metrics.assert_called_once_with(-1)
 
     @pytest.mark.asyncio
-    async def test_disconnect_partial_connection(self, ws_manager):
-        """Test disconnecting one of multiple WebSockets for a deck."""
-        deck_id = uuid4()
+    async def test_connect_while_last_disconnect_unwinds(
+        self, ws_manager, mock_websocket, deck_id
+    ):
+        """Test a connect racing the last disconnect keeps the new connection."""
+        user_id = "test-user-123"
+        await ws_manager.connect(mock_websocket, deck_id, user_id)
+
+        second_ws = _make_websocket()
+
+        # disconnect suspends while the old consumer unwinds; connect runs then
+        await asyncio.gather(
+            ws_manager.disconnect(mock_websocket, deck_id),
+            ws_manager.connect(second_ws, deck_id, user_id),
+        )
+
+        assert ws_manager.active_connections[deck_id] == {second_ws}
+        assert not ws_manager._consumers[deck_id].done()
+        assert deck_id in ws_manager._deck_queues
+
+        await ws_manager.disconnect(second_ws, deck_id)
 
+    @pytest.mark.asyncio
+    async def test_disconnect_partial_connection(self, ws_manager, deck_id):
+        """Test disconnecting one of multiple WebSockets for a deck."""
         # Setup multiple connections
-        ws1 = Mock(spec=WebSocket)
-        ws2 = Mock(spec=WebSocket)
+        ws1 = _make_websocket()
+        ws2 = _make_websocket()
         mock_consumer = Mock()
         ws_manager.active_connections[deck_id] = {ws1, ws2}
         ws_manager._consumers[deck_id] = mock_consumer
@@ -137,10 +268,10 @@ class TestWebSocketManager:
         mock_consumer.cancel.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_disconnect_nonexistent_connection(self, ws_manager, mock_websocket):
+    async def test_disconnect_nonexistent_connection(
+        self, ws_manager, mock_websocket, deck_id
+    ):
         """Test disconnecting WebSocket that doesn't exist."""
-        deck_id = uuid4()
-
         # Should not raise exception
         with patch(
             "app.api.websocket.metrics.record_websocket_connection"
@@ -161,9 +292,7 @@ class TestWebSocketManager:
     @pytest.mark.asyncio
     async def test_send_personal_message_disconnected(self, ws_manager):
         """Test sending personal message to disconnected WebSocket."""
-        mock_websocket = Mock(spec=WebSocket)
-        mock_websocket.client_state = WebSocketState.DISCONNECTED
-        mock_websocket.send_text = AsyncMock()
+        mock_websocket = _make_websocket(WebSocketState.DISCONNECTED)
 
         await ws_manager.send_personal_message("test", mock_websocket)
 
@@ -171,19 +300,14 @@ class TestWebSocketManager:
         mock_websocket.send_text.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_broadcast_to_deck_success(self, ws_manager):
+    async def test_broadcast_to_deck_success(self, ws_manager, deck_id):
         """Test successful broadcasting to deck connections."""
-        deck_id = uuid4()
         message = "broadcast message"
 
         # Setup multiple connections
-        ws1 = Mock(spec=WebSocket)
-        ws1.client_state = WebSocketState.CONNECTED
-        ws1.send_text = AsyncMock()
+        ws1 = _make_websocket()
 
-        ws2 = Mock(spec=WebSocket)
-        ws2.client_state = WebSocketState.CONNECTED
-        ws2.send_text = AsyncMock()
+        ws2 = _make_websocket()
 
         ws_manager.active_connections[deck_id] = {ws1, ws2}
 
@@ -192,21 +316,20 @@ class TestWebSocketManager:
         # Assertions
         ws1.send_text.assert_called_once_with(message)
         ws2.send_text.assert_called_once_with(message)
+        # Every connection receives the very same object, not a copy
+        assert ws1.send_text.call_args.args[0] is message
+        assert ws2.send_text.call_args.args[0] is message
 
     @pytest.mark.asyncio
-    async def test_broadcast_to_deck_with_failed_connection(self, ws_manager):
+    async def test_broadcast_to_deck_with_failed_connection(self, ws_manager, deck_id):
         """Test broadcasting with one failed connection."""
-        deck_id = uuid4()
         message = "broadcast message"
 
         # Setup connections - one good, one bad
-        good_ws = Mock(spec=WebSocket)
-        good_ws.client_state = WebSocketState.CONNECTED
-        good_ws.send_text = AsyncMock()
+        good_ws = _make_websocket()
 
-        bad_ws = Mock(spec=WebSocket)
-        bad_ws.client_state = WebSocketState.CONNECTED
-        bad_ws.send_text = AsyncMock(side_effect=Exception("Connection failed"))
+        bad_ws = _make_websocket()
+        bad_ws.send_text.side_effect = Exception("Connection failed")
 
         ws_manager.active_connections[deck_id] = {good_ws, bad_ws}
 
@@ -219,18 +342,51 @@ class TestWebSocketManager:
         mock_disconnect.assert_called_once_with(bad_ws, deck_id)
 
     @pytest.mark.asyncio
-    async def test_broadcast_to_nonexistent_deck(self, ws_manager):
-        """Test broadcasting to deck with no connections."""
-        deck_id = uuid4()
+    async def test_broadcast_to_deck_skips_closed_connection(self, ws_manager, deck_id):
+        """Test broadcasting drops closed connections without sending."""
+        message = "broadcast message"
 
+        open_ws = _make_websocket()
+
+        closed_ws = _make_websocket(WebSocketState.DISCONNECTED)
+
+        ws_manager.active_connections[deck_id] = {open_ws, closed_ws}
+
+        with patch.object(ws_manager, "disconnect", AsyncMock()) as mock_disconnect:
+            await ws_manager.broadcast_to_deck(deck_id, message)
+
+        open_ws.send_text.assert_called_once_with(message)
+        closed_ws.send_text.assert_not_called()
+        mock_disconnect.assert_called_once_with(closed_ws, deck_id)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_to_deck_yields_between_batches(self, ws_manager, deck_id):
+        """Test large broadcasts yield to the event loop between batches."""
+        message = "broadcast message"
+
+        connections = set()
+        for _ in range(150):
+            ws = _make_websocket()
+            connections.add(ws)
+        ws_manager.active_connections[deck_id] = connections
+
+        with patch("app.api.websocket.asyncio.sleep", AsyncMock()) as mock_sleep:
+            await ws_manager.broadcast_to_deck(deck_id, message)
+
+        # 150 connections in batches of 50 -> two yields between three batches
+        assert mock_sleep.await_count == 2
+        for ws in connections:
+            ws.send_text.assert_called_once_with(message)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_to_nonexistent_deck(self, ws_manager, deck_id):
+        """Test broadcasting to deck with no connections."""
         # Should not raise exception
         await ws_manager.broadcast_to_deck(deck_id, "message")
 
     @pytest.mark.asyncio
-    async def test_consume_deck_events(self, ws_manager, mock_redis_pubsub):
-        """Test consuming deck events from Redis."""
-        deck_id = uuid4()
-
+    async def test_consume_deck_events(self, ws_manager, mock_websocket, deck_id):
+        """Test consuming queued deck events."""
         # Create mock events
         event1 = Event(
             event_type="SlideAdded",
@@ -248,73 +404,206 @@ class TestWebSocketManager:
             payload={},
         )
 
-        # Track calls to subscription method
-        call_deck_id = None
+        # Prime the deck queue as the dispatcher would
+        queue = asyncio.Queue()
+        for event in (event1, event2):
+            queue.put_nowait(event)
+        ws_manager._deck_queues[deck_id] = queue
+        ws_manager.active_connections[deck_id].add(mock_websocket)
 
-        # Mock Redis subscription - make the method itself an async generator
-        async def mock_subscribe(deck_id):
-            nonlocal call_deck_id
-            call_deck_id = deck_id
-            yield event1
-            yield event2
-            raise asyncio.CancelledError()  # Simulate cancellation
+        # Mock broadcast method
+        sent = asyncio.Event()
+        ws_manager.broadcast_to_deck = AsyncMock(side_effect=lambda *_: sent.set())
+
+        # Consume until the frame goes out, then stop it as disconnect() would
+        await _run_until(ws_manager._consume_deck_events(deck_id), sent)
+
+        # Events that arrive together are sent as one batched frame
+        assert ws_manager.broadcast_to_deck.call_args.args[0] == deck_id
+        (message,) = _decoded_calls(ws_manager.broadcast_to_deck, arg=1)
+        assert message["type"] == "event_batch"
+        assert [e["event_type"] for e in message["data"]] == [
+            "SlideAdded",
+            "DeckCompleted",
+        ]
+        assert [e["version"] for e in message["data"]] == [1, 2]
+        assert message["data"][0]["deck_id"] == str(deck_id)
+        assert message["data"][0]["timestamp"] == "2024-01-01T10:00:00"
 
-        mock_redis_pubsub.subscribe_to_deck_channel = mock_subscribe
+    @pytest.mark.asyncio
+    async def test_consume_deck_events_flushes_after_window(
+        self, ws_manager, mock_websocket, deck_id
+    ):
+        """Test events further apart than the batch window are sent separately."""
+        queue = asyncio.Queue()
+        ws_manager._deck_queues[deck_id] = queue
+        ws_manager.active_connections[deck_id].add(mock_websocket)
+        sent = asyncio.Event()
+
+        def count_frames(*_):
+            if ws_manager.broadcast_to_deck.call_count == 2:
+                sent.set()
+
+        ws_manager.broadcast_to_deck = AsyncMock(side_effect=count_frames)
+
+        async def feed():
+            for version in (1, 2):
+                queue.put_nowait(
+                    Event(
+                        event_type="SlideAdded",
+                        deck_id=deck_id,
+                        version=version,
+                        timestamp=datetime(2024, 1, 1, 10, 0, 0),
+                        payload={},
+                    )
+                )
+                await asyncio.sleep(0.05)
+
+        feeder = asyncio.create_task(feed())
+        await _run_until(ws_manager._consume_deck_events(deck_id), sent)
+        await feeder
+
+        messages = _decoded_calls(ws_manager.broadcast_to_deck, arg=1)
+        assert [m["type"] for m in messages] == ["event", "event"]
+        assert [m["data"]["version"] for m in messages] == [1, 2]
 
-        # Mock broadcast method
-        ws_manager.broadcast_to_deck = AsyncMock()
+    @pytest.mark.asyncio
+    async def test_consume_deck_events_no_subscribers(
+        self, ws_manager, mock_websocket, deck_id
+    ):
+        """Test events for a deck without connections are not serialised."""
+        events = [
+            Event(
+                event_type="SlideAdded",
+                deck_id=deck_id,
+                version=version,
+                timestamp=datetime(2024, 1, 1, 10, 0, 0),
+                payload={},
+            )
+            for version in (1, 2, 3)
+        ]
+        queue = asyncio.Queue()
+        for event in events[:2]:
+            queue.put_nowait(event)
+        ws_manager._deck_queues[deck_id] = queue
+        sent = asyncio.Event()
+        ws_manager.broadcast_to_deck = AsyncMock(side_effect=lambda *_: sent.set())
+
+        async def connect_then_publish():
+            while not queue.empty():
+                await asyncio.sleep(0)
+            # Outlast the batch window; the consumer's earlier timer fires first
+            await asyncio.sleep(EVENT_BATCH_WINDOW * 10)
+            ws_manager.active_connections[deck_id].add(mock_websocket)
+            queue.put_nowait(events[2])
+
+        with patch("app.api.websocket.orjson.dumps", wraps=orjson.dumps) as mock_dumps:
+            publisher = asyncio.create_task(connect_then_publish())
+            await _run_until(ws_manager._consume_deck_events(deck_id), sent)
+            await publisher
+
+        # Only the event published once a client was connected was encoded
+        mock_dumps.assert_called_once()
+        (message,) = _decoded_calls(ws_manager.broadcast_to_deck, arg=1)
+        assert message["data"]["version"] == 3
 
-        # Test event consumption
-        await ws_manager._consume_deck_events(deck_id)
+    @pytest.mark.asyncio
+    async def test_dispatch_deck_events_routes_by_deck(
+        self, ws_manager, mock_redis_pubsub
+    ):
+        """Test the shared subscription feeds only decks with a queue."""
+        watched_deck, other_deck = uuid4(), uuid4()
+        events = [
+            Event(
+                event_type="SlideAdded",
+                deck_id=deck_id,
+                version=1,
+                timestamp=datetime(2024, 1, 1, 10, 0, 0),
+                payload={},
+            )
+            for deck_id in (watched_deck, other_deck)
+        ]
 
-        # Assertions
-        assert call_deck_id == deck_id  # Verify correct deck_id was passed
-        assert ws_manager.broadcast_to_deck.call_count == 2
+        drained = asyncio.Event()
+        mock_redis_pubsub.subscribe_to_all_deck_channels = lambda: _live_stream(
+            events, drained
+        )
+        queue = asyncio.Queue()
+        ws_manager._deck_queues[watched_deck] = queue
 
-        # Check first broadcast call
-        first_call = ws_manager.broadcast_to_deck.call_args_list[0]
-        assert first_call[0][0] == deck_id
-        message1 = json.loads(first_call[0][1])
-        assert message1["type"] == "event"
-        assert message1["data"]["event_type"] == "SlideAdded"
-        assert message1["data"]["version"] == 1
+        await _run_until(ws_manager._dispatch_deck_events(), drained)
 
-        # Check second broadcast call
-        second_call = ws_manager.broadcast_to_deck.call_args_list[1]
-        message2 = json.loads(second_call[0][1])
-        assert message2["data"]["event_type"] == "DeckCompleted"
-        assert message2["data"]["version"] == 2
+        assert queue.qsize() == 1
+        assert queue.get_nowait() is events[0]
 
     @pytest.mark.asyncio
-    async def test_consume_deck_events_error(self, ws_manager, mock_redis_pubsub):
-        """Test event consumption with Redis error."""
-        deck_id = uuid4()
+    async def test_dispatch_deck_events_drops_oldest_when_full(
+        self, ws_manager, mock_redis_pubsub, deck_id
+    ):
+        """Test a full deck queue drops its oldest event to admit the newest."""
+        events = [
+            Event(
+                event_type="SlideAdded",
+                deck_id=deck_id,
+                version=version,
+                timestamp=datetime(2024, 1, 1, 10, 0, 0),
+                payload={},
+            )
+            for version in (1, 2, 3)
+        ]
 
-        # Mock Redis subscription to raise error
-        mock_redis_pubsub.subscribe_to_deck_channel.side_effect = Exception(
-            "Redis error"
+        drained = asyncio.Event()
+        mock_redis_pubsub.subscribe_to_all_deck_channels = lambda: _live_stream(
+            events, drained
         )
+        queue = asyncio.Queue(maxsize=2)
+        ws_manager._deck_queues[deck_id] = queue
 
-        # Should not raise exception
-        await ws_manager._consume_deck_events(deck_id)
+        with patch(
+            "app.api.websocket.metrics.record_websocket_event_dropped"
+        ) as mock_dropped:
+            await _run_until(ws_manager._dispatch_deck_events(), drained)
+
+        assert [queue.get_nowait().version for _ in range(queue.qsize())] == [2, 3]
+        mock_dropped.assert_called_once_with()
 
-        mock_redis_pubsub.subscribe_to_deck_channel.assert_called_once_with(deck_id)
+    @pytest.mark.asyncio
+    async def test_dispatch_deck_events_resubscribes_after_error(
+        self, ws_manager, mock_redis_pubsub, deck_id
+    ):
+        """Test a failed subscription is retried with growing backoff."""
+        event = Event(
+            event_type="SlideAdded",
+            deck_id=deck_id,
+            version=1,
+            timestamp=datetime(2024, 1, 1, 10, 0, 0),
+            payload={},
+        )
+        drained = asyncio.Event()
+        mock_redis_pubsub.subscribe_to_all_deck_channels = Mock(
+            side_effect=[
+                Exception("Redis error"),
+                Exception("Redis error"),
+                _live_stream([event], drained),
+            ]
+        )
+        queue = asyncio.Queue()
+        ws_manager._deck_queues[deck_id] = queue
+
+        with patch("app.api.websocket.asyncio.sleep", AsyncMock()) as mock_sleep:
+            await _run_until(ws_manager._dispatch_deck_events(), drained)
+
+        assert mock_redis_pubsub.subscribe_to_all_deck_channels.call_count == 3
+        assert [call.args[0] for call in mock_sleep.await_args_list] == [
+            DISPATCHER_RETRY_DELAY,
+            DISPATCHER_RETRY_DELAY * 2,
+        ]
+        assert queue.get_nowait() is event
 
 
 class TestWebSocketEndpoint:
     """Test cases for WebSocket endpoint functionality."""
 
-    @pytest.fixture
-    def mock_websocket(self):
-        """Create mock WebSocket."""
-        ws = Mock(spec=WebSocket)
-        ws.accept = AsyncMock()
-        ws.send_text = AsyncMock()
-        ws.receive_text = AsyncMock()
-        ws.close = AsyncMock()
-        ws.client_state = WebSocketState.CONNECTED
-        return ws
-
     @pytest.fixture
     def mock_deck_service(self):
         """Create mock deck service."""
@@ -333,10 +622,10 @@ class TestWebSocketEndpoint:
         return AsyncMock()
 
     @pytest.mark.asyncio
-    async def test_websocket_endpoint_authentication_failure(self, mock_websocket):
+    async def test_websocket_endpoint_authentication_failure(
+        self, mock_websocket, deck_id
+    ):
         """Test WebSocket endpoint with invalid token."""
-        deck_id = uuid4()
-
         with patch(
             "app.api.websocket.security_service.extract_user_id_from_token",
             side_effect=Exception("Invalid token"),
@@ -356,10 +645,9 @@ class TestWebSocketEndpoint:
 
     @pytest.mark.asyncio
     async def test_websocket_endpoint_deck_not_found(
-        self, mock_websocket, mock_deck_service
+        self, mock_websocket, mock_deck_service, deck_id
     ):
         """Test WebSocket endpoint when deck not found."""
-        deck_id = uuid4()
         mock_deck_service.get_deck.side_effect = DeckNotFoundException("Deck not found")
 
         with patch(
@@ -383,10 +671,9 @@ class TestWebSocketEndpoint:
 
     @pytest.mark.asyncio
     async def test_websocket_endpoint_unauthorized_access(
-        self, mock_websocket, mock_deck_service
+        self, mock_websocket, mock_deck_service, deck_id
     ):
         """Test WebSocket endpoint when user unauthorized."""
-        deck_id = uuid4()
         mock_deck_service.get_deck.side_effect = UnauthorizedAccessException(
             "Access denied"
         )
@@ -414,24 +701,8 @@ class TestEventReplay:
     """Test cases for event replay functionality."""
 
     @pytest.fixture
-    def mock_websocket(self):
-        """Create mock WebSocket."""
-        ws = Mock(spec=WebSocket)
-        ws.send_text = AsyncMock()
-        ws.client_state = WebSocketState.CONNECTED
-        return ws
-
-    @pytest.fixture
-    def mock_connection_manager(self, mock_websocket):
-        """Create mock connection manager."""
-        manager = AsyncMock()
-        manager.send_personal_message = AsyncMock()
-        return manager
-
-    @pytest.fixture
-    def sample_events(self):
+    def sample_events(self, deck_id):
         """Create sample deck events for replay."""
-        deck_id = uuid4()
         return [
             DeckEvent(
                 id=1,
@@ -452,98 +723,139 @@ class TestEventReplay:
         ]
 
     @pytest.mark.asyncio
-    async def test_send_event_replay_success(self, mock_websocket, sample_events):
+    async def test_send_event_replay_success(
+        self, mock_websocket, mock_connection_manager, sample_events, deck_id
+    ):
         """Test successful event replay."""
-        deck_id = uuid4()
         user_id = "test-user-123"
         from_version = 0
 
         mock_deck_service = AsyncMock()
         mock_deck_service.get_deck_events.return_value = sample_events
 
-        mock_connection_manager = AsyncMock()
-
-        with patch("app.api.websocket.connection_manager", mock_connection_manager):
-            await _send_event_replay(
-                mock_websocket, mock_deck_service, deck_id, user_id, from_version
-            )
+        await _send_event_replay(
+            mock_websocket, mock_deck_service, deck_id, user_id, from_version
+        )
 
         # Assertions
         mock_deck_service.get_deck_events.assert_called_once_with(
             deck_id, user_id, from_version
         )
 
-        # Should send replay messages + complete message
-        assert mock_connection_manager.send_personal_message.call_count == 3
+        # Should send one batched replay message + complete message
+        replay_message, complete_message = _decoded_calls(
+            mock_connection_manager.send_personal_message
+        )
 
         # Check replay messages
-        calls = mock_connection_manager.send_personal_message.call_args_list
-
-        # First event replay
-        first_message = json.loads(calls[0][0][0])
-        assert first_message["type"] == "replay"
-        assert first_message["data"]["event_type"] == "DeckStarted"
-        assert first_message["data"]["version"] == 1
-
-        # Second event replay
-        second_message = json.loads(calls[1][0][0])
-        assert second_message["type"] == "replay"
-        assert second_message["data"]["event_type"] == "SlideAdded"
-        assert second_message["data"]["version"] == 2
+        assert replay_message["type"] == "replay_batch"
+        assert [e["event_type"] for e in replay_message["data"]] == [
+            "DeckStarted",
+            "SlideAdded",
+        ]
+        assert [e["version"] for e in replay_message["data"]] == [1, 2]
 
         # Complete message
-        complete_message = json.loads(calls[2][0][0])
         assert complete_message["type"] == "replay_complete"
         assert complete_message["data"]["replayed_events"] == 2
 
     @pytest.mark.asyncio
-    async def test_send_event_replay_empty_events(self, mock_websocket):
+    async def test_send_event_replay_reuses_encoded_events(
+        self, mock_websocket, mock_connection_manager, sample_events, deck_id
+    ):
+        """Test replaying the same events again skips re-encoding them."""
+        mock_deck_service = AsyncMock()
+        mock_deck_service.get_deck_events.return_value = sample_events
+
+        with patch(
+            "app.api.websocket._replay_data", wraps=_replay_data
+        ) as mock_replay_data:
+            for _ in range(3):
+                await _send_event_replay(
+                    mock_websocket, mock_deck_service, deck_id, "test-user-123", 0
+                )
+
+        # Each stored event is encoded once, however many clients replay it
+        assert mock_replay_data.call_count == len(sample_events)
+        messages = _decoded_calls(mock_connection_manager.send_personal_message)
+        assert messages[0] == messages[2] == messages[4]
+        assert [e["version"] for e in messages[4]["data"]] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_send_event_replay_batches_large_history(
+        self, mock_websocket, mock_connection_manager, deck_id
+    ):
+        """Test long replays are split into frames of REPLAY_BATCH_SIZE events."""
+        events = [
+            DeckEvent(
+                id=version,
+                deck_id=deck_id,
+                version=version,
+                event_type="SlideAdded",
+                payload={},
+                created_at=datetime(2024, 1, 1, 10, 0, 0),
+            )
+            for version in range(1, 102)
+        ]
+
+        mock_deck_service = AsyncMock()
+        mock_deck_service.get_deck_events.return_value = events
+
+        await _send_event_replay(
+            mock_websocket, mock_deck_service, deck_id, "test-user-123", 0
+        )
+
+        messages = _decoded_calls(mock_connection_manager.send_personal_message)
+        # 101 events -> 50 + 50 batched, the last one as a plain replay frame
+        assert [m["type"] for m in messages] == [
+            "replay_batch",
+            "replay_batch",
+            "replay",
+            "replay_complete",
+        ]
+        assert [len(m["data"]) for m in messages[:2]] == [50, 50]
+        assert messages[2]["data"]["version"] == 101
+        assert messages[3]["data"]["replayed_events"] == 101
+
+    @pytest.mark.asyncio
+    async def test_send_event_replay_empty_events(
+        self, mock_websocket, mock_connection_manager, deck_id
+    ):
         """Test event replay with no events."""
-        deck_id = uuid4()
         user_id = "test-user-123"
         from_version = 0
 
         mock_deck_service = AsyncMock()
         mock_deck_service.get_deck_events.return_value = []
 
-        mock_connection_manager = AsyncMock()
-
-        with patch("app.api.websocket.connection_manager", mock_connection_manager):
-            await _send_event_replay(
-                mock_websocket, mock_deck_service, deck_id, user_id, from_version
-            )
+        await _send_event_replay(
+            mock_websocket, mock_deck_service, deck_id, user_id, from_version
+        )
 
         # Should only send complete message
-        assert mock_connection_manager.send_personal_message.call_count == 1
-
-        complete_message = json.loads(
-            mock_connection_manager.send_personal_message.call_args[0][0]
+        (complete_message,) = _decoded_calls(
+            mock_connection_manager.send_personal_message
         )
         assert complete_message["type"] == "replay_complete"
         assert complete_message["data"]["replayed_events"] == 0
 
     @pytest.mark.asyncio
-    async def test_send_event_replay_service_error(self, mock_websocket):
+    async def test_send_event_replay_service_error(
+        self, mock_websocket, mock_connection_manager, deck_id
+    ):
         """Test event replay with service error."""
-        deck_id = uuid4()
         user_id = "test-user-123"
         from_version = 0
 
         mock_deck_service = AsyncMock()
         mock_deck_service.get_deck_events.side_effect = Exception("Service error")
 
-        mock_connection_manager = AsyncMock()
-
-        with patch("app.api.websocket.connection_manager", mock_connection_manager):
-            await _send_event_replay(
-                mock_websocket, mock_deck_service, deck_id, user_id, from_version
-            )
+        await _send_event_replay(
+            mock_websocket, mock_deck_service, deck_id, user_id, from_version
+        )
 
         # Should send error message
-        mock_connection_manager.send_personal_message.assert_called_once()
-        error_message = json.loads(
-            mock_connection_manager.send_personal_message.call_args[0][0]
-        )
+        (error_message,) = _decoded_calls(mock_connection_manager.send_personal_message)
         assert error_message["type"] == "error"
         assert "Failed to replay events" in error_message["data"]["message"]
 
@@ -551,15 +863,11 @@ class TestEventReplay:
 class TestClientMessageHandling:
     """Test cases for client message handling."""
 
-    @pytest.fixture
-    def mock_websocket(self):
-        """Create mock WebSocket."""
-        return Mock(spec=WebSocket)
-
     @pytest.mark.asyncio
-    async def test_handle_slide_update_message(self, mock_websocket):
+    async def test_handle_slide_update_message(
+        self, mock_websocket, mock_connection_manager, deck_id
+    ):
         """Test handling slide update message."""
-        deck_id = uuid4()
         user_id = "test-user-123"
         slide_id = uuid4()
 
@@ -575,34 +883,32 @@ class TestClientMessageHandling:
 
         mock_deck_service = AsyncMock()
         mock_slide_service = AsyncMock()
-        mock_connection_manager = AsyncMock()
 
-        with patch("app.api.websocket.connection_manager", mock_connection_manager):
-            await _handle_client_message(
-                mock_websocket,
-                message_data,
-                deck_id,
-                user_id,
-                mock_deck_service,
-                mock_slide_service,
-            )
+        await _handle_client_message(
+            mock_websocket,
+            message_data,
+            deck_id,
+            user_id,
+            mock_deck_service,
+            mock_slide_service,
+        )
 
         # Assertions
         mock_slide_service.update_slide.assert_called_once_with(
             slide_id, "Make this slide more engaging", user_id
         )
 
-        mock_connection_manager.send_personal_message.assert_called_once()
-        response_message = json.loads(
-            mock_connection_manager.send_personal_message.call_args[0][0]
+        (response_message,) = _decoded_calls(
+            mock_connection_manager.send_personal_message
         )
         assert response_message["type"] == "slide_update_queued"
         assert response_message["data"]["slide_id"] == str(slide_id)
 
     @pytest.mark.asyncio
-    async def test_handle_add_slide_message(self, mock_websocket):
+    async def test_handle_add_slide_message(
+        self, mock_websocket, mock_connection_manager, deck_id
+    ):
         """Test handling add slide message."""
-        deck_id = uuid4()
         user_id = "test-user-123"
 
         message_data = json.dumps(
@@ -614,46 +920,40 @@ class TestClientMessageHandling:
 
         mock_deck_service = AsyncMock()
         mock_slide_service = AsyncMock()
-        mock_connection_manager = AsyncMock()
 
-        with patch("app.api.websocket.connection_manager", mock_connection_manager):
-            await _handle_client_message(
-                mock_websocket,
-                message_data,
-                deck_id,
-                user_id,
-                mock_deck_service,
-                mock_slide_service,
-            )
+        await _handle_client_message(
+            mock_websocket,
+            message_data,
+            deck_id,
+            user_id,
+            mock_deck_service,
+            mock_slide_service,
+        )
 
         # Assertions
         mock_slide_service.add_slide.assert_called_once_with(
             deck_id, 3, "Add a slide about market analysis", user_id
         )
 
-        mock_connection_manager.send_personal_message.assert_called_once()
-        response_message = json.loads(
-            mock_connection_manager.send_personal_message.call_args[0][0]
+        (response_message,) = _decoded_calls(
+            mock_connection_manager.send_personal_message
         )
         assert response_message["type"] == "slide_add_queued"
         assert response_message["data"]["position"] == 3
 
     @pytest.mark.asyncio
-    async def test_handle_ping_message(self, mock_websocket):
+    async def test_handle_ping_message(
+        self, mock_websocket, mock_connection_manager, deck_id
+    ):
         """Test handling ping message."""
-        deck_id = uuid4()
         user_id = "test-user-123"
 
         message_data = json.dumps({"type": "ping", "data": {}})
 
         mock_deck_service = AsyncMock()
         mock_slide_service = AsyncMock()
-        mock_connection_manager = AsyncMock()
 
-        with (
-            patch("app.api.websocket.connection_manager", mock_connection_manager),
-            patch("asyncio.get_event_loop") as mock_loop,
-        ):
+        with patch("app.api.websocket.asyncio.get_running_loop") as mock_loop:
             mock_loop.return_value.time.return_value = 123456.789
 
             await _handle_client_message(
@@ -666,77 +966,69 @@ class TestClientMessageHandling:
             )
 
         # Assertions
-        mock_connection_manager.send_personal_message.assert_called_once()
-        response_message = json.loads(
-            mock_connection_manager.send_personal_message.call_args[0][0]
+        (response_message,) = _decoded_calls(
+            mock_connection_manager.send_personal_message
         )
         assert response_message["type"] == "pong"
         assert response_message["data"]["timestamp"] == 123456.789
 
     @pytest.mark.asyncio
-    async def test_handle_unknown_message_type(self, mock_websocket):
+    async def test_handle_unknown_message_type(
+        self, mock_websocket, mock_connection_manager, deck_id
+    ):
         """Test handling unknown message type."""
-        deck_id = uuid4()
         user_id = "test-user-123"
 
         message_data = json.dumps({"type": "unknown_type", "data": {}})
 
         mock_deck_service = AsyncMock()
         mock_slide_service = AsyncMock()
-        mock_connection_manager = AsyncMock()
 
-        with patch("app.api.websocket.connection_manager", mock_connection_manager):
-            await _handle_client_message(
-                mock_websocket,
-                message_data,
-                deck_id,
-                user_id,
-                mock_deck_service,
-                mock_slide_service,
-            )
+        await _handle_client_message(
+            mock_websocket,
+            message_data,
+            deck_id,
+            user_id,
+            mock_deck_service,
+            mock_slide_service,
+        )
 
         # Should send error message
-        mock_connection_manager.send_personal_message.assert_called_once()
-        error_message = json.loads(
-            mock_connection_manager.send_personal_message.call_args[0][0]
-        )
+        (error_message,) = _decoded_calls(mock_connection_manager.send_personal_message)
         assert error_message["type"] == "error"
         assert "Unknown message type" in error_message["data"]["message"]
 
     @pytest.mark.asyncio
-    async def test_handle_invalid_json_message(self, mock_websocket):
+    async def test_handle_invalid_json_message(
+        self, mock_websocket, mock_connection_manager, deck_id
+    ):
         """Test handling invalid JSON message."""
-        deck_id = uuid4()
         user_id = "test-user-123"
 
         message_data = "invalid json"
 
         mock_deck_service = AsyncMock()
         mock_slide_service = AsyncMock()
-        mock_connection_manager = AsyncMock()
 
-        with patch("app.api.websocket.connection_manager", mock_connection_manager):
-            await _handle_client_message(
-                mock_websocket,
-                message_data,
-                deck_id,
-                user_id,
-                mock_deck_service,
-                mock_slide_service,
-            )
+        await _handle_client_message(
+            mock_websocket,
+            message_data,
+            deck_id,
+            user_id,
+            mock_deck_service,
+            mock_slide_service,
+        )
 
         # Should send error message
-        mock_connection_manager.send_personal_message.assert_called_once()
-        error_message = json.loads(
-            mock_connection_manager.send_personal_message.call_args[0][0]
-        )
+        (error_message,) = _decoded_calls(mock_connection_manager.send_personal_message)
         assert error_message["type"] == "error"
         assert "Invalid JSON message" in error_message["data"]["message"]
 
     @pytest.mark.asyncio
-    async def test_handle_slide_update_service_error(self, mock_websocket):
+    async def test_handle_slide_update_service_error(
+        self, mock_websocket, mock_connection_manager, deck_id
+    ):
         """Test handling slide update with service error."""
-        deck_id = uuid4()
         user_id = "test-user-123"
         slide_id = uuid4()
 
@@ -750,22 +1042,17 @@ class TestClientMessageHandling:
         mock_deck_service = AsyncMock()
         mock_slide_service = AsyncMock()
         mock_slide_service.update_slide.side_effect = Exception("Service error")
-        mock_connection_manager = AsyncMock()
 
-        with patch("app.api.websocket.connection_manager", mock_connection_manager):
-            await _handle_client_message(
-                mock_websocket,
-                message_data,
-                deck_id,
-                user_id,
-                mock_deck_service,
-                mock_slide_service,
-            )
+        await _handle_client_message(
+            mock_websocket,
+            message_data,
+            deck_id,
+            user_id,
+            mock_deck_service,
+            mock_slide_service,
+        )
 
         # Should send error message
-        mock_connection_manager.send_personal_message.assert_called_once()
-        error_message = json.loads(
-            mock_connection_manager.send_personal_message.call_args[0][0]
-        )
+        (error_message,) = _decoded_calls(mock_connection_manager.send_personal_message)
         assert error_message["type"] == "error"
         assert "Failed to update slide" in error_message["data"]["message"]
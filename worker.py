@@ -2,7 +2,9 @@
 """
 ARQ Worker entry point for Presto-Deck background tasks.
 
-This is a convenience wrapper around the ARQ CLI.
+This is a convenience wrapper around the ARQ CLI. The CLI runs in this
+interpreter; a separate `uv run arq` / `python -m arq` process is only
+launched when arq cannot be imported here.
 The actual worker logic is in app.infrastructure.messaging.arq_config.WorkerSettings
 
 Usage:
@@ -12,7 +14,10 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
+import shlex
 import shutil
 import subprocess
 import sys
@@ -20,18 +25,40 @@ from typing import List, Tuple
 
 
 ARQ_SETTINGS_PATH = "app.infrastructure.messaging.arq_config.WorkerSettings"
+ARQ_SETTINGS_FILE = os.path.join("app", "infrastructure", "messaging", "arq_config.py")
+
+# (실행 파일, 고정 인자, 설명) — 시도할 우선순위 순
+_RUNNERS: Tuple[Tuple[str, Tuple[str, ...], str], ...] = (
+    ("uv", ("run", "arq", ARQ_SETTINGS_PATH), "uv run (가상환경 일관 실행)"),
+    (
+        sys.executable,
+        ("-m", "arq", ARQ_SETTINGS_PATH),
+        "python -m arq (직접 모듈 실행)",
+    ),
+    ("arq", (ARQ_SETTINGS_PATH,), "arq (PATH 상의 실행파일)"),
+)
+
+
+def _write_lines(*lines: str) -> None:
+    # 여러 줄을 한 번의 write로 출력 (print 반복 대신)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _print_header() -> None:
-    print("🚀 Starting Presto-Deck ARQ Worker...")
-    print(f"📍 Settings: {ARQ_SETTINGS_PATH}")
-    print(f"🐍 Python : {sys.executable} ({sys.version.split()[0]})")
-    print()
+    _write_lines(
+        "🚀 Starting Presto-Deck ARQ Worker...",
+        f"📍 Settings: {ARQ_SETTINGS_PATH}",
+        f"🐍 Python : {sys.executable} ({sys.version.split()[0]})",
+        "",
+    )
 
 
 def _ensure_project_root() -> None:
-    if not os.path.exists("app"):
-        print("❌ Error: Must run from the project root (missing 'app/' directory).")
+    # 설정 모듈 파일 하나만 stat: 디렉터리 이름만 같은 경우도 걸러낸다
+    if not os.path.isfile(ARQ_SETTINGS_FILE):
+        print(
+            f"❌ Error: Must run from the project root (missing '{ARQ_SETTINGS_FILE}')."
+        )
         sys.exit(1)
 
 
@@ -53,72 +80,125 @@ def _quick_import_check() -> None:
 
 def _build_candidate_cmds(extra_argv: List[str]) -> List[Tuple[List[str], str]]:
     """
-    시도할 실행 커맨드 후보를 우선순위대로 반환.
+    실행 가능한 커맨드 후보를 우선순위대로 반환 (실행 파일이 없는 후보는 제외).
     각 후보 옆에 사용자에게 보여줄 설명 문자열을 함께 둔다.
     """
-    arq_target = ARQ_SETTINGS_PATH
-    return [
-        (["uv", "run", "arq", arq_target, *extra_argv], "uv run (가상환경 일관 실행)"),
-        (
-            [sys.executable, "-m", "arq", arq_target, *extra_argv],
-            "python -m arq (직접 모듈 실행)",
-        ),
-        (["arq", arq_target, *extra_argv], "arq (PATH 상의 실행파일)"),
-    ]
+    candidates = []
+    for name, prefix, label in _RUNNERS:
+        exe = _resolve_exe(name)
+        if exe is not None:
+            # 절대 경로로 실행해 커널의 PATH 재탐색을 생략
+            candidates.append(([exe, *prefix, *extra_argv], label))
+    return candidates
+
+
+@functools.cache
+def _resolve_exe(name: str) -> str | None:
+    """
+    실행 파일의 절대 경로를 찾는다 (없으면 None).
+    PATH 탐색은 이름당 한 번만 수행하고 결과를 재사용한다.
+    """
+    if os.path.sep in name or name.endswith(".exe"):
+        return name if os.path.exists(name) else None
+    return shutil.which(name)
 
 
 def _print_cmd(cmd: List[str], label: str) -> None:
-    print("=" * 72)
-    print(f"🔧 Attempt via: {label}")
-    print(f"▶️  {' '.join(cmd)}")
-    print("=" * 72)
+    _write_lines(
+        "=" * 72,
+        f"🔧 Attempt via: {label}",
+        f"▶️  {shlex.join(cmd)}",
+        "=" * 72,
+    )
+    # 워커 출력과 섞이지 않도록 실행 전에 비운다
+    sys.stdout.flush()
 
 
-def _env_with_pythonpath() -> dict:
-    env = os.environ.copy()
-    # 프로젝트 루트 import 보장
-    env["PYTHONPATH"] = env.get("PYTHONPATH", ".") or "."
-    return env
+def _exit_with(rc: int) -> None:
+    if rc == 0:
+        print("✅ Worker exited cleanly.")
+    else:
+        print(f"⚠️  Worker exited with code {rc}.")
+
+    # 종료 코드 그대로 전파 (CI/CD에서 유용)
+    sys.exit(rc)
+
+
+def _use_uvloop() -> None:
+    """
+    ARQ Worker는 asyncio.get_event_loop()로 루프를 가져오므로 uvloop 루프를
+    현재 루프로 지정해 둔다 (Windows 등 uvloop이 없으면 기본 루프 사용).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop(uvloop.new_event_loop())
+
+
+def _run_in_process(extra_argv: List[str]) -> None:
+    """
+    현재 인터프리터에서 ARQ CLI를 직접 실행 (하위 프로세스 생성 없음).
+    arq를 import할 수 없으면 그대로 반환하여 subprocess 후보로 폴백한다.
+    """
+    try:
+        from arq.cli import cli
+    except ImportError:
+        return
+
+    # CLI가 어차피 같은 모듈을 import하므로 추가 비용 없이 친절한 오류 메시지를 얻는다
+    _quick_import_check()
+
+    args = [ARQ_SETTINGS_PATH, *extra_argv]
+    _print_cmd(["arq", *args], "in-process arq (현재 인터프리터)")
+
+    _use_uvloop()
+
+    try:
+        # Click은 종료 시 항상 SystemExit을 던진다
+        cli.main(args=args, prog_name="arq")
+    except SystemExit as e:
+        rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        _exit_with(rc)
+    except KeyboardInterrupt:
+        print("\n👋 Worker interrupted by user")
+        sys.exit(130)  # 128 + SIGINT
+
+
+def _ensure_pythonpath() -> None:
+    # 프로젝트 루트 import 보장. 곧 exec/종료할 프로세스이므로 환경을 복사하지 않고
+    # 런처 자신의 환경을 직접 수정해 하위 프로세스가 그대로 상속하게 한다
+    if not os.environ.get("PYTHONPATH"):
+        os.environ["PYTHONPATH"] = "."
 
 
 def main() -> None:
     _print_header()
     _ensure_project_root()
-    _quick_import_check()
 
     # 추가 인자(예: --watch, --burst 등)를 그대로 ARQ CLI로 전달
     extra_argv = sys.argv[1:]
 
-    env = _env_with_pythonpath()
+    # 이미 로드된 인터프리터로 실행 (arq가 없을 때만 아래 후보로 폴백)
+    _run_in_process(extra_argv)
+
+    _ensure_pythonpath()
     candidates = _build_candidate_cmds(extra_argv)
 
     last_err: Exception | None = None
     for cmd, label in candidates:
-        # 실행 파일 존재 여부(첫 토큰) 빠른 확인
-        exe = cmd[0]
-        if os.path.sep in exe or exe.endswith(".exe"):
-            exists = os.path.exists(exe)
-        else:
-            exists = shutil.which(exe) is not None
-
-        if not exists:
-            # 다음 후보로
-            continue
-
         _print_cmd(cmd, label)
 
         try:
-            # check=False 로 실행해서 returncode를 직접 전달
-            proc = subprocess.run(cmd, env=env)
-            rc = proc.returncode
-
-            if rc == 0:
-                print("✅ Worker exited cleanly.")
-            else:
-                print(f"⚠️  Worker exited with code {rc}.")
+            if os.name == "posix":
+                # 현재 프로세스를 워커로 교체: 부모 프로세스가 남지 않고
+                # SIGINT/SIGTERM이 워커로 직접 전달된다
+                os.execv(cmd[0], cmd)
 
-            # 종료 코드 그대로 전파 (CI/CD에서 유용)
-            sys.exit(rc)
+            # Windows의 exec는 부모를 먼저 종료시켜 종료 코드를 잃으므로 subprocess 유지
+            # check=False 로 실행해서 returncode를 직접 전달
+            proc = subprocess.run(cmd)
+            _exit_with(proc.returncode)
 
         except FileNotFoundError as e:
             last_err = e
@@ -134,28 +214,23 @@ def main() -> None:
             continue
 
     # 여기까지 왔다면 모든 후보 실패
-    print("❌ Failed to start ARQ worker: no viable runner found.")
+    lines = ["❌ Failed to start ARQ worker: no viable runner found."]
     if last_err:
-        print(f"   Last error: {last_err}")
-
-    print("\n🔎 Troubleshooting checklist")
-    print("  1) 가상환경/의존성 설치:   uv sync")
-    print("  2) CLI 설치 여부 확인:     which uv / which arq")
-    print(
-        "  3) 파이썬 모듈 실행:        python -m arq app.infrastructure.messaging.arq_config.WorkerSettings"
-    )
-    print("  4) PYTHONPATH 확인:        export PYTHONPATH=.")
-    print(
-        "  5) Import 오류 상세:       python -c \"import app.infrastructure.messaging.arq_config; print('ok')\""
+        lines.append(f"   Last error: {last_err}")
+
+    _write_lines(
+        *lines,
+        "",
+        "🔎 Troubleshooting checklist",
+        "  1) 가상환경/의존성 설치:   uv sync",
+        "  2) CLI 설치 여부 확인:     which uv / which arq",
+        "  3) 파이썬 모듈 실행:        python -m arq app.infrastructure.messaging.arq_config.WorkerSettings",
+        "  4) PYTHONPATH 확인:        export PYTHONPATH=.",
+        "  5) Import 오류 상세:       python -c \"import app.infrastructure.messaging.arq_config; print('ok')\"",
     )
     sys.exit(1)
 
 
 if __name__ == "__main__":
-    # 권장: 3.11+
-    min_py = (3, 11)
-    if sys.version_info < min_py:
-        print(f"❌ Error: Python {min_py[0]}.{min_py[1]}+ is required")
-        sys.exit(1)
-
+    # 파이썬 버전은 pyproject.toml의 requires-python으로 설치 시점에 강제된다
     main()